@@ -85,7 +85,11 @@ from ocs_ci.ocs.monitoring import (
     validate_pvc_created_and_bound_on_monitoring_pods,
     validate_pvc_are_mounted_on_monitoring_pods,
 )
-from ocs_ci.ocs.node import get_worker_nodes, verify_all_nodes_created
+from ocs_ci.ocs.node import (
+    get_worker_nodes,
+    invalidate_node_view,
+    verify_all_nodes_created,
+)
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources import machineconfig
 from ocs_ci.ocs.resources import packagemanifest
@@ -949,6 +953,7 @@ class Deployment(object):
 
             for cmd in label_cmds:
                 _ocp.exec_oc_cmd(command=cmd)
+            invalidate_node_view()
 
         workers_to_taint = " ".join(distributed_worker_nodes[:to_taint])
         if workers_to_taint:
@@ -156,11 +156,13 @@ class MultiClusterConfig:
         self._single_cluster_init_cluster_configs()
 
     def __getattr__(self, attr):
-        with config_lock:
-            config_index = getattr(
-                self.thread_local_data, "config_index", self.cur_index
-            )
-            return getattr(self.clusters[config_index], attr)
+        # Lock-free read path: the index is read from thread local data or
+        # from cur_index (both single reference reads) and the clusters list
+        # is replaced (copy-on-write) under config_lock instead of being
+        # modified in place, so only the context switches and the changes of
+        # the clusters take the lock.
+        config_index = getattr(self.thread_local_data, "config_index", self.cur_index)
+        return getattr(self.clusters[config_index], attr)
 
     @property
     def cluster_ctx(self):
@@ -195,15 +197,18 @@ class MultiClusterConfig:
         return self.ENV_DATA.get("default_cluster_context_index", 0)
 
     def _single_cluster_init_cluster_configs(self):
-        self.clusters.insert(0, Config())
+        with config_lock:
+            self.clusters = [Config()] + self.clusters
 
     def init_cluster_configs(self):
         if self.nclusters > 1:
             # reset if any single cluster object is present from init
-            self.clusters.clear()
+            clusters = list()
             for i in range(self.nclusters):
-                self.clusters.insert(i, Config())
-                self.clusters[i].MULTICLUSTER["multicluster_index"] = i
+                clusters.insert(i, Config())
+                clusters[i].MULTICLUSTER["multicluster_index"] = i
+            with config_lock:
+                self.clusters = clusters
             self.single_cluster_default = False
 
     def update(self, user_dict):
@@ -213,19 +218,22 @@ class MultiClusterConfig:
         self.cluster_ctx.reset()
 
     def reset_ctx(self):
-        self.cur_index = 0
+        with config_lock:
+            self.cur_index = 0
 
     def switch_ctx(self, index=0):
-        self.cur_index = index
-        if hasattr(self.thread_local_data, "config_index"):
-            thread_id = get_ident()
-            logger.info(f"Thread ID: {thread_id} is using config index: {index}")
-            config.thread_local_data.config_index = index
+        with config_lock:
+            self.cur_index = index
+            if hasattr(self.thread_local_data, "config_index"):
+                thread_id = get_ident()
+                logger.info(f"Thread ID: {thread_id} is using config index: {index}")
+                config.thread_local_data.config_index = index
         # Log the switch after changing the current index
         logger.info(f"Switched to cluster: {self.current_cluster_name()}")
 
     def switch_acm_ctx(self):
-        self.cur_index = self.get_active_acm_index()
+        with config_lock:
+            self.cur_index = self.get_active_acm_index()
 
     def get_active_acm_index(self):
         """
@@ -559,8 +567,11 @@ class MultiClusterConfig:
             new_config (Config): The new configuration to insert
 
         """
-        self.clusters.insert(index, new_config)
-        self.nclusters += 1
+        with config_lock:
+            clusters = list(self.clusters)
+            clusters.insert(index, new_config)
+            self.clusters = clusters
+            self.nclusters += 1
 
     def remove_cluster(self, index):
         """
@@ -569,8 +580,11 @@ class MultiClusterConfig:
         Args:
             index (int): The index of the cluster to remove
         """
-        self.clusters.pop(index)
-        self.nclusters -= 1
+        with config_lock:
+            clusters = list(self.clusters)
+            clusters.pop(index)
+            self.clusters = clusters
+            self.nclusters -= 1
 
     def remove_cluster_by_name(self, cluster_name):
         """
@@ -619,7 +633,7 @@ class ConfigSafeThread(Thread):
         try:
             super(ConfigSafeThread, self).run()
         finally:
-            if hasattr(self.thread_local_data, "config_index"):
+            if hasattr(config.thread_local_data, "config_index"):
                 del config.thread_local_data.config_index
 
 
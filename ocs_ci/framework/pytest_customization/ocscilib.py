@@ -842,6 +842,8 @@ def pytest_runtest_makereport(item, call):
                     output_file=True,
                     skip_after_max_fail=True,
                     timeout=timeout,
+                    since_time=call.start,
+                    until_time=call.stop,
                 )
         except Exception:
             log.exception("Failed to collect OCS logs")
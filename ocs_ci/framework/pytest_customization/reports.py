@@ -5,6 +5,7 @@ from py.xml import html
 from ocs_ci.utility.utils import (
     dump_config_to_file,
     email_reports,
+    get_oc_plugin_cache_stats,
     save_reports,
     ocsci_log_path,
 )
@@ -117,6 +118,13 @@ def pytest_sessionfinish(session, exitstatus):
             f"Failed to save Test Time report to logs directory with exception. {e}"
         )
 
+    oc_plugin_stats = get_oc_plugin_cache_stats()
+    log.info(
+        f"oc plugin discovery: {oc_plugin_stats['lookups']} lookups, "
+        f"{oc_plugin_stats['forks']} forks of 'oc plugin list', "
+        f"{oc_plugin_stats['forks_saved']} forks saved by cache"
+    )
+
     for i in range(ocsci_config.nclusters):
         ocsci_config.switch_ctx(i)
         if not (
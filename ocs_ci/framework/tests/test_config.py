@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import threading
+
 from pytest import fixture
 
 from ocs_ci import framework
@@ -100,6 +102,38 @@ class TestConfig(object):
             )
         framework.config.reset_ctx()
 
+    def test_lookup_does_not_take_config_lock(self):
+        lookups = []
+        with framework.config_lock:
+            thread = threading.Thread(
+                target=lambda: lookups.append(framework.config.ENV_DATA)
+            )
+            thread.start()
+            thread.join(timeout=10)
+            assert not thread.is_alive()
+        assert lookups == [framework.config.ENV_DATA]
+
+    def test_lookup_in_config_safe_thread(self):
+        framework.config.nclusters = 2
+        framework.config.init_cluster_configs()
+        framework.config.switch_ctx(1)
+        framework.config.update(dict(ENV_DATA=dict(cluster_name="cluster2")))
+        framework.config.switch_ctx(0)
+        framework.config.update(dict(ENV_DATA=dict(cluster_name="cluster1")))
+        names = []
+        thread = framework.ConfigSafeThread(
+            1, target=lambda: names.append(framework.config.ENV_DATA["cluster_name"])
+        )
+        thread.start()
+        thread.join()
+        assert names == ["cluster2"]
+        assert framework.config.ENV_DATA["cluster_name"] == "cluster1"
+        framework.config.insert_cluster_config(2, framework.Config())
+        assert framework.config.nclusters == 3
+        framework.config.remove_cluster(2)
+        assert framework.config.nclusters == 2
+        framework.config.reset_ctx()
+
 
 class TestMergeDict:
     def test_merge_dict(self):
@@ -25,6 +25,7 @@ from ocs_ci.ocs.resources.pvc import get_all_pvc_objs
 from ocs_ci.ocs.node import gracefully_reboot_nodes, get_node_objs
 from ocs_ci.ocs.utils import (
     get_non_acm_cluster_config,
+    get_non_acm_cluster_indexes,
     get_active_acm_index,
     get_primary_cluster_config,
     get_passive_acm_index,
@@ -41,6 +42,8 @@ from ocs_ci.utility.utils import (
     run_cmd,
     exec_cmd,
     is_cluster_y_version_upgraded,
+    run_cmd_multicluster_parallel,
+    run_func_multicluster,
 )
 from ocs_ci.helpers.helpers import (
     run_cmd_verify_cli_output,
@@ -438,15 +441,14 @@ def wait_for_mirroring_status_ok(replaying_images=None, timeout=600):
         bool: True if status contains expected health and states values
 
     Raises:
-        TimeoutExpiredError: In case of unexpected mirroring status
+        MultiClusterTaskFailed: In case of unexpected mirroring status on any
+            of the clusters (TimeoutExpiredError per cluster)
 
     """
-    restore_index = config.cur_index
-    for cluster in get_non_acm_cluster_config():
-        config.switch_ctx(cluster.MULTICLUSTER["multicluster_index"])
-        logger.info(
-            f"Validating mirroring status on cluster {cluster.ENV_DATA['cluster_name']}"
-        )
+
+    def wait_on_cluster():
+        cluster_name = config.ENV_DATA["cluster_name"]
+        logger.info(f"Validating mirroring status on cluster {cluster_name}")
         sample = TimeoutSampler(
             timeout=timeout,
             sleep=5,
@@ -456,12 +458,17 @@ def wait_for_mirroring_status_ok(replaying_images=None, timeout=600):
         if not sample.wait_for_func_status(result=True):
             error_msg = (
                 "The mirroring status does not have expected values within the time"
-                f" limit on cluster {cluster.ENV_DATA['cluster_name']}"
+                f" limit on cluster {cluster_name}"
             )
             logger.error(error_msg)
             raise TimeoutExpiredError(error_msg)
 
-    config.switch_ctx(restore_index)
+    # the clusters are checked in parallel
+    run_func_multicluster(
+        wait_on_cluster,
+        cluster_indexes=get_non_acm_cluster_indexes(),
+        fail_fast=False,
+    )
     return True
 
 
@@ -896,7 +903,7 @@ def wait_for_all_resources_deletion(
 
     """
     logger.info("Waiting for all pods to be deleted")
-    all_pods = get_all_pods(namespace=namespace)
+    all_pods = get_all_pods(namespace=namespace, use_cache=True)
     for pod_obj in all_pods:
         if "volsync-rsync-tls-dst" not in pod_obj.name:
             pod_obj.ocp.wait_for_delete(
@@ -1014,10 +1021,14 @@ def get_backend_volumes_for_pvcs(namespace):
     Returns:
         list: List of RBD images or CephFS subvolumes
 
+    Raises:
+        MultiClusterTaskFailed: In case the volumes couldn't be fetched on any
+            of the clusters
+
     """
-    backend_volumes = []
-    for cluster in get_non_acm_cluster_config():
-        config.switch_ctx(cluster.MULTICLUSTER["multicluster_index"])
+
+    def get_cluster_backend_volumes():
+        backend_volumes = []
         logger.info(f"Fetching backend volume names for PVCs in namespace: {namespace}")
         all_pvcs = get_all_pvc_objs(namespace=namespace)
         for pvc_obj in all_pvcs:
@@ -1037,8 +1048,16 @@ def get_backend_volumes_for_pvcs(namespace):
                 backend_volume = pvc_obj.get_cephfs_subvolume_name
 
             backend_volumes.append(backend_volume)
+        return backend_volumes
 
-    backend_volumes = list(set(backend_volumes))
+    results = run_func_multicluster(
+        get_cluster_backend_volumes,
+        cluster_indexes=get_non_acm_cluster_indexes(),
+        fail_fast=False,
+    )
+    backend_volumes = list(
+        {volume for cluster_volumes in results.values() for volume in cluster_volumes}
+    )
     logger.info(f"Found {len(backend_volumes)} backend volumes: {backend_volumes}")
     return backend_volumes
 
@@ -2153,14 +2172,12 @@ def validate_storage_cluster_peer_state():
     Validate Storage cluster peer state
 
     Raises:
-        TimeoutExpiredError: incase storage cluster peer state is not reached 'Peered' state.
+        MultiClusterTaskFailed: incase storage cluster peer state is not reached 'Peered'
+            state on any of the clusters (TimeoutExpiredError per cluster)
 
     """
-    restore_index = config.cur_index
-    managed_clusters = get_non_acm_cluster_config()
-    for cluster in managed_clusters:
-        index = cluster.MULTICLUSTER["multicluster_index"]
-        config.switch_ctx(index)
+
+    def validate_on_cluster():
         logger.info("Validating Storage Cluster Peer status")
         sample = TimeoutSampler(
             timeout=300,
@@ -2170,11 +2187,16 @@ def validate_storage_cluster_peer_state():
         if not sample.wait_for_func_status(result=True):
             error_msg = (
                 "Storage cluster peer status does not have expected values within the time "
-                f"limit on cluster {cluster.ENV_DATA['cluster_name']}"
+                f"limit on cluster {config.ENV_DATA['cluster_name']}"
             )
             logger.error(error_msg)
             raise TimeoutExpiredError(error_msg)
-    config.switch_ctx(restore_index)
+
+    run_func_multicluster(
+        validate_on_cluster,
+        cluster_indexes=get_non_acm_cluster_indexes(),
+        fail_fast=False,
+    )
 
 
 def check_storage_cluster_peer_state():
@@ -2203,26 +2225,31 @@ def check_storage_cluster_peer_state():
 def create_service_exporter():
     """
     Create Service exporter
+
+    Raises:
+        MultiClusterTaskFailed: In case the creation failed on any of the
+            clusters
+
     """
-    restore_index = config.cur_index
-    managed_clusters = get_non_acm_cluster_config()
-    for cluster in managed_clusters:
-        index = cluster.MULTICLUSTER["multicluster_index"]
-        config.switch_ctx(index)
-        logger.info("Creating Service exporter")
-        run_cmd(f"oc create -f {constants.DR_SERVICE_EXPORTER}")
-    config.switch_ctx(restore_index)
+    logger.info("Creating Service exporter")
+    run_cmd_multicluster_parallel(
+        f"oc create -f {constants.DR_SERVICE_EXPORTER}",
+        skip_index=get_all_acm_indexes(),
+        fail_fast=False,
+    )
 
 
 def verify_volsync():
     """
     Verify volsync pod is created in volsync-system namespace
+
+    Raises:
+        MultiClusterTaskFailed: In case the pod isn't running on any of the
+            clusters
+
     """
-    restore_index = config.cur_index
-    managed_clusters = get_non_acm_cluster_config()
-    for cluster in managed_clusters:
-        index = cluster.MULTICLUSTER["multicluster_index"]
-        config.switch_ctx(index)
+
+    def verify_on_cluster():
         logger.info(
             f"Verifying volsync pod in namespace {constants.VOLSYNC_SYSTEM_NAMESPACE}"
         )
@@ -2233,4 +2260,9 @@ def verify_volsync():
             resource_count=1,
             timeout=600,
         )
-    config.switch_ctx(restore_index)
+
+    run_func_multicluster(
+        verify_on_cluster,
+        cluster_indexes=get_non_acm_cluster_indexes(),
+        fail_fast=False,
+    )
@@ -2795,6 +2795,7 @@ def label_worker_node(node_list, label_key, label_value):
         command=f"label node {' '.join(node_list)} {label_key}={label_value}",
         out_yaml_format=False,
     )
+    node.invalidate_node_view()
     logger.info(out)
 
 
@@ -2810,6 +2811,7 @@ def remove_label_from_worker_node(node_list, label_key):
     out = ocp_obj.exec_oc_cmd(
         command=f"label node {' '.join(node_list)} {label_key}-", out_yaml_format=False
     )
+    node.invalidate_node_view()
     logger.info(out)
 
 
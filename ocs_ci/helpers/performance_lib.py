@@ -2,7 +2,9 @@ import json
 import os
 import logging
 import subprocess
+import tempfile
 import time
+from collections import defaultdict
 from datetime import datetime
 
 import re
@@ -18,6 +20,14 @@ from ocs_ci.utility import version
 logger = logging.getLogger(__name__)
 DATE_TIME_FORMAT = "%Y I%m%d %H:%M:%S.%f"
 
+# e.g. 'ID: 21 Req-ID: pvc-6f5c... GRPC call: /csi.v1.Controller/CreateVolume'
+GRPC_LOG_PATTERN = re.compile(r"ID: (\S+) Req-ID: (\S+) GRPC (call|response):\s*(\S*)")
+# names of the resources, e.g. 'pvc-test-1' of 'PVC="namespace-test/pvc-test-1"'
+LOG_NAME_PATTERN = re.compile(r"[\w-]+(?:\.[\w-]+)*")
+# the provisioner lines with start / end of the PVC / PV operations contain
+# one of these (lower case)
+PROVISIONER_LOG_KEYWORDS = ("started", "succeeded", "shoulddelete")
+
 interface_data = {
     constants.CEPHBLOCKPOOL: {
         "prov": "csi-rbdplugin-provisioner",
@@ -222,6 +232,232 @@ def read_csi_logs(log_names, container_name, start_time):
     return logs
 
 
+class CSILogIndex(object):
+    """
+    Index of the CSI plugin and CSI provisioner log lines, which are used for
+    the time measurements of PVCs, clones and snapshots.
+
+    Every line is parsed once while it's added, only the lines the
+    measurements look for are kept:
+
+    * GRPC call / response lines, by the Req-ID of the line
+    * 'generated volume id' lines, the volume id by the names in the line
+    * provisioner lines reporting start or end of an operation, by the names
+      (PVC, PV and namespace names) in the line
+
+    so the time of any number of PVCs is looked up without rescanning the
+    logs per PVC.
+    """
+
+    def __init__(self):
+        self.lines = 0
+        self.sources = 0
+        # Req-ID -> list of (line number, source, ID, method, line)
+        self.calls = defaultdict(list)
+        # Req-ID -> list of (line number, source, ID, line)
+        self.responses = defaultdict(list)
+        # (source, ID) -> list of response lines
+        self.responses_by_id = defaultdict(list)
+        # name (PV name or request name) -> generated volume id
+        self.volume_ids = {}
+        # name -> list of provisioner lines containing the name
+        self.provisioner_lines = defaultdict(list)
+
+    def add_lines(self, lines):
+        """
+        Parse and index lines of one log
+
+        Args:
+            lines (iterable): lines of the log, e.g. lines of the stdout of
+                the 'oc logs' process
+
+        """
+        source = self.sources
+        self.sources += 1
+        for line in lines:
+            line = line.rstrip("\n")
+            self.lines += 1
+            match = GRPC_LOG_PATTERN.search(line)
+            if match:
+                grpc_id, req_id, phase, method = match.groups()
+                if phase == "call":
+                    self.calls[req_id].append(
+                        (self.lines, source, grpc_id, method, line)
+                    )
+                else:
+                    self.responses[req_id].append((self.lines, source, grpc_id, line))
+                    self.responses_by_id[(source, grpc_id)].append(line)
+                continue
+            line_lower = line.lower()
+            if "generated volume id" in line_lower:
+                volume_id = line.split("(")[1].split(")")[0]
+                for name in LOG_NAME_PATTERN.findall(line):
+                    self.volume_ids.setdefault(name, volume_id)
+            elif any(keyword in line_lower for keyword in PROVISIONER_LOG_KEYWORDS):
+                for name in set(LOG_NAME_PATTERN.findall(line)):
+                    self.provisioner_lines[name].append(line)
+
+    def get_volume_id(self, name):
+        """
+        Get the volume id generated by the CSI driver for the PV
+
+        Args:
+            name (str): name of the PV
+
+        Returns:
+            str: volume id, None if not found in the logs
+
+        """
+        return self.volume_ids.get(name)
+
+    def get_provisioner_lines(self, name):
+        """
+        Get the provisioner lines reporting start or end of an operation
+
+        Args:
+            name (str): name of the PVC or PV
+
+        Returns:
+            list: lines containing the name, in the order of the logs
+
+        """
+        return self.provisioner_lines.get(name, [])
+
+    def get_grpc_lines(self, req_id, first=False):
+        """
+        Get the GRPC call and response lines of the request
+
+        Args:
+            req_id (str): Req-ID of the request, e.g. the PV name or the
+                volume id
+            first (bool): True for the first call and response in the logs,
+                the last ones otherwise
+
+        Returns:
+            tuple: call line, response line, None for the ones not found
+
+        """
+        index = 0 if first else -1
+        calls = self.calls.get(req_id)
+        responses = self.responses.get(req_id)
+        return (
+            calls[index][-1] if calls else None,
+            responses[index][-1] if responses else None,
+        )
+
+    def get_grpc_calls(self, req_id, method=None):
+        """
+        Get the GRPC calls of the request
+
+        Args:
+            req_id (str): Req-ID of the request
+            method (str): GRPC method, e.g. /csi.v1.Node/NodeStageVolume
+
+        Returns:
+            list: (line number, source, ID, method, line) of the calls
+
+        """
+        return [
+            call
+            for call in self.calls.get(req_id, [])
+            if method is None or call[3] == method
+        ]
+
+    def get_grpc_responses(self, req_id):
+        """
+        Get the GRPC responses of the request
+
+        Args:
+            req_id (str): Req-ID of the request
+
+        Returns:
+            list: (line number, source, ID, line) of the responses
+
+        """
+        return self.responses.get(req_id, [])
+
+    def get_grpc_responses_by_id(self, source, grpc_id):
+        """
+        Get the GRPC response lines with the ID in the log
+
+        Args:
+            source (int): number of the log the ID belongs to
+            grpc_id (str): ID of the GRPC call
+
+        Returns:
+            list: response lines
+
+        """
+        return self.responses_by_id.get((source, grpc_id), [])
+
+    def find_req_ids(self, fragment):
+        """
+        Find the Req-IDs containing the string, e.g. the UID of a snapshot
+
+        Args:
+            fragment (str): string the Req-ID contains
+
+        Returns:
+            list: matching Req-IDs
+
+        """
+        return [
+            req_id
+            for req_id in self.calls.keys() | self.responses.keys()
+            if fragment in req_id
+        ]
+
+
+def read_csi_log_index(log_names, container_name, start_time):
+    """
+    Read specific CSI logs starting on a specific time into CSILogIndex.
+    The logs are streamed from the 'oc logs' processes, so they are never
+    held in memory whole.
+
+    Args:
+        log_names (list): list of pods to read log from them
+        container_name (str): the name of the specific container in the pod
+        start_time (time): the time stamp which will use as starting point in the log
+
+    Returns:
+        CSILogIndex: index of the lines of all the logs
+
+    """
+    ns_name = config.ENV_DATA["cluster_namespace"]
+    kubeconfig = config.RUN["kubeconfig"]
+    env = os.environ.copy()
+    env["KUBECONFIG"] = kubeconfig
+    log_index = CSILogIndex()
+    start = time.perf_counter()
+    for log_name in log_names:
+        cmd = (
+            f"oc --kubeconfig {kubeconfig} -n {ns_name} logs {log_name} "
+            f"-c {container_name} --since-time={start_time}"
+        )
+        logger.info(f"Going to read {cmd}")
+        with tempfile.TemporaryFile() as stderr:
+            with subprocess.Popen(
+                cmd.split(),
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                env=env,
+                universal_newlines=True,
+                errors="replace",
+            ) as process:
+                log_index.add_lines(process.stdout)
+            if process.returncode:
+                stderr.seek(0)
+                logger.error(
+                    f"Command finished with non zero ({process.returncode}): "
+                    f"{stderr.read().decode(errors='replace')}"
+                )
+    logger.info(
+        f"Indexed {log_index.lines} lines of {container_name} logs in "
+        f"{time.perf_counter() - start:.2f}s"
+    )
+    return log_index
+
+
 # Sometimes, the logs are not available due to the connection issues, retry added
 @retry(Exception, tries=6, delay=5, backoff=2)
 def measure_pvc_creation_time(interface, pvc_name, start_time):
@@ -239,20 +475,18 @@ def measure_pvc_creation_time(interface, pvc_name, start_time):
 
     """
     log_names = get_logfile_names(interface)
-    logs = read_csi_logs(log_names, "csi-provisioner", start_time)
+    log_index = read_csi_log_index(log_names, "csi-provisioner", start_time)
 
     st = None
     et = None
     # look for start time and end time of pvc creation. The start/end line may appear in log several times
     # in order to be on the safe side and measure the longest time difference (which is the actual pvc creation
     # time), the earliest start time and the latest end time are taken
-    for sublog in logs:
-        for line in sublog:
-            if st is None and "Started" in line and pvc_name in line:
-                st = string_to_time(line.split(" ")[1])
-            elif pvc_name in line and "Succeeded" in line:
-                et = string_to_time(line.split(" ")[1])
-    del logs
+    for line in log_index.get_provisioner_lines(pvc_name):
+        if st is None and "Started" in line:
+            st = string_to_time(line.split(" ")[1])
+        elif "Succeeded" in line:
+            et = string_to_time(line.split(" ")[1])
     if st is None:
         logger.error(f"Cannot find start time of {pvc_name}")
         raise Exception(f"Cannot find start time of {pvc_name}")
@@ -292,23 +526,17 @@ def csi_pvc_time_measure(interface, pvc_obj, operation, start_time):
 
     # Reading the CSI provisioner logs
     log_names = get_logfile_names(interface)
-    logs = read_csi_logs(log_names, interface_data[interface]["csi_cnt"], start_time)
+    log_index = read_csi_log_index(
+        log_names, interface_data[interface]["csi_cnt"], start_time
+    )
 
-    st = None
-    et = None
-    for sublog in logs:
-        for line in sublog:
-            if (
-                operation == "delete"
-                and "generated volume id" in line.lower()
-                and pv_name in line
-            ):
-                pv_name = line.split("(")[1].split(")")[0]
-            if f"Req-ID: {pv_name} GRPC call:" in line:
-                st = string_to_time(line.split(" ")[1])
-            if f"Req-ID: {pv_name} GRPC response:" in line:
-                et = string_to_time(line.split(" ")[1])
-    del logs
+    if operation == "delete":
+        # the volume is deleted by the volume id generated on its creation
+        pv_name = log_index.get_volume_id(pv_name) or pv_name
+    st, et = (
+        string_to_time(line.split(" ")[1]) if line else None
+        for line in log_index.get_grpc_lines(pv_name)
+    )
     if st is None:
         err_msg = f"Cannot find CSI start time of {pvc_obj.name}"
         logger.error(err_msg)
@@ -354,25 +582,17 @@ def csi_bulk_pvc_time_measure(interface, pvc_objs, operation, start_time):
 
     # Reading the CSI provisioner logs
     log_names = get_logfile_names(interface)
-    logs = read_csi_logs(log_names, cnt_names[interface], start_time)
+    log_index = read_csi_log_index(log_names, cnt_names[interface], start_time)
 
     for pvc in pvc_objs:
         pv_name = pvc.backed_pv
-        single_st = None
-        single_et = None
-
-        for sublog in logs:
-            for line in sublog:
-                if (
-                    operation == "delete"
-                    and "generated volume id" in line.lower()
-                    and pv_name in line
-                ):
-                    pv_name = line.split("(")[1].split(")")[0]
-                if f"Req-ID: {pv_name} GRPC call:" in line:
-                    single_st = string_to_time(line.split(" ")[1])
-                if f"Req-ID: {pv_name} GRPC response:" in line:
-                    single_et = string_to_time(line.split(" ")[1])
+        if operation == "delete":
+            # the volume is deleted by the volume id generated on its creation
+            pv_name = log_index.get_volume_id(pv_name) or pv_name
+        single_st, single_et = (
+            string_to_time(line.split(" ")[1]) if line else None
+            for line in log_index.get_grpc_lines(pv_name)
+        )
 
         if single_st is None:
             err_msg = f"Cannot find CSI start time of {pvc.name}"
@@ -552,22 +772,19 @@ def measure_csi_snapshot_creation_time(interface, snapshot_id, start_time):
 
     """
     log_names = get_logfile_names(interface)
-    logs = read_csi_logs(log_names, interface_data[interface]["csi_cnt"], start_time)
+    log_index = read_csi_log_index(
+        log_names, interface_data[interface]["csi_cnt"], start_time
+    )
 
-    st = None
-    et = None
-    time_format = "%H:%M:%S.%f"
-    for sublog in logs:
-        for line in sublog:
-            if (
-                "GRPC call: /csi.v1.Controller/CreateSnapshot" in line
-                and snapshot_id in line
-            ):
-                st = line.split(" ")[1]
-                st = datetime.strptime(st, time_format)
-            elif "GRPC response" in line and snapshot_id in line:
-                et = line.split(" ")[1]
-                et = datetime.strptime(et, time_format)
+    # the Req-ID of the snapshot operations is 'snapshot-<snapshot uid>'
+    calls = []
+    responses = []
+    for req_id in log_index.find_req_ids(snapshot_id):
+        calls += log_index.get_grpc_calls(req_id, "/csi.v1.Controller/CreateSnapshot")
+        responses += log_index.get_grpc_responses(req_id)
+    # the last call and response in the logs, the first item is line number
+    st = string_to_time(max(calls)[-1].split(" ")[1]) if calls else None
+    et = string_to_time(max(responses)[-1].split(" ")[1]) if responses else None
     if st is None:
         logger.error(f"Cannot find csi start time of snapshot {snapshot_id}")
         raise Exception(f"Cannot find csi start time of snapshot {snapshot_id}")
@@ -631,141 +848,106 @@ def get_pvc_provision_times(interface, pvc_name, start_time, time_type="all", op
 
     log_names = get_logfile_names(interface)
 
+    prov_index = None
+    csi_index = None
     if time_type.lower() in ["all", "total"]:
         logger.info("Reading the Provisioner logs")
-        prov_logs = read_csi_logs(log_names, "csi-provisioner", start_time)
+        prov_index = read_csi_log_index(log_names, "csi-provisioner", start_time)
     if time_type.lower() in ["all", "csi"]:
         logger.info("Reading the CSI only logs")
-        csi_logs = read_csi_logs(
+        csi_index = read_csi_log_index(
             log_names, interface_data[interface]["csi_cnt"], start_time
         )
 
+    ocs_version = version.get_semantic_ocs_version_from_config()
+
+    def _first_match(lines, legacy_pattern, legacy_max_version, pattern, flags=0):
+        """
+        Get the timestamp of the first line matching the pattern, or the
+        pattern of the older provisioner versions
+
+        """
+        for line in lines:
+            if (
+                re.search(legacy_pattern, line) and ocs_version <= legacy_max_version
+            ) or re.search(pattern, line, flags):
+                return extruct_timestamp_from_log(line)
+        return None
+
+    def _set_times(name, times, start_line, end_line):
+        if start_line:
+            times["start"] = extruct_timestamp_from_log(start_line)
+        if end_line:
+            times["end"] = extruct_timestamp_from_log(end_line)
+            times["time"] = calculate_operation_time(name, times)
+
     # Initializing the results dictionary
     results = {}
-    for i in range(0, len(pvc_name)):
-        results[pvc_name[i].name] = {
+    for pvc in pvc_name:
+        results[pvc.name] = {
             "create": {"start": None, "end": None, "time": None},
             "delete": {"start": None, "end": None, "time": None},
             "csi_create": {"start": None, "end": None, "time": None},
             "csi_delete": {"start": None, "end": None, "time": None},
         }
-    # Getting times from Provisioner log - if needed
-    if prov_logs:
-        for sublog in prov_logs:
-            for line in sublog:
-                for i in range(0, len(pvc_name)):
-                    name = pvc_name[i].name
-                    pv_name = pvc_name[i].backed_pv
-                    if op in ["all", "create"]:
-                        if (
-                            re.search(f"provision.*{name}.*started", line)
-                            and (
-                                version.get_semantic_ocs_version_from_config()
-                                <= version.VERSION_4_16
-                            )
-                        ) or re.search(f'Started.*PVC="[^"]*/{re.escape(name)}"', line):
-                            if results[name]["create"]["start"] is None:
-                                results[name]["create"]["start"] = (
-                                    extruct_timestamp_from_log(line)
-                                )
-                        if (
-                            re.search(f"provision.*{name}.*succeeded", line)
-                            and (
-                                version.get_semantic_ocs_version_from_config()
-                                <= version.VERSION_4_16
-                            )
-                        ) or re.search(
-                            f"Succeeded.*{re.escape(name)}", line, re.IGNORECASE
-                        ):
-                            if results[name]["create"]["end"] is None:
-                                results[name]["create"]["end"] = (
-                                    extruct_timestamp_from_log(line)
-                                )
-                                results[name]["create"]["time"] = (
-                                    calculate_operation_time(
-                                        name, results[name]["create"]
-                                    )
-                                )
-                    if op in ["all", "delete"]:
-                        if (
-                            re.search(f'delete "{pv_name}": started', line)
-                            and (
-                                version.get_semantic_ocs_version_from_config()
-                                <= version.VERSION_4_16
-                            )
-                        ) or re.search(
-                            f'"shouldDelete is true".*PV="{re.escape(pv_name)}"', line
-                        ):
-                            if results[name]["delete"]["start"] is None:
-                                results[name]["delete"]["start"] = (
-                                    extruct_timestamp_from_log(line)
-                                )
-                        if (
-                            re.search(f'delete "{pv_name}": succeeded', line)
-                            and (
-                                version.get_semantic_ocs_version_from_config()
-                                <= version.VERSION_4_13
-                            )
-                        ) or re.search(
-                            f'deleted succeeded.*PV="{re.escape(pv_name)}"', line
-                        ):
-                            if results[name]["delete"]["end"] is None:
-                                results[name]["delete"]["end"] = (
-                                    extruct_timestamp_from_log(line)
-                                )
-                                results[name]["delete"]["time"] = (
-                                    calculate_operation_time(
-                                        name, results[name]["delete"]
-                                    )
-                                )
-
-    # Getting times from CSI log - if needed
-    del_pv_names = []
-    for i in range(0, len(pvc_name)):
-        del_pv_names.append("")
-
-    if csi_logs:
-        for sublog in csi_logs:
-            for line in sublog:
-                for i in range(0, len(pvc_name)):
-                    name = pvc_name[i].name
-                    pv_name = pvc_name[i].backed_pv
-
-                    if "generated volume id" in line.lower() and pv_name in line:
-                        del_pv_names[i] = line.split("(")[1].split(")")[0]
-                    if op in ["all", "create"]:
-                        if f"Req-ID: {pv_name} GRPC call:" in line:
-                            if results[name]["csi_create"]["start"] is None:
-                                results[name]["csi_create"]["start"] = (
-                                    extruct_timestamp_from_log(line)
-                                )
-                        if f"Req-ID: {pv_name} GRPC response:" in line:
-                            if results[name]["csi_create"]["end"] is None:
-                                results[name]["csi_create"]["end"] = (
-                                    extruct_timestamp_from_log(line)
-                                )
-                                results[name]["csi_create"]["time"] = (
-                                    calculate_operation_time(
-                                        name, results[name]["csi_create"]
-                                    )
-                                )
-                    if op in ["all", "delete"]:
-                        if del_pv_names[i]:
-                            if f"Req-ID: {del_pv_names[i]} GRPC call:" in line:
-                                if results[name]["csi_delete"]["start"] is None:
-                                    results[name]["csi_delete"]["start"] = (
-                                        extruct_timestamp_from_log(line)
-                                    )
-                            if f"Req-ID: {del_pv_names[i]} GRPC response:" in line:
-                                if results[name]["csi_delete"]["end"] is None:
-                                    results[name]["csi_delete"]["end"] = (
-                                        extruct_timestamp_from_log(line)
-                                    )
-                                    results[name]["csi_delete"]["time"] = (
-                                        calculate_operation_time(
-                                            name, results[name]["csi_delete"]
-                                        )
-                                    )
+
+    for pvc in pvc_name:
+        name = pvc.name
+        pv_name = pvc.backed_pv
+        # Getting times from Provisioner log - if needed
+        if prov_index:
+            if op in ["all", "create"]:
+                lines = prov_index.get_provisioner_lines(name)
+                times = results[name]["create"]
+                times["start"] = _first_match(
+                    lines,
+                    f"provision.*{name}.*started",
+                    version.VERSION_4_16,
+                    f'Started.*PVC="[^"]*/{re.escape(name)}"',
+                )
+                times["end"] = _first_match(
+                    lines,
+                    f"provision.*{name}.*succeeded",
+                    version.VERSION_4_16,
+                    f"Succeeded.*{re.escape(name)}",
+                    re.IGNORECASE,
+                )
+                if times["end"]:
+                    times["time"] = calculate_operation_time(name, times)
+            if op in ["all", "delete"]:
+                lines = prov_index.get_provisioner_lines(pv_name)
+                times = results[name]["delete"]
+                times["start"] = _first_match(
+                    lines,
+                    f'delete "{pv_name}": started',
+                    version.VERSION_4_16,
+                    f'"shouldDelete is true".*PV="{re.escape(pv_name)}"',
+                )
+                times["end"] = _first_match(
+                    lines,
+                    f'delete "{pv_name}": succeeded',
+                    version.VERSION_4_13,
+                    f'deleted succeeded.*PV="{re.escape(pv_name)}"',
+                )
+                if times["end"]:
+                    times["time"] = calculate_operation_time(name, times)
+
+        # Getting times from CSI log - if needed
+        if csi_index:
+            if op in ["all", "create"]:
+                _set_times(
+                    name,
+                    results[name]["csi_create"],
+                    *csi_index.get_grpc_lines(pv_name, first=True),
+                )
+            # the volume is deleted by the volume id generated on its creation
+            del_pv_name = csi_index.get_volume_id(pv_name)
+            if op in ["all", "delete"] and del_pv_name:
+                _set_times(
+                    name,
+                    results[name]["csi_delete"],
+                    *csi_index.get_grpc_lines(del_pv_name, first=True),
+                )
 
     logger.debug(f"All results are : {json.dumps(results, indent=3)}")
     return results
@@ -843,48 +1025,45 @@ def pod_attach_csi_time(
         raise Exception("Cannot get volume handle")
 
     log_names = get_logfile_names(interface, provisioning=False)
-    logs = read_csi_logs(log_names, interface_data[interface]["csi_cnt"], start_time)
+    log_index = read_csi_log_index(
+        log_names, interface_data[interface]["csi_cnt"], start_time
+    )
 
     logger.info(
         f"Looking for pod attach time for pv {pv_name} and volume handle {volume_handle}"
     )
 
-    node_stage_st = None
-    node_publish_st = None
-
-    for sublog in logs:
-        for line in sublog:
-            if f"{volume_handle} GRPC call: /csi.v1.Node/NodeStageVolume" in line:
-                node_stage_st = string_to_time(line.split()[1])
-                node_stage_id = line.split()[5]
-            if f"{volume_handle} GRPC call: /csi.v1.Node/NodePublishVolume" in line:
-                node_publish_st = string_to_time(line.split()[1])
-                node_publish_id = line.split()[5]
-                node_publish_req_id = line.split()[7]
+    stage_calls = log_index.get_grpc_calls(
+        volume_handle, "/csi.v1.Node/NodeStageVolume"
+    )
+    publish_calls = log_index.get_grpc_calls(
+        volume_handle, "/csi.v1.Node/NodePublishVolume"
+    )
 
-    if node_stage_st is None:
+    if not stage_calls:
         logger.error("Cannot find node stage GRPC call")
         raise Exception("Cannot find node stage GRPC call")
 
-    if node_publish_st is None:
+    if not publish_calls:
         logger.error("Cannot find node publish GRPC call")
         raise Exception("Cannot find node publish GRPC call")
 
+    _, stage_source, node_stage_id, _, stage_line = stage_calls[-1]
+    _, publish_source, node_publish_id, _, publish_line = publish_calls[-1]
+    node_stage_st = string_to_time(stage_line.split()[1])
+    node_publish_st = string_to_time(publish_line.split()[1])
+
     logger.info(f"Node stage GRPC call start time is: {node_stage_st.time()}")
     logger.info(f"Node publish GRPC call start time is: {node_publish_st.time()}")
 
     node_stage_et = None
     node_publish_et = None
-    for sublog in logs:
-        for line in sublog:
-            if "GRPC response:" in line and f"ID: {node_stage_id}" in line:
-                node_stage_et = string_to_time(line.split(" ")[1])
-            if (
-                "GRPC response:" in line
-                and f"ID: {node_publish_id}" in line
-                and f"Req-ID: {node_publish_req_id}" in line
-            ):
-                node_publish_et = string_to_time(line.split(" ")[1])
+    stage_responses = log_index.get_grpc_responses_by_id(stage_source, node_stage_id)
+    if stage_responses:
+        node_stage_et = string_to_time(stage_responses[-1].split(" ")[1])
+    for _, source, grpc_id, line in log_index.get_grpc_responses(volume_handle):
+        if (source, grpc_id) == (publish_source, node_publish_id):
+            node_publish_et = string_to_time(line.split(" ")[1])
 
     if node_stage_et is None:
         logger.error("Cannot find node stage GRPC response")
@@ -957,31 +1136,28 @@ def pod_bulk_attach_csi_time(interface, pvc_objs, csi_start_time, namespace):
         )
 
     log_names = get_logfile_names(interface, provisioning=False)
-    logs = read_csi_logs(
+    log_index = read_csi_log_index(
         log_names, interface_data[interface]["csi_cnt"], csi_start_time
     )
 
-    for sublog in logs:
-        for line in sublog:
-            for pod_info in pods_info:
-                if (
-                    f"{pod_info['volume_handle']} GRPC call: /csi.v1.Node/NodeStageVolume"
-                    in line
-                ):
-                    pod_info["node_stage_st"] = string_to_time(line.split()[1])
-                if (
-                    f"{pod_info['volume_handle']} GRPC call: /csi.v1.Node/NodePublishVolume"
-                    in line
-                ):
-                    pod_info["node_publish_id"] = line.split()[5]
-                    pod_info["node_publish_req_id"] = line.split()[7]
-                if (
-                    pod_info["node_publish_id"] is not None
-                    and "GRPC response:" in line
-                    and f"ID: {pod_info['node_publish_id']}" in line
-                    and f"Req-ID: {pod_info['node_publish_req_id']}" in line
-                ):
-                    pod_info["node_publish_et"] = string_to_time(line.split(" ")[1])
+    for pod_info in pods_info:
+        volume_handle = pod_info["volume_handle"]
+        stage_calls = log_index.get_grpc_calls(
+            volume_handle, "/csi.v1.Node/NodeStageVolume"
+        )
+        if stage_calls:
+            pod_info["node_stage_st"] = string_to_time(stage_calls[-1][-1].split()[1])
+        publish_calls = log_index.get_grpc_calls(
+            volume_handle, "/csi.v1.Node/NodePublishVolume"
+        )
+        if not publish_calls:
+            continue
+        _, publish_source, publish_id, _, _ = publish_calls[-1]
+        pod_info["node_publish_id"] = publish_id
+        pod_info["node_publish_req_id"] = volume_handle
+        for _, source, grpc_id, line in log_index.get_grpc_responses(volume_handle):
+            if (source, grpc_id) == (publish_source, publish_id):
+                pod_info["node_publish_et"] = string_to_time(line.split(" ")[1])
 
     for pod_info in pods_info:
         if pod_info["node_stage_st"] is None:
@@ -0,0 +1,33 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.helpers import dr_helpers
+
+
+@pytest.mark.parametrize(
+    "helper, runner",
+    [
+        (dr_helpers.create_service_exporter, "run_cmd_multicluster_parallel"),
+        (dr_helpers.verify_volsync, "run_func_multicluster"),
+        (dr_helpers.validate_storage_cluster_peer_state, "run_func_multicluster"),
+        (dr_helpers.wait_for_mirroring_status_ok, "run_func_multicluster"),
+        (
+            lambda: dr_helpers.get_backend_volumes_for_pvcs("namespace"),
+            "run_func_multicluster",
+        ),
+    ],
+)
+def test_multicluster_helpers_wait_for_all_clusters(helper, runner, monkeypatch):
+    """
+    Check that the helpers changing or polling the clusters don't fail fast,
+    so no call is left running in the background.
+    """
+    calls = []
+    monkeypatch.setattr(dr_helpers, "get_non_acm_cluster_indexes", lambda: [1, 2])
+    monkeypatch.setattr(dr_helpers, "get_all_acm_indexes", lambda: [0])
+    monkeypatch.setattr(
+        dr_helpers, runner, lambda *args, **kwargs: calls.append(kwargs) or {}
+    )
+    helper()
+    assert calls and all(kwargs.get("fail_fast") is False for kwargs in calls)
@@ -0,0 +1,205 @@
+# -*- coding: utf8 -*-
+
+import os
+from sys import platform
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.helpers import performance_lib
+from ocs_ci.ocs import constants
+from ocs_ci.utility import version
+
+pytestmark = pytest.mark.skipif(
+    platform.startswith("win"), reason="requires posix shell"
+)
+
+PROVISIONER_POD = "csi-rbdplugin-provisioner-5b9c6f4d8-abcde"
+PLUGIN_POD = "csi-rbdplugin-x7k2p"
+PVCS = [
+    SimpleNamespace(name=f"pvc-test-{i}", backed_pv=f"pvc-0000000{i}-uuid")
+    for i in range(1, 4)
+]
+
+
+def klog(second, message, file="utils.go:198"):
+    return f"I0215 10:00:{second:09.6f}       1 {file}] {message}"
+
+
+def provisioner_log():
+    lines = []
+    for i, pvc in enumerate(PVCS):
+        lines += [
+            klog(i, f'"Started" PVC="namespace-test/{pvc.name}"'),
+            klog(i + 0.5, f'"Event occurred" object="namespace-test/{pvc.name}"'),
+            klog(i + 2, f'"Succeeded" PVC="namespace-test/{pvc.name}"'),
+            klog(i + 20, f'"shouldDelete is true" PV="{pvc.backed_pv}"'),
+            klog(i + 23, f'"deleted succeeded" PV="{pvc.backed_pv}"'),
+        ]
+    return lines
+
+
+def plugin_controller_log():
+    lines = []
+    for i, pvc in enumerate(PVCS):
+        volume_id = f"0001-0011-openshift-storage-{i}"
+        lines += [
+            klog(
+                i + 0.1,
+                f"ID: {i} Req-ID: {pvc.backed_pv} GRPC call: /csi.v1.Controller/CreateVolume",
+            ),
+            klog(
+                i + 0.2,
+                f'ID: {i} Req-ID: {pvc.backed_pv} GRPC request: {{"name":"{pvc.backed_pv}"}}',
+            ),
+            klog(
+                i + 0.3,
+                f"ID: {i} Req-ID: {pvc.backed_pv} generated volume id ({volume_id}) "
+                f"and image name (csi-vol-{i}) for request name ({pvc.backed_pv})",
+                "rbd/controllerserver.go:700",
+            ),
+            klog(
+                i + 0.1 + (i + 1),
+                f"ID: {i} Req-ID: {pvc.backed_pv} GRPC response: {{}}",
+            ),
+            klog(
+                i + 20.5,
+                f"ID: {10 + i} Req-ID: {volume_id} GRPC call: /csi.v1.Controller/DeleteVolume",
+            ),
+            klog(i + 22, f"ID: {10 + i} Req-ID: {volume_id} GRPC response: {{}}"),
+        ]
+    lines += [
+        klog(
+            30,
+            "ID: 30 Req-ID: snapshot-1234-uid GRPC call: /csi.v1.Controller/CreateSnapshot",
+        ),
+        klog(30.2, "ID: 31 GRPC call: /csi.v1.Identity/Probe"),
+        klog(33.5, "ID: 30 Req-ID: snapshot-1234-uid GRPC response: {}"),
+    ]
+    return lines
+
+
+def plugin_node_log():
+    return [
+        klog(
+            40,
+            "ID: 7 Req-ID: 0001-0011-openshift-storage-0 GRPC call: /csi.v1.Node/NodeStageVolume",
+        ),
+        klog(
+            41,
+            "ID: 8 Req-ID: 0001-0011-openshift-storage-0 GRPC call: /csi.v1.Node/NodePublishVolume",
+        ),
+        klog(42.5, "ID: 7 Req-ID: 0001-0011-openshift-storage-0 GRPC response: {}"),
+        klog(44, "ID: 8 Req-ID: 0001-0011-openshift-storage-0 GRPC response: {}"),
+    ]
+
+
+@pytest.fixture
+def csi_logs(tmp_path, monkeypatch):
+    """
+    Fake oc binary listing the CSI pods, serving the synthetic CSI logs and
+    describing the PV.
+    """
+    logs = {
+        f"{PROVISIONER_POD}-csi-provisioner": provisioner_log(),
+        f"{PROVISIONER_POD}-csi-rbdplugin": plugin_controller_log(),
+        f"{PLUGIN_POD}-csi-rbdplugin": plugin_node_log(),
+    }
+    for name, lines in logs.items():
+        (tmp_path / f"{name}.log").write_text("\n".join(lines) + "\n")
+    oc_bin = tmp_path / "oc"
+    oc_bin.write_text(
+        "#!/bin/sh\n"
+        'case "$5" in\n'
+        f"  get) printf 'NAME READY STATUS\\n{PROVISIONER_POD} 6/6 Running\\n"
+        f"{PLUGIN_POD} 3/3 Running\\n';;\n"
+        f'  logs) cat "{tmp_path}/$6-$8.log";;\n'
+        "  describe) echo '  VolumeHandle: 0001-0011-openshift-storage-0';;\n"
+        "esac\n"
+    )
+    oc_bin.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    monkeypatch.setitem(config.RUN, "kubeconfig", str(tmp_path / "kubeconfig"))
+    monkeypatch.setitem(config.ENV_DATA, "cluster_namespace", "openshift-storage")
+    monkeypatch.setattr(
+        version, "get_semantic_ocs_version_from_config", lambda: version.VERSION_4_18
+    )
+    return logs
+
+
+def test_index_keeps_only_measured_lines(csi_logs):
+    """
+    Check that the index keeps GRPC calls / responses, generated volume ids
+    and provisioner start / end lines, and skips all the other lines.
+    """
+    log_index = performance_lib.CSILogIndex()
+    log_index.add_lines(csi_logs[f"{PROVISIONER_POD}-csi-rbdplugin"])
+    log_index.add_lines(csi_logs[f"{PROVISIONER_POD}-csi-provisioner"])
+    assert log_index.lines == 36
+    assert log_index.sources == 2
+    assert log_index.get_volume_id("pvc-00000002-uuid") == (
+        "0001-0011-openshift-storage-1"
+    )
+    assert len(log_index.get_provisioner_lines("pvc-test-1")) == 2
+    assert log_index.get_provisioner_lines("pvc-test-") == []
+    call, response = log_index.get_grpc_lines("pvc-00000001-uuid")
+    assert "CreateVolume" in call and "GRPC response" in response
+    assert (
+        log_index.get_grpc_calls("pvc-00000001-uuid", "/csi.v1.Node/NodeStageVolume")
+        == []
+    )
+    assert log_index.find_req_ids("1234") == ["snapshot-1234-uid"]
+
+
+def test_csi_pvc_time_measure(csi_logs):
+    """
+    Check the CSI create and delete times of single PVC and bulk of PVCs.
+    """
+    interface = constants.CEPHBLOCKPOOL
+    start_time = "2025-02-15T10:00:00Z"
+    assert performance_lib.csi_pvc_time_measure(
+        interface, PVCS[1], "create", start_time
+    ) == pytest.approx(2)
+    assert performance_lib.csi_pvc_time_measure(
+        interface, PVCS[1], "delete", start_time
+    ) == pytest.approx(1.5)
+    assert performance_lib.csi_bulk_pvc_time_measure(
+        interface, PVCS, "create", start_time
+    ) == pytest.approx(5)
+    assert performance_lib.csi_bulk_pvc_time_measure(
+        interface, PVCS, "delete", start_time
+    ) == pytest.approx(3.5)
+
+
+def test_get_pvc_provision_times(csi_logs):
+    """
+    Check the provisioner and CSI times of all the PVCs in one call.
+    """
+    results = performance_lib.get_pvc_provision_times(
+        constants.CEPHBLOCKPOOL, PVCS, "2025-02-15T10:00:00Z"
+    )
+    assert results["pvc-test-2"]["create"]["time"] == 2
+    assert results["pvc-test-2"]["delete"]["time"] == 3
+    assert results["pvc-test-2"]["csi_create"]["time"] == 2
+    assert results["pvc-test-2"]["csi_delete"]["time"] == 1.5
+    assert performance_lib.measure_pvc_creation_time(
+        constants.CEPHBLOCKPOOL, "pvc-test-3", "2025-02-15T10:00:00Z"
+    ) == pytest.approx(2)
+
+
+def test_snapshot_and_attach_times(csi_logs):
+    """
+    Check the CSI snapshot creation time and the CSI pod attach time.
+    """
+    interface = constants.CEPHBLOCKPOOL
+    start_time = "2025-02-15T10:00:00Z"
+    assert performance_lib.measure_csi_snapshot_creation_time(
+        interface, "1234-uid", start_time
+    ) == pytest.approx(3.5)
+    assert performance_lib.pod_attach_csi_time(
+        interface, PVCS[0].backed_pv, start_time, "namespace-test"
+    ) == pytest.approx(5.5)
+    assert performance_lib.pod_bulk_attach_csi_time(
+        interface, PVCS[:1], start_time, "namespace-test"
+    ) == pytest.approx(4)
@@ -256,6 +256,75 @@ def verify_s3_object_integrity(
         return False
 
 
+def get_directory_checksums(pod_obj, directory, pattern=""):
+    """
+    Computes MD5 checksums of the files in a directory on a pod by a single
+    exec, instead of an exec per file
+
+    Args:
+        pod_obj (Pod): The pod on which the directory resides
+        directory (str): Path of the directory
+        pattern (str): Prefix of the names of the files to compute the
+            checksums of, all the files if empty
+
+    Returns:
+        dict: MD5 checksum by file name
+
+    """
+    output = pod_obj.exec_sh_cmd_on_pod(
+        command=(
+            f"cd {directory} && find . -maxdepth 1 -type f "
+            f"-name '{pattern}*' -exec md5sum {{}} +"
+        ),
+        sh="sh",
+    )
+    checksums = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        md5sum, file_path = line.split(maxsplit=1)
+        checksums[os.path.basename(file_path)] = md5sum
+    logger.info(f"Computed MD5 of {len(checksums)} files in {directory}")
+    return checksums
+
+
+def compare_checksum_manifests(original_checksums, result_checksums, names=None):
+    """
+    Compares MD5 checksums of the original and result objects, as returned by
+    get_directory_checksums, and reports every object which doesn't match
+
+    Args:
+        original_checksums (dict): MD5 checksum by name of the original objects
+        result_checksums (dict): MD5 checksum by name of the result objects
+        names (list): Names of the objects to compare, all the objects of
+            both manifests if not provided
+
+    Returns:
+        list: Names of the objects with different checksums or missing in
+            any of the manifests, empty if all the checksums match
+
+    """
+    if names is None:
+        names = sorted(original_checksums.keys() | result_checksums.keys())
+    mismatches = []
+    for name in names:
+        original_md5 = original_checksums.get(name)
+        result_md5 = result_checksums.get(name)
+        if original_md5 is None or original_md5 != result_md5:
+            logger.error(
+                f"Failed: MD5 comparison of {name} - "
+                f"{original_md5 or 'missing'} ≠ {result_md5 or 'missing'}"
+            )
+            mismatches.append(name)
+    if mismatches:
+        logger.error(
+            f"MD5 comparison failed for {len(mismatches)} of {len(names)} objects"
+        )
+    else:
+        logger.info(f"Passed: MD5 comparison of {len(names)} objects")
+    return mismatches
+
+
 def retrieve_test_objects_to_pod(podobj, target_dir):
     """
     Downloads all the test objects to a given directory in a given pod.
@@ -1754,7 +1823,13 @@ def wait_for_cache(mcg_obj, bucket_name, expected_objects_names=None, timeout=60
 
 
 def compare_directory(
-    awscli_pod, original_dir, result_dir, amount=2, pattern="ObjKey-", result_pod=None
+    awscli_pod,
+    original_dir,
+    result_dir,
+    amount=2,
+    pattern="ObjKey-",
+    result_pod=None,
+    use_manifest=True,
 ):
     """
     Compares object checksums on original and result directories
@@ -1764,8 +1839,27 @@ def compare_directory(
         original_dir (str): original directory name
         result_dir (str): result directory name
         amount (int): Number of test objects to create
+        pattern (str): Naming pattern of the objects, followed by the number
+        result_pod (pod): A pod with the result directory, awscli_pod if not
+            provided
+        use_manifest (bool): Compute the checksums of each directory by a
+            single exec and compare them locally, otherwise by an exec per
+            object
+
+    Returns:
+        bool: True if checksums of all the objects match, False otherwise
 
     """
+    if use_manifest:
+        original_checksums = get_directory_checksums(awscli_pod, original_dir, pattern)
+        result_checksums = get_directory_checksums(
+            result_pod or awscli_pod, result_dir, pattern
+        )
+        return not compare_checksum_manifests(
+            original_checksums,
+            result_checksums,
+            [f"{pattern}{i}" for i in range(amount)],
+        )
     comparisons = []
     for i in range(amount):
         file_name = f"{pattern}{i}"
@@ -2259,6 +2353,9 @@ def random_object_round_trip_verification(
         result_pod_path (str, optional):
             A string containing the path to the directory where the files reside in on the result pod
 
+    Returns:
+        bool: True if all the written objects were downloaded and their checksums match
+
     """
     # Verify that all needed directories exist
     io_pod.exec_cmd_on_pod(f"mkdir -p {upload_dir} {download_dir}")
@@ -2289,7 +2386,7 @@ def random_object_round_trip_verification(
     )
     downloaded_objects = io_pod.exec_cmd_on_pod(f"ls -A1 {download_dir}").split(" ")
     # Compare the checksums of the uploaded and downloaded objects
-    compare_directory(
+    checksums_match = compare_directory(
         awscli_pod=io_pod,
         original_dir=upload_dir,
         result_dir=download_dir,
@@ -2297,7 +2394,7 @@ def random_object_round_trip_verification(
         pattern=pattern,
     )
     if result_pod:
-        compare_directory(
+        checksums_match &= compare_directory(
             awscli_pod=io_pod,
             original_dir=upload_dir,
             result_dir=result_pod_path,
@@ -2308,7 +2405,7 @@ def random_object_round_trip_verification(
     if cleanup:
         io_pod.exec_cmd_on_pod(f"rm -rf {upload_dir} {download_dir}")
 
-    return set(written_objects).issubset(set(downloaded_objects))
+    return checksums_match and set(written_objects).issubset(set(downloaded_objects))
 
 
 def compare_object_checksums_between_bucket_and_local(
@@ -2341,14 +2438,14 @@ def compare_object_checksums_between_bucket_and_local(
     )
     downloaded_objects = io_pod.exec_cmd_on_pod(f"ls -A1 {local_dir}").split(" ")
     # Compare the checksums of the uploaded and downloaded objects
-    compare_directory(
+    checksums_match = compare_directory(
         awscli_pod=io_pod,
         original_dir=local_dir,
         result_dir=target_dir,
         amount=amount,
         pattern=pattern,
     )
-    return set(written_objects).issubset(set(downloaded_objects))
+    return checksums_match and set(written_objects).issubset(set(downloaded_objects))
 
 
 def create_aws_bs_using_cli(
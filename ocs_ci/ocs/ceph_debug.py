@@ -3,7 +3,7 @@ import logging
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants
 from ocs_ci.ocs.ocp import OCP
-from ocs_ci.utility.utils import exec_cmd
+from ocs_ci.utility.utils import exec_cmd, invalidate_oc_plugin_cache
 from ocs_ci.ocs.resources.deployment import get_osd_deployments, get_mon_deployments
 
 logger = logging.getLogger(__name__)
@@ -93,6 +93,7 @@ class RookCephPlugin(object):
         Install krew
         """
         exec_cmd(cmd=self.krew_install_cmd)
+        invalidate_oc_plugin_cache()
         return True
 
     def install_rook_ceph_plugin(self):
@@ -100,6 +101,7 @@ class RookCephPlugin(object):
         Install rook-ceph plugin
         """
         exec_cmd(cmd=self.rookceph_install_cmd)
+        invalidate_oc_plugin_cache()
         return True
 
     def maintenance_start(self, deployment_name, alternate_image=None, timeout=800):
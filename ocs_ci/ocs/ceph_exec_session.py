@@ -0,0 +1,325 @@
+"""
+Persistent exec session to the ceph tool box pod
+
+Pod.exec_ceph_cmd runs 'oc rsh <tools pod> ceph ...' per command, so every
+command pays the oc process startup, the API round trip and the exec stream
+setup. CephExecSession keeps one shell open in the tool box pod instead,
+either through the websocket exec stream of the in-process API backend (see
+ocs_ci.ocs.kube_api_backend) or through a long running 'oc exec -i' process,
+and runs the ceph commands in it one after another. Any number of commands can
+be sent at once by run_batch. The output of every command is terminated by a
+unique marker line carrying its exit code, on both stdout and stderr.
+
+Sessions are enabled by config.RUN["ceph_exec_session"] and are used by
+Pod.exec_ceph_cmd and Pod.exec_ceph_cmds.
+"""
+
+import atexit
+import codecs
+import logging
+import os
+import re
+import selectors
+import shlex
+import subprocess
+import threading
+import time
+import uuid
+
+from kubernetes.client import ApiClient, CoreV1Api
+from kubernetes.stream import stream
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CephExecSessionError, CommandFailed
+
+log = logging.getLogger(__name__)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def is_enabled():
+    """
+    Check whether the persistent ceph exec sessions are enabled in the config
+
+    Returns:
+        bool: True if config.RUN["ceph_exec_session"] is set
+
+    """
+    return bool(config.RUN.get("ceph_exec_session"))
+
+
+def get_session(pod):
+    """
+    Get the session to the pod, it's opened on the first use
+
+    Args:
+        pod (Pod): ceph tool box pod
+
+    Returns:
+        CephExecSession: session to the pod
+
+    """
+    key = (pod.ocp.cluster_kubeconfig, pod.namespace, pod.name)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None or session.closed:
+            session = CephExecSession(pod)
+            _sessions[key] = session
+        return session
+
+
+def close_sessions():
+    """
+    Close all the open sessions
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_sessions)
+
+
+class _WebSocketChannel(object):
+    """
+    Shell in the pod over the websocket exec stream of the API server
+    """
+
+    def __init__(self, backend, pod_name, namespace):
+        # stream() replaces the request method of the API client while the
+        # stream is being opened, so the pooled client of the backend which
+        # is shared with other threads can't be used for it
+        self.api_client = ApiClient(configuration=backend.api_client.configuration)
+        self.ws_client = stream(
+            CoreV1Api(self.api_client).connect_get_namespaced_pod_exec,
+            pod_name,
+            namespace,
+            command=["sh"],
+            stdin=True,
+            stdout=True,
+            stderr=True,
+            tty=False,
+            _preload_content=False,
+        )
+
+    def write(self, data):
+        self.ws_client.write_stdin(data)
+
+    def read(self, timeout):
+        self.ws_client.update(timeout=timeout)
+        return self.ws_client.read_stdout(), self.ws_client.read_stderr()
+
+    def is_open(self):
+        return self.ws_client.is_open()
+
+    def close(self):
+        self.ws_client.close()
+        self.api_client.close()
+
+
+class _ProcessChannel(object):
+    """
+    Shell in the pod over a long running 'oc exec -i' process
+    """
+
+    def __init__(self, cmd):
+        self.process = subprocess.Popen(
+            shlex.split(cmd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self.selector = selectors.DefaultSelector()
+        self.decoders = {}
+        for name, pipe in (
+            ("stdout", self.process.stdout),
+            ("stderr", self.process.stderr),
+        ):
+            self.selector.register(pipe, selectors.EVENT_READ, name)
+            self.decoders[name] = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def write(self, data):
+        try:
+            self.process.stdin.write(data.encode())
+            self.process.stdin.flush()
+        except (BrokenPipeError, ValueError) as ex:
+            raise CephExecSessionError(f"Exec process is not running: {ex}")
+
+    def read(self, timeout):
+        out = {"stdout": "", "stderr": ""}
+        for key, _ in self.selector.select(timeout):
+            data = os.read(key.fileobj.fileno(), 65536)
+            if not data:
+                self.selector.unregister(key.fileobj)
+                continue
+            out[key.data] += self.decoders[key.data].decode(data)
+        return out["stdout"], out["stderr"]
+
+    def is_open(self):
+        return self.process.poll() is None
+
+    def close(self):
+        self.selector.close()
+        for pipe in (self.process.stdin, self.process.stdout, self.process.stderr):
+            pipe.close()
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class CephExecSession(object):
+    """
+    Long-lived shell in the ceph tool box pod running ceph commands
+    """
+
+    def __init__(self, pod):
+        """
+        Args:
+            pod (Pod): ceph tool box pod
+
+        """
+        self.pod_name = pod.name
+        self.namespace = pod.namespace
+        self.lock = threading.Lock()
+        self.closed = False
+        self.commands = 0
+        backend = pod.ocp.get_api_backend()
+        log.info(f"Opening exec session to pod {self.pod_name}")
+        try:
+            if backend:
+                self.channel = _WebSocketChannel(backend, self.pod_name, self.namespace)
+            else:
+                self.channel = _ProcessChannel(
+                    f"{pod.ocp.get_oc_cmd_prefix()}exec -i {self.pod_name} -- sh"
+                )
+        except Exception as ex:
+            raise CephExecSessionError(
+                f"Failed to open exec session to pod {self.pod_name}: {ex}"
+            )
+
+    def close(self):
+        """
+        Close the shell and the exec stream
+        """
+        if not self.closed:
+            log.info(f"Closing exec session to pod {self.pod_name}")
+            self.closed = True
+            self.channel.close()
+
+    def run(self, command, timeout=600):
+        """
+        Run a command in the session
+
+        Args:
+            command (str): command to run, e.g. 'ceph health --format json'
+            timeout (int): timeout for the command
+
+        Returns:
+            str: stdout of the command
+
+        Raises:
+            CommandFailed: when the command returns non zero exit code or
+                when it doesn't finish in time
+            CephExecSessionError: when the session is broken
+
+        """
+        return self.run_batch([command], timeout=timeout)[0]
+
+    def run_batch(self, commands, timeout=600):
+        """
+        Send all the commands to the shell at once and read their outputs
+
+        Args:
+            commands (list): commands to run
+            timeout (int): timeout for all the commands
+
+        Returns:
+            list: stdout of the commands, in the order of the commands
+
+        Raises:
+            CommandFailed: for the first command which returns non zero exit
+                code or when the commands don't finish in time, all the
+                commands are run anyway
+            CephExecSessionError: when the session is broken
+
+        """
+        token = uuid.uuid4().hex
+        markers = [f"__ocs_ci_{token}_{index}__" for index in range(len(commands))]
+        script = "".join(
+            f"{command} </dev/null\n"
+            f"printf '\\n%s %s\\n' {marker} $?\n"
+            f"printf '\\n%s\\n' {marker} >&2\n"
+            for command, marker in zip(commands, markers)
+        )
+        with self.lock:
+            if self.closed:
+                raise CephExecSessionError(f"Session to pod {self.pod_name} is closed")
+            log.info(
+                f"Executing commands in session to pod {self.pod_name}: {commands}"
+            )
+            self.commands += len(commands)
+            stdout, stderr = self._communicate(script, markers[-1], timeout)
+
+        results = list()
+        failed = None
+        for command, marker in zip(commands, markers):
+            out_match = re.search(rf"\n{marker} (\d+)\n", stdout)
+            err_match = re.search(rf"\n{marker}\n", stderr)
+            out, stdout = stdout[: out_match.start()], stdout[out_match.end() :]
+            err, stderr = stderr[: err_match.start()], stderr[err_match.end() :]
+            returncode = int(out_match.group(1))
+            log.debug(f"Command {command} return code: {returncode}")
+            if returncode and failed is None:
+                failed = CommandFailed(
+                    f"Error during execution of command: {command}." f"\nError is {err}"
+                )
+            results.append(out)
+        if failed:
+            raise failed
+        return results
+
+    def _communicate(self, script, last_marker, timeout):
+        """
+        Write the script to the shell and read stdout and stderr until the
+        marker of the last command
+
+        Returns:
+            tuple: stdout (str), stderr (str)
+
+        """
+        out_end = re.compile(rf"\n{last_marker} \d+\n")
+        err_end = f"\n{last_marker}\n"
+        stdout = stderr = ""
+        deadline = time.monotonic() + timeout
+        try:
+            self.channel.write(script)
+            while not (out_end.search(stdout) and err_end in stderr):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # the state of the shell is unknown, it can't be reused
+                    self.close()
+                    raise CommandFailed(
+                        f"Timed out after {timeout}s waiting for commands in "
+                        f"session to pod {self.pod_name}"
+                    )
+                out, err = self.channel.read(min(remaining, 1))
+                stdout += out
+                stderr += err
+                if not (out or err or self.channel.is_open()):
+                    raise CephExecSessionError(
+                        f"Session to pod {self.pod_name} was closed, stderr: {stderr}"
+                    )
+        except CommandFailed:
+            raise
+        except CephExecSessionError:
+            self.close()
+            raise
+        except Exception as ex:
+            self.close()
+            raise CephExecSessionError(f"Session to pod {self.pod_name} failed: {ex}")
+        return stdout, stderr
@@ -184,6 +184,7 @@ class CephCluster(object):
         self.noobaa_count = 0
         self.rgw_count = 0
         self._mcg_obj = None
+        self.last_scan_duration = 0
         self.scan_cluster()
         logger.info(f"Number of mons = {self.mon_count}")
         logger.info(f"Number of mds = {self.mds_count}")
@@ -212,20 +213,35 @@ class CephCluster(object):
     def scan_cluster(self):
         """
         Get accurate info on current state of pods
+
+        All the pods of the namespace are listed once and split by the labels
+        of the ceph daemons in memory, instead of listing the pods per daemon.
         """
-        self._ceph_pods = pod.get_all_pods(self._namespace)
+        start_time = time.perf_counter()
+        pod_obj = OCP(kind=constants.POD, namespace=self._namespace)
+        pod_items = pod_obj.get()["items"]
+        self._ceph_pods = [pod.Pod(**item) for item in pod_items]
+
+        def _pods_having_label(label):
+            return [
+                pod_instance
+                for item, pod_instance in zip(pod_items, self._ceph_pods)
+                if pod.match_label_selector(item, label)
+            ]
+
         # TODO: Workaround for BZ1748325:
-        mons = pod.get_mon_pods(self.mon_selector, self.namespace)
-        self.mons = []
-        for mon in mons:
-            if mon.ocp.get_resource_status(mon.name) == constant.STATUS_RUNNING:
-                self.mons.append(mon)
+        self.mons = [
+            mon
+            for mon in _pods_having_label(self.mon_selector)
+            if pod_obj.get_item_column(mon.pod_data, "STATUS")
+            == constant.STATUS_RUNNING
+        ]
         # TODO: End of workaround for BZ1748325
-        self.mdss = pod.get_mds_pods(self.mds_selector, self.namespace)
-        self.mgrs = pod.get_mgr_pods(self.mgr_selector, self.namespace)
-        self.osds = pod.get_osd_pods(self.osd_selector, self.namespace)
-        self.noobaas = pod.get_noobaa_pods(self.noobaa_selector, self.namespace)
-        self.rgws = pod.get_rgw_pods()
+        self.mdss = _pods_having_label(self.mds_selector)
+        self.mgrs = _pods_having_label(self.mgr_selector)
+        self.osds = _pods_having_label(self.osd_selector)
+        self.noobaas = _pods_having_label(self.noobaa_selector)
+        self.rgws = _pods_having_label(constants.RGW_APP_LABEL)
         self.toolbox = pod.get_ceph_tools_pod()
 
         # set port attrib on mon pods
@@ -248,6 +264,11 @@ class CephCluster(object):
         self.osd_count = len(set([osd.name for osd in self.osds]))
         self.noobaa_count = len(set([noobaa.name for noobaa in self.noobaas]))
         self.rgw_count = len(set([rgw.name for rgw in self.rgws]))
+        self.last_scan_duration = time.perf_counter() - start_time
+        logger.info(
+            f"Cluster scan of {len(self._ceph_pods)} pods in namespace "
+            f"{self._namespace} took {self.last_scan_duration:.2f}s"
+        )
 
     @staticmethod
     def set_port(pod):
@@ -12,6 +12,7 @@ import json
 import logging
 import os
 import tempfile
+import time
 
 # 3rd party modules
 from elasticsearch import Elasticsearch, helpers, exceptions as esexp
@@ -37,72 +38,141 @@ es_log = logging.getLogger("elasticsearch")
 es_log.setLevel(logging.CRITICAL)
 
 
-def elasticsearch_load(connection, target_path):
+# Default number of docs sent in one bulk request and number of threads
+# sending the bulk requests, used for loading data into ES server
+ES_BULK_CHUNK_SIZE = 500
+ES_BULK_THREAD_COUNT = 4
+
+
+def elasticsearch_load(
+    connection,
+    target_path,
+    chunk_size=ES_BULK_CHUNK_SIZE,
+    thread_count=ES_BULK_THREAD_COUNT,
+):
     """
     Load all data from target_path/results into an elasticsearch (es) server.
 
+    The data files are read lazily, line by line, and the docs of all the
+    indices are sent by parallel bulk requests, so the files are never held
+    in memory whole.
+
     Args:
         connection (obj): an elasticsearch connection object
         target_path (str): the path where data was dumped into
+        chunk_size (int): number of docs sent in one bulk request
+        thread_count (int): number of threads sending the bulk requests
 
     Returns:
         bool: True if loading data succeed, False otherwise
 
     """
 
+    # per index: number of loaded docs, number of failed docs, time of the
+    # start of reading of the file and time of the last response
+    stats = {}
+
     # define a function that will load a text file
-    def get_data_from_text_file(json_file):
+    def get_data_from_text_file(json_file, ind_name):
         """
-        This function will return a list of docs stored in a text file.
-        the function is working as a generator, and return the records
-        one at a time.
+        This function will return the docs stored in a text file.
+        the function is working as a generator, reads the file line by line
+        and return the records one at a time.
 
         Args:
             json_file (str): the file name to look for docs in
+            ind_name (str): the name of the index to load the docs into
 
         Returns:
-             list : list of documents as json dicts
-
-        """
-
-        docs = [
-            l.strip() for l in open(str(json_file), encoding="utf8", errors="ignore")
-        ]
-        log.info(f"String docs length: {len(docs)}")
-
-        for num, doc in enumerate(docs):
-            try:
-                dict_doc = json.loads(doc)
+             generator : documents as json dicts
+
+        """
+        stats[ind_name] = {
+            "loaded": 0,
+            "failed": 0,
+            "start": time.perf_counter(),
+            "end": time.perf_counter(),
+        }
+        with open(str(json_file), encoding="utf8", errors="ignore") as fd:
+            for num, line in enumerate(fd):
+                doc = line.strip()
+                if not doc:
+                    continue
+                try:
+                    dict_doc = json.loads(doc)
+                except json.decoder.JSONDecodeError as err:
+                    # print the errors
+                    log.error(
+                        f"ERROR for num: {num} -- JSONDecodeError: {err} for doc: {doc}"
+                    )
+                    stats[ind_name]["failed"] += 1
+                    continue
+                if isinstance(dict_doc, dict):
+                    dict_doc.setdefault("_index", ind_name)
                 yield dict_doc
-            except json.decoder.JSONDecodeError as err:
-                # print the errors
-                log.error(
-                    f"ERROR for num: {num} -- JSONDecodeError: {err} for doc: {doc}"
-                )
 
-    all_files = run_command(f"ls {target_path}/results/", out_format="list")
-    if "Error in command" in all_files:
-        log.error("There is No data to load into ES server")
+    def get_all_docs(data_files):
+        for ind, file_name in data_files:
+            ind_name = ind.split(".")[0]
+            log.info(f"Loading the {ind} data into the ES server")
+            yield from get_data_from_text_file(file_name, ind_name)
+
+    results_path = os.path.join(target_path, "results")
+    try:
+        all_files = sorted(os.listdir(results_path))
+    except OSError as err:
+        log.error(f"There is No data to load into ES server: {err}")
         return False
-    else:
-        if connection is None:
-            log.warning("There is no elasticsearch server to load data into")
-            return False
-        log.info(f"The ES connection is {connection}")
-        for ind in all_files:
-            if ".data." in ind:  # load only data files and not mapping info
-                file_name = f"{target_path}/results/{ind}"
-                ind_name = ind.split(".")[0]
-                log.info(f"Loading the {ind} data into the ES server")
-
-                try:
-                    resp = helpers.bulk(
-                        connection, get_data_from_text_file(file_name), index=ind_name
-                    )
-                    log.info(f"helpers.bulk() RESPONSE: {resp}")
-                except Exception as err:
-                    log.error(f"Elasticsearch helpers.bulk() ERROR:{err}")
-        return True
+    if connection is None:
+        log.warning("There is no elasticsearch server to load data into")
+        return False
+    log.info(f"The ES connection is {connection}")
+    # load only data files and not mapping info
+    data_files = [
+        (ind, os.path.join(results_path, ind)) for ind in all_files if ".data." in ind
+    ]
+
+    start_time = time.perf_counter()
+    try:
+        for ok, item in helpers.parallel_bulk(
+            connection,
+            get_all_docs(data_files),
+            thread_count=thread_count,
+            chunk_size=chunk_size,
+            raise_on_error=False,
+            raise_on_exception=False,
+        ):
+            result = next(iter(item.values()))
+            ind_stats = stats.get(result.get("_index"))
+            if ind_stats is None:
+                # doc with its own _index, not the one of the file
+                ind_stats = stats.setdefault(
+                    result.get("_index"),
+                    {"loaded": 0, "failed": 0, "start": start_time, "end": 0},
+                )
+            if ok:
+                ind_stats["loaded"] += 1
+            else:
+                ind_stats["failed"] += 1
+                log.error(f"Elasticsearch bulk ERROR: {result.get('error')}")
+            ind_stats["end"] = time.perf_counter()
+    except Exception as err:
+        log.error(f"Elasticsearch helpers.parallel_bulk() ERROR:{err}")
+
+    total_time = time.perf_counter() - start_time
+    for ind_name, ind_stats in stats.items():
+        duration = max(ind_stats["end"] - ind_stats["start"], 1e-6)
+        log.info(
+            f"Index {ind_name}: {ind_stats['loaded']} docs loaded, "
+            f"{ind_stats['failed']} failed, "
+            f"{ind_stats['loaded'] / duration:.1f} docs/sec"
+        )
+    total_docs = sum(ind_stats["loaded"] for ind_stats in stats.values())
+    log.info(
+        f"Loaded {total_docs} docs into {len(stats)} indices in {total_time:.1f} sec "
+        f"({total_docs / max(total_time, 1e-6):.1f} docs/sec)"
+    )
+    return True
 
 
 class ElasticSearch(object):
@@ -414,21 +484,26 @@ class ElasticSearch(object):
         """
         results = []
         log.info("Getting all indices")
-        for ind in self.con.indices.get_alias("*"):
+        for ind in self.con.indices.get_alias(index="*"):
             results.append(ind)
         return results
 
-    def dumping_all_data(self, target_path):
+    def dumping_all_data(self, target_path, streaming=False):
         """
         Dump All data from the internal ES server to .tgz file.
 
         Args:
             target_path (str): the path where the results file will be copy into
+            streaming (bool): stream the docs of all the indices from the ES
+                server directly into target_path/results instead of dumping
+                them to .tgz file in the dumper pod, see dump_data_to_files
 
         Return:
             bool: True if the dump operation succeed and return the results data to the host
                   otherwise False
         """
+        if streaming:
+            return self.dump_data_to_files(target_path)
 
         log.info("dumping data from ES server to .tgz file")
         rsh_cmd = f"rsh {self.dump_pod} /elasticsearch-dump/esdumper.py --ip {self.get_ip()} --port {self.get_port()}"
@@ -452,3 +527,51 @@ class ElasticSearch(object):
                 return False
 
         return True
+
+    def dump_data_to_files(self, target_path, chunk_size=ES_BULK_CHUNK_SIZE):
+        """
+        Dump All data from the internal ES server into target_path/results,
+        in the same layout as the .tgz file of dumping_all_data: for every
+        index, <index>.mapping.json file and <index>.data.json file with one
+        doc per line, which can be loaded by elasticsearch_load.
+
+        The docs are read by scroll requests and written one at a time, so
+        they are never held in memory whole.
+
+        Args:
+            target_path (str): the path where the results will be written into
+            chunk_size (int): number of docs read by one scroll request
+
+        Return:
+            bool: True if the dump operation succeed, otherwise False
+
+        """
+        results_path = os.path.join(target_path, "results")
+        os.makedirs(results_path, exist_ok=True)
+        indices = [ind for ind in self.get_indices() if not ind.startswith(".")]
+        if not indices:
+            log.error("There is no data in the Elasticsearch server")
+            return False
+        start_time = time.perf_counter()
+        total_docs = 0
+        for ind in indices:
+            ind_start_time = time.perf_counter()
+            mapping = self.con.indices.get_mapping(index=ind)
+            with open(os.path.join(results_path, f"{ind}.mapping.json"), "w") as fd:
+                json.dump(dict(mapping), fd)
+            docs = 0
+            with open(os.path.join(results_path, f"{ind}.data.json"), "w") as fd:
+                for hit in helpers.scan(self.con, index=ind, size=chunk_size):
+                    fd.write(
+                        json.dumps({"_id": hit["_id"], "_source": hit["_source"]})
+                        + "\n"
+                    )
+                    docs += 1
+            duration = max(time.perf_counter() - ind_start_time, 1e-6)
+            log.info(f"Index {ind}: {docs} docs dumped, {docs / duration:.1f} docs/sec")
+            total_docs += docs
+        log.info(
+            f"Dumped {total_docs} docs of {len(indices)} indices into {results_path} "
+            f"in {time.perf_counter() - start_time:.1f} sec"
+        )
+        return True
@@ -770,3 +770,31 @@ class InvalidPodPresent(Exception):
 
 class FloatingIPAssignException(Exception):
     pass
+
+
+class UnknownResourceColumn(Exception):
+    pass
+
+
+class CephExecSessionError(Exception):
+    pass
+
+
+class MultiClusterTaskFailed(Exception):
+    def __init__(self, errors, results=None):
+        """
+        Args:
+            errors (dict): cluster index -> exception raised on the cluster
+            results (dict): cluster index -> result on the clusters where
+                the task succeeded
+
+        """
+        self.errors = errors
+        self.results = results or {}
+
+    def __str__(self):
+        failures = "; ".join(
+            f"cluster index {index}: {error!r}"
+            for index, error in sorted(self.errors.items())
+        )
+        return f"Task failed on {len(self.errors)} cluster(s): {failures}"
@@ -0,0 +1,552 @@
+"""
+In-process Kubernetes API backend for OCP objects
+
+By default every OCP operation spawns the oc binary and parses its output.
+When config.RUN["oc_backend"] is set to "api", OCP.get/create/delete/patch/wait
+are served by this module instead, through a kubernetes client which is created
+once per kubeconfig and which keeps a pool of persistent HTTPS connections to
+the API server. Returned data has the same shape as the parsed
+'oc ... -o yaml' output, so callers are not affected by the backend in use.
+
+Everything which is not supported here (table output, arbitrary oc commands
+passed to OCP.exec_oc_cmd, multiple kinds in one call, ...) is still handled
+by the oc binary.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+import yaml
+from kubernetes import config as kube_config
+from kubernetes import watch
+from kubernetes.client import ApiClient, Configuration
+from kubernetes.client.rest import ApiException
+from openshift.dynamic import DynamicClient, ResourceList
+from openshift.dynamic.exceptions import DynamicApiError
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed
+
+log = logging.getLogger(__name__)
+
+OC_BACKEND = "oc"
+API_BACKEND = "api"
+
+PATCH_CONTENT_TYPES = {
+    "": "application/strategic-merge-patch+json",
+    "strategic": "application/strategic-merge-patch+json",
+    "merge": "application/merge-patch+json",
+    "json": "application/json-patch+json",
+}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def is_enabled():
+    """
+    Check whether the in-process API backend is selected in the config
+
+    Returns:
+        bool: True if config.RUN["oc_backend"] is set to "api"
+
+    """
+    return config.RUN.get("oc_backend", OC_BACKEND) == API_BACKEND
+
+
+def get_backend(kubeconfig):
+    """
+    Get the API backend for the given kubeconfig. The backend is created once
+    per kubeconfig file and re-created when the file changes (e.g. after
+    re-login with a new token).
+
+    Args:
+        kubeconfig (str): path to the kubeconfig file
+
+    Returns:
+        KubeAPIBackend: backend instance
+
+    """
+    kubeconfig = os.path.realpath(kubeconfig)
+    mtime = os.stat(kubeconfig).st_mtime_ns
+    with _backends_lock:
+        backend = _backends.get(kubeconfig)
+        if backend is None or backend.kubeconfig_mtime != mtime:
+            log.debug(f"Creating Kubernetes API backend for {kubeconfig}")
+            backend = KubeAPIBackend(kubeconfig)
+            _backends[kubeconfig] = backend
+        return backend
+
+
+def reset_backends():
+    """
+    Drop all cached API backends together with their connection pools
+    """
+    with _backends_lock:
+        for backend in _backends.values():
+            backend.close()
+        _backends.clear()
+
+
+def _raw_response(client, data):
+    """
+    Serializer for DynamicClient requests returning the decoded JSON as is,
+    instead of wrapping it to ResourceInstance.
+    """
+    return data
+
+
+def _to_command_failed(ex, action):
+    """
+    Convert an API error to CommandFailed with the message formatted as by oc,
+    so the callers checking e.g. for "NotFound" in the error keep working.
+
+    Args:
+        ex (DynamicApiError): exception raised by the dynamic client
+        action (str): description of the performed action used in the message
+
+    Returns:
+        CommandFailed: exception to be raised
+
+    """
+    try:
+        body = json.loads(ex.body)
+        reason = body.get("reason") or ex.reason
+        message = body.get("message") or ex.summary()
+    except (TypeError, ValueError):
+        reason, message = ex.reason, ex.summary()
+    return CommandFailed(
+        f"Error during execution of {action}.\nError is Error from server "
+        f"({reason}): {message}"
+    )
+
+
+class KubeAPIBackend(object):
+    """
+    Pooled Kubernetes API client serving OCP operations for one kubeconfig
+    """
+
+    def __init__(self, kubeconfig):
+        """
+        Args:
+            kubeconfig (str): path to the kubeconfig file
+
+        """
+        self.kubeconfig = kubeconfig
+        self.kubeconfig_mtime = os.stat(kubeconfig).st_mtime_ns
+        configuration = Configuration()
+        kube_config.load_kube_config(
+            config_file=kubeconfig,
+            client_configuration=configuration,
+            persist_config=False,
+        )
+        # namespace oc uses when no namespace is given
+        _, active_context = kube_config.list_kube_config_contexts(
+            config_file=kubeconfig
+        )
+        self.context_namespace = (active_context or {}).get("context", {}).get(
+            "namespace"
+        ) or "default"
+        pool_maxsize = config.RUN.get("oc_backend_pool_maxsize")
+        if pool_maxsize:
+            configuration.connection_pool_maxsize = pool_maxsize
+        self.api_client = ApiClient(configuration=configuration)
+        self._dyn_client = None
+        self._resources = {}
+        self._lock = threading.Lock()
+
+    @property
+    def dyn_client(self):
+        """
+        DynamicClient is created on the first use, as it runs API discovery
+        """
+        with self._lock:
+            if self._dyn_client is None:
+                self._dyn_client = DynamicClient(self.api_client)
+            return self._dyn_client
+
+    def close(self):
+        """
+        Close the pooled connections of the backend
+        """
+        self.api_client.close()
+
+    def resource(self, kind, api_version=None):
+        """
+        Resolve the kind in the way oc does: by kind, plural, singular or
+        short name, case insensitive, optionally qualified by API group
+        (e.g. 'projects.project.openshift.io').
+
+        Args:
+            kind (str): kind of the resource
+            api_version (str): preferred API version (e.g. 'v1')
+
+        Returns:
+            Resource: dynamic client resource
+
+        Raises:
+            CommandFailed: if the server doesn't know the resource type
+
+        """
+        key = (kind.lower(), api_version)
+        if key not in self._resources:
+            self._resources[key] = self._discover(kind, api_version)
+        return self._resources[key]
+
+    def _discover(self, kind, api_version):
+        name, _, group = kind.lower().partition(".")
+        candidates = []
+        for resource_list in self.dyn_client.resources:
+            for resource in resource_list:
+                if isinstance(resource, ResourceList):
+                    continue
+                names = {
+                    resource.kind.lower(),
+                    (resource.name or "").lower(),
+                    (resource.singular_name or "").lower(),
+                }
+                names.update(n.lower() for n in resource.short_names or [])
+                if name not in names:
+                    continue
+                if group and not (resource.group or "").startswith(group):
+                    continue
+                candidates.append(resource)
+        if not candidates:
+            raise CommandFailed(
+                f'error: the server doesn\'t have a resource type "{kind}"'
+            )
+        # prefer the API version we were asked for, then core/preferred group
+        candidates.sort(
+            key=lambda r: (
+                r.group_version != api_version,
+                bool(r.group),
+                not r.preferred,
+            )
+        )
+        return candidates[0]
+
+    def get(
+        self,
+        kind,
+        api_version=None,
+        name=None,
+        namespace=None,
+        selector=None,
+        field_selector=None,
+        timeout=600,
+    ):
+        """
+        Equivalent of 'oc get <kind> [name] -o yaml'
+
+        Args:
+            kind (str): kind of the resource
+            api_version (str): preferred API version
+            name (str): name of the resource, list is returned if not provided
+            namespace (str): namespace, all namespaces if not provided
+            selector (str): label selector
+            field_selector (str): field selector
+            timeout (int): request timeout in seconds
+
+        Returns:
+            dict: the resource or a List with the resources in 'items'
+
+        """
+        resource = self.resource(kind, api_version)
+        namespace = namespace if resource.namespaced else None
+        try:
+            data = self.dyn_client.get(
+                resource,
+                name=name or None,
+                namespace=namespace,
+                label_selector=selector,
+                field_selector=field_selector,
+                serializer=_raw_response,
+                _request_timeout=timeout,
+            )
+        except DynamicApiError as ex:
+            raise _to_command_failed(ex, f"get {kind} {name or ''}")
+        if name:
+            return data
+        # oc returns the items of the list with filled kind and apiVersion
+        # in the generic 'List' kind
+        items = data.get("items") or []
+        for item in items:
+            item.setdefault("apiVersion", data.get("apiVersion"))
+            item.setdefault("kind", resource.kind)
+        return {
+            "apiVersion": "v1",
+            "items": items,
+            "kind": "List",
+            "metadata": {
+                "resourceVersion": data.get("metadata", {}).get("resourceVersion", "")
+            },
+        }
+
+    def watch(
+        self,
+        kind,
+        api_version=None,
+        namespace=None,
+        selector=None,
+        field_selector=None,
+        resource_version=None,
+        timeout=60,
+    ):
+        """
+        Stream the changes of the resources from the given resourceVersion
+
+        Args:
+            kind (str): kind of the resource
+            api_version (str): preferred API version
+            namespace (str): namespace, all namespaces if not provided
+            selector (str): label selector
+            field_selector (str): field selector
+            resource_version (str): resourceVersion to resume the watch from,
+                usually taken from the metadata of the list
+            timeout (int): timeout in seconds after which the stream ends
+
+        Yields:
+            dict: event with 'type' (ADDED, MODIFIED, DELETED, BOOKMARK) and
+                'raw_object' keys
+
+        Raises:
+            CommandFailed: when the watch failed, with 'Expired' in the message
+                when the resourceVersion is too old and the resources have
+                to be listed again
+
+        """
+        resource = self.resource(kind, api_version)
+        try:
+            for event in self.dyn_client.watch(
+                resource,
+                namespace=namespace if resource.namespaced else None,
+                label_selector=selector,
+                field_selector=field_selector,
+                resource_version=resource_version or None,
+                timeout=max(int(timeout), 1),
+                allow_watch_bookmarks=True,
+            ):
+                yield event
+        except ApiException as ex:
+            reason = "Expired" if ex.status == 410 else ex.reason
+            raise CommandFailed(
+                f"Error during execution of watch {kind}.\nError is Error from "
+                f"server ({reason}): {ex.body or ex.reason}"
+            )
+        except DynamicApiError as ex:
+            raise _to_command_failed(ex, f"watch {kind}")
+
+    def create(self, body, namespace=None, timeout=600):
+        """
+        Equivalent of 'oc create -f <file> -o yaml' for one document
+
+        Args:
+            body (dict): resource definition
+            namespace (str): namespace used when not set in the definition
+            timeout (int): request timeout in seconds
+
+        Returns:
+            dict: created resource
+
+        """
+        resource = self.resource(body["kind"], body.get("apiVersion"))
+        namespace = body.get("metadata", {}).get("namespace") or namespace
+        try:
+            return self.dyn_client.create(
+                resource,
+                body=body,
+                namespace=namespace if resource.namespaced else None,
+                serializer=_raw_response,
+                _request_timeout=timeout,
+            )
+        except DynamicApiError as ex:
+            raise _to_command_failed(
+                ex, f"create {body['kind']} {body['metadata'].get('name')}"
+            )
+
+    def delete(
+        self,
+        kind,
+        name,
+        api_version=None,
+        namespace=None,
+        wait=True,
+        force=False,
+        timeout=600,
+    ):
+        """
+        Equivalent of 'oc delete <kind> <name>'
+
+        Args:
+            kind (str): kind of the resource
+            name (str): name of the resource
+            api_version (str): preferred API version
+            namespace (str): namespace of the resource
+            wait (bool): wait till the resource is gone, as oc does by default
+            force (bool): delete with grace period 0
+            timeout (int): timeout in seconds for the deletion
+
+        Returns:
+            str: output in the format of oc ('<kind> "<name>" deleted')
+
+        """
+        resource = self.resource(kind, api_version)
+        namespace = namespace if resource.namespaced else None
+        try:
+            self.dyn_client.delete(
+                resource,
+                name=name,
+                namespace=namespace,
+                grace_period_seconds=0 if force else None,
+                serializer=_raw_response,
+                _request_timeout=timeout,
+            )
+        except DynamicApiError as ex:
+            raise _to_command_failed(ex, f"delete {kind} {name}")
+        if wait:
+            end_time = time.time() + timeout
+            while time.time() < end_time:
+                try:
+                    self.get(kind, api_version, name=name, namespace=namespace)
+                except CommandFailed as ex:
+                    if "NotFound" in str(ex):
+                        break
+                    raise
+                time.sleep(1)
+            else:
+                raise CommandFailed(
+                    f"error: timed out waiting for the deletion of {kind} {name}"
+                )
+        return f'{resource.singular_name or resource.kind.lower()} "{name}" deleted'
+
+    def patch(
+        self,
+        kind,
+        name,
+        params,
+        api_version=None,
+        namespace=None,
+        format_type="",
+        timeout=600,
+    ):
+        """
+        Equivalent of 'oc patch <kind> <name> -p <params> --type <format_type>'
+
+        Args:
+            kind (str): kind of the resource
+            name (str): name of the resource
+            params (str|dict|list): the patch, JSON/YAML string or parsed data
+            api_version (str): preferred API version
+            namespace (str): namespace of the resource
+            format_type (str): one of 'strategic' (default), 'merge', 'json'
+            timeout (int): request timeout in seconds
+
+        Returns:
+            str: output in the format of oc ('<kind>/<name> patched', with
+                ' (no change)' appended if the resource wasn't changed)
+
+        """
+        resource = self.resource(kind, api_version)
+        if isinstance(params, str):
+            params = yaml.safe_load(params)
+        namespace = namespace if resource.namespaced else None
+        # oc compares the resource before and after the patch too, the
+        # resourceVersion changes only when the resource was changed
+        before = self.get(kind, api_version=api_version, name=name, namespace=namespace)
+        try:
+            after = self.dyn_client.patch(
+                resource,
+                body=params,
+                name=name,
+                namespace=namespace,
+                content_type=PATCH_CONTENT_TYPES[format_type],
+                serializer=_raw_response,
+                _request_timeout=timeout,
+            )
+        except DynamicApiError as ex:
+            raise _to_command_failed(ex, f"patch {kind} {name}")
+        output = f"{resource.singular_name or resource.kind.lower()}/{name} patched"
+        if before["metadata"].get("resourceVersion") == after["metadata"].get(
+            "resourceVersion"
+        ):
+            output += " (no change)"
+        return output
+
+    def wait(
+        self,
+        kind,
+        condition,
+        name=None,
+        api_version=None,
+        namespace=None,
+        selector=None,
+        timeout=300,
+    ):
+        """
+        Equivalent of 'oc wait <kind> [name] --for=condition=<condition>',
+        served by a watch stream instead of polling.
+
+        Args:
+            kind (str): kind of the resource
+            condition (str): type of the condition which has to be True
+            name (str): name of the resource
+            api_version (str): preferred API version
+            namespace (str): namespace of the resource(s)
+            selector (str): label selector
+            timeout (int): timeout in seconds
+
+        Returns:
+            bool: True if all matching resources met the condition in time
+
+        """
+        resource = self.resource(kind, api_version)
+        namespace = namespace if resource.namespaced else None
+        field_selector = f"metadata.name={name}" if name else None
+        initial = self.get(
+            kind,
+            api_version,
+            namespace=namespace,
+            selector=selector,
+            field_selector=field_selector,
+        )
+        pending = {
+            item["metadata"]["name"]
+            for item in initial["items"]
+            if not self._condition_met(item, condition)
+        }
+        if initial["items"] and not pending:
+            return True
+        end_time = time.time() + timeout
+        watcher = watch.Watch()
+        while time.time() < end_time:
+            stream = self.dyn_client.watch(
+                resource,
+                namespace=namespace,
+                label_selector=selector,
+                field_selector=field_selector,
+                timeout=max(int(end_time - time.time()), 1),
+                watcher=watcher,
+            )
+            for event in stream:
+                item = event["raw_object"]
+                item_name = item.get("metadata", {}).get("name")
+                if event["type"] == "DELETED" or not self._condition_met(
+                    item, condition
+                ):
+                    pending.add(item_name)
+                else:
+                    pending.discard(item_name)
+                if not pending:
+                    watcher.stop()
+                    return True
+        return False
+
+    @staticmethod
+    def _condition_met(item, condition):
+        for cond in item.get("status", {}).get("conditions") or []:
+            if cond.get("type", "").lower() == condition.lower():
+                return cond.get("status") == "True"
+        return False
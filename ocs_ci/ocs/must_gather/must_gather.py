@@ -4,6 +4,8 @@ import shutil
 import tempfile
 import re
 import tarfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ocs_ci.framework import config
@@ -21,6 +23,164 @@ from ocs_ci.ocs.constants import MANAGED_SERVICE_PLATFORMS
 logger = logging.getLogger(__name__)
 
 
+class MustGatherIndex(object):
+    """
+    Index of the must gather directory built by one walk of the directory
+    tree, in the same top-down order as os.walk
+
+    """
+
+    def __init__(self, root):
+        """
+        Initializer function
+
+        Args:
+            root (str): The must gather directory
+
+        """
+        self.root = root
+        # basename -> full paths of the files with that name
+        self.files_by_name = defaultdict(list)
+        # full path -> size of the file, -1 if it can't be read
+        self.file_sizes = dict()
+        # full paths of the walked dirs, the root included, in the order
+        # os.walk yields them
+        self.dirs = list()
+        # full paths of all the files and dirs, files of each dir first
+        self.paths = list()
+        self._paths_text = None
+        self._build()
+
+    def _build(self):
+        stack = [self.root]
+        while stack:
+            dir_path = stack.pop()
+            files, dirs = [], []
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            dirs.append(entry)
+                        else:
+                            files.append(entry)
+            except OSError as e:
+                logger.warning(f"Failed to list {dir_path}, error: {e}")
+                continue
+            self.dirs.append(dir_path)
+            for entry in files:
+                self.files_by_name[entry.name].append(entry.path)
+                try:
+                    self.file_sizes[entry.path] = entry.stat().st_size
+                except OSError:
+                    self.file_sizes[entry.path] = -1
+            self.paths.extend(entry.path for entry in files + dirs)
+            # like os.walk, symbolic links to directories are not followed
+            stack.extend(
+                entry.path for entry in reversed(dirs) if not entry.is_symlink()
+            )
+
+    def find_file(self, name):
+        """
+        Find the file by its name
+
+        Args:
+            name (str): The file name
+
+        Returns:
+            str: Full path of the first file with the name, None if not found
+
+        """
+        paths = self.files_by_name.get(name)
+        return paths[0] if paths else None
+
+    def contains(self, path):
+        """
+        Check if the path is part of any full path in the directory, e.g.
+        ``/ceph_logs/journal_`` is part of
+        ``/mg_dir/a/b/ceph/ceph_logs/journal_compute-1/log.log``
+
+        Args:
+            path (str): The partial path
+
+        Returns:
+            bool: True if the path is part of any full path, False otherwise
+
+        """
+        if self._paths_text is None:
+            self._paths_text = "\n".join(self.paths)
+        return "\n" not in path and path in self._paths_text
+
+
+def get_pod_log_containers(root):
+    """
+    Get the containers whose logs are collected in the must gather directory,
+    the logs are stored as
+    ``namespaces/<namespace>/pods/<pod>/<container>/<container>/logs/current.log``
+
+    Args:
+        root (str): The must gather directory
+
+    Returns:
+        set: (namespace, pod name, container name) tuples
+
+    """
+    containers = set()
+    if not root or not os.path.isdir(root):
+        return containers
+    for file_path in MustGatherIndex(root).files_by_name.get("current.log", []):
+        parts = Path(file_path).parts
+        if len(parts) >= 7 and parts[-6] == "pods" and parts[-2] == "logs":
+            containers.add((parts[-7], parts[-5], parts[-3]))
+    return containers
+
+
+def file_contains(file_path, pattern):
+    """
+    Check if the file contains the pattern. The file is read line by line
+    and the reading stops on the first match.
+
+    Args:
+        file_path (str): The file to check
+        pattern (re.Pattern): Compiled pattern, matched against the lines
+            of the file
+
+    Returns:
+        bool: True if the file contains the pattern, False otherwise
+
+    """
+    with open(file_path, "r", errors="replace") as f:
+        return any(pattern.search(line) for line in f)
+
+
+def find_files_with_pattern(file_paths, pattern, workers=None):
+    """
+    Find the files containing the pattern, the files are scanned in parallel
+
+    Args:
+        file_paths (list): The files to check
+        pattern (re.Pattern): Compiled pattern, matched against the lines
+            of the files
+        workers (int): Number of files scanned at once, default is RUN
+            must_gather_scan_workers
+
+    Returns:
+        list: The files containing the pattern, in the order of file_paths
+
+    """
+    workers = workers or config.RUN.get("must_gather_scan_workers", 8)
+
+    def check(file_path):
+        try:
+            return file_contains(file_path, pattern)
+        except OSError as e:
+            logger.error(f"There is no option to read {file_path}, error: {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        matches = list(executor.map(check, file_paths))
+    return [file_path for file_path, match in zip(file_paths, matches) if match]
+
+
 class MustGather(object):
     """
     MustGather Class
@@ -36,6 +196,7 @@ class MustGather(object):
         self.files_content_issue = list()
         self.ocs_version = version.get_semantic_ocs_version_from_config()
         self.full_paths = list()
+        self._index = None
 
     @property
     def log_type(self):
@@ -47,6 +208,27 @@ class MustGather(object):
             raise ValueError("log type arg must be a string")
         self.type_log = type_log
 
+    @property
+    def index(self):
+        """
+        Index of the must gather directory, built on first use per directory
+
+        Returns:
+            MustGatherIndex: The index of the must gather directory
+
+        """
+        if self._index is None or self._index.root != self.root:
+            self._index = MustGatherIndex(self.root)
+        return self._index
+
+    def invalidate_index(self):
+        """
+        Drop the index of the must gather directory, e.g. after files were
+        added to the directory
+
+        """
+        self._index = None
+
     def collect_must_gather(self, ocs_flags=None, mg_options=None):
         """
         Collect ocs_must_gather and copy the logs to a temporary folder.
@@ -80,12 +262,11 @@ class MustGather(object):
         else:
             files = GATHER_COMMANDS_VERSION[ocs_version][self.type_log]
         for file in files:
-            self.files_not_exist.append(file)
-            for dir_name, subdir_list, files_list in os.walk(self.root):
-                if file in files_list:
-                    self.files_path[file] = os.path.join(dir_name, file)
-                    self.files_not_exist.remove(file)
-                    break
+            file_path = self.index.find_file(file)
+            if file_path:
+                self.files_path[file] = file_path
+            else:
+                self.files_not_exist.append(file)
 
     def validate_file_size(self):
         """
@@ -94,15 +275,11 @@ class MustGather(object):
         """
         if self.type_log != "OTHERS":
             return
-        for path, subdirs, files in os.walk(self.root):
-            for file in files:
-                file_path = os.path.join(path, file)
-                if (
-                    Path(file_path).stat().st_size == 0
-                    and "noobaa-db-pg-0-init.log" not in file_path
-                ):
-                    logger.error(f"log file {file} empty!")
-                    self.empty_files.append(file)
+        for file_path, size in self.index.file_sizes.items():
+            if size == 0 and "noobaa-db-pg-0-init.log" not in file_path:
+                file = os.path.basename(file_path)
+                logger.error(f"log file {file} empty!")
+                self.empty_files.append(file)
 
     def validate_expected_files(self):
         """
@@ -113,13 +290,18 @@ class MustGather(object):
         # https://bugzilla.redhat.com/show_bug.cgi?id=2125204
         # https://bugzilla.redhat.com/show_bug.cgi?id=2049204
         # self.verify_ceph_file_content()
+        yaml_files = dict()
         for file, file_path in self.files_path.items():
-            if not Path(file_path).is_file():
+            if not os.path.isfile(file_path):
                 self.files_not_exist.append(file)
             elif re.search(r"\.yaml$", file):
-                with open(file_path, "r") as f:
-                    if "kind" not in f.read().lower():
-                        self.files_content_issue.append(file)
+                yaml_files[file_path] = file
+        with_kind = find_files_with_pattern(
+            list(yaml_files), re.compile("kind", re.IGNORECASE)
+        )
+        for file_path, file in yaml_files.items():
+            if file_path not in with_kind:
+                self.files_content_issue.append(file)
 
     def verify_ceph_file_content(self):
         """
@@ -130,17 +312,13 @@ class MustGather(object):
         """
         if self.type_log != "CEPH" or self.ocs_version < version.VERSION_4_9:
             return
-        pattern = re.compile("exit code [1-9]+")
-        for root, dirs, files in os.walk(self.root):
-            for file in files:
-                try:
-                    with open(os.path.join(root, file), "r") as f:
-                        data_file = f.read()
-                    exit_code_error = pattern.findall(data_file.lower())
-                    if len(exit_code_error) > 0 and "gather-debug" not in file:
-                        self.files_content_issue.append(os.path.join(root, file))
-                except Exception as e:
-                    logger.error(f"There is no option to read {file}, error: {e}")
+        pattern = re.compile("exit code [1-9]+", re.IGNORECASE)
+        file_paths = [
+            file_path
+            for file_path in self.index.file_sizes
+            if "gather-debug" not in os.path.basename(file_path)
+        ]
+        self.files_content_issue.extend(find_files_with_pattern(file_paths, pattern))
 
     def print_must_gather_debug(self) -> None:
         try:
@@ -165,7 +343,7 @@ class MustGather(object):
             if pattern is False:
                 pod_names.append(pod.name)
 
-        for dir_name, subdir_list, files_list in os.walk(self.root):
+        for dir_name in self.index.dirs:
             if re.search("openshift-storage/pods$", dir_name):
                 pod_path = dir_name
                 break
@@ -239,15 +417,20 @@ class MustGather(object):
         if self.type_log == "OTHERS" and ocs_version >= version.VERSION_4_6:
             flag = False
             logger.info("Verify noobaa_diagnostics folder exist")
-            for path, subdirs, files in os.walk(self.root):
-                for file in files:
-                    if re.search(r"noobaa_diagnostics_.*.tar.gz", file):
-                        flag = True
-                        logger.info(f"Extract noobaa_diagnostics dir {file}")
-                        path_noobaa_diag = os.path.join(path, file)
-                        files_noobaa_diag = tarfile.open(path_noobaa_diag)
-                        files_noobaa_diag.extractall(path)
-                        break
+            noobaa_diag_paths = [
+                file_paths[0]
+                for file, file_paths in self.index.files_by_name.items()
+                if re.search(r"noobaa_diagnostics_.*.tar.gz", file)
+            ]
+            for path_noobaa_diag in noobaa_diag_paths:
+                flag = True
+                logger.info(
+                    f"Extract noobaa_diagnostics dir {os.path.basename(path_noobaa_diag)}"
+                )
+                with tarfile.open(path_noobaa_diag) as files_noobaa_diag:
+                    files_noobaa_diag.extractall(os.path.dirname(path_noobaa_diag))
+            if noobaa_diag_paths:
+                self.invalidate_index()
             if not flag:
                 logger.error("noobaa_diagnostics.tar.gz does not exist")
                 self.files_not_exist.append("noobaa_diagnostics.tar.gz")
@@ -257,10 +440,8 @@ class MustGather(object):
         Get all paths in must gather dir
 
         """
-        for root, dirs, files in os.walk(self.root):
-            for name in files + dirs:
-                full_path = os.path.join(root, name)
-                self.full_paths.append(full_path)
+        self.invalidate_index()
+        self.full_paths = list(self.index.paths)
 
     def verify_paths_in_dir(self, paths):
         """
@@ -274,15 +455,7 @@ class MustGather(object):
             list: the paths do not exist in mg dir
 
         """
-        paths_exist = []
-        for path in paths:
-            status = False
-            for full_path in self.full_paths:
-                if path in full_path:
-                    status = True
-            if not status:
-                paths_exist.append(path)
-        return paths_exist
+        return [path for path in paths if not self.index.contains(path)]
 
     def verify_paths_not_in_dir(self, paths):
         """
@@ -296,15 +469,7 @@ class MustGather(object):
             list: the paths exist in mg dir
 
         """
-        paths_not_exist = []
-        for path in paths:
-            status = True
-            for full_path in self.full_paths:
-                if path in full_path:
-                    status = False
-            if not status:
-                paths_not_exist.append(path)
-        return paths_not_exist
+        return [path for path in paths if self.index.contains(path)]
 
     def validate_must_gather(self):
         """
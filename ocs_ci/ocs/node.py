@@ -1,6 +1,7 @@
 import copy
 import logging
 import re
+import threading
 import time
 from prettytable import PrettyTable
 from collections import defaultdict
@@ -18,14 +19,12 @@ from ocs_ci.ocs.exceptions import (
     HostNameNotFoundInOSDStatus,
     TimeoutExpiredError,
     NotAllNodesCreated,
-    CommandFailed,
     ResourceNotFoundError,
-    NotFoundError,
 )
 from ocs_ci.ocs.machinepool import MachinePools
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.ocs import OCS
-from ocs_ci.ocs import constants, exceptions, ocp, defaults
+from ocs_ci.ocs import constants, exceptions, ocp, defaults, resource_columns
 from ocs_ci.ocs.resources.pvc import get_pvc_size
 from ocs_ci.utility import version
 from ocs_ci.utility.retry import retry
@@ -51,6 +50,9 @@ from ocs_ci.utility.vsphere import VSPHERE
 
 log = logging.getLogger(__name__)
 
+_node_view_cache = {}
+_node_view_cache_lock = threading.Lock()
+
 
 def get_node_objs(node_names=None):
     """
@@ -78,7 +80,167 @@ def get_node_objs(node_names=None):
     return nodes
 
 
-def get_nodes(node_type=constants.WORKER_MACHINE, num_of_nodes=None):
+class NodeView(object):
+    """
+    Snapshot of the cluster nodes taken from a single listing of the nodes.
+    The roles of the nodes are derived from the node-role.kubernetes.io
+    labels and the status from the node conditions of the listed objects, so
+    no per node requests are needed.
+
+    """
+
+    def __init__(self, node_dicts):
+        """
+        Initializer function
+
+        Args:
+            node_dicts (list): The node dicts of the nodes listing
+
+        """
+        self.node_dicts = node_dicts
+        self.timestamp = time.monotonic()
+        self._by_name = {item["metadata"]["name"]: item for item in node_dicts}
+
+    @classmethod
+    def fetch(cls):
+        """
+        Take the snapshot of the current cluster nodes
+
+        Returns:
+            NodeView: The nodes snapshot
+
+        """
+        return cls(OCP(kind=constants.NODE).get()["items"])
+
+    @property
+    def age(self):
+        """
+        Seconds passed since the snapshot was taken
+        """
+        return time.monotonic() - self.timestamp
+
+    @property
+    def names(self):
+        """
+        Names of the nodes, in the order of the listing
+        """
+        return list(self._by_name)
+
+    def roles(self, node_name):
+        """
+        Get the node roles, e.g. ['master', 'worker']
+
+        Args:
+            node_name (str): The node name
+
+        Returns:
+            list: The node roles, empty if the node has no role or it wasn't
+                listed
+
+        """
+        node_dict = self._by_name.get(node_name)
+        if node_dict is None:
+            return []
+        roles = resource_columns.node_roles(node_dict)
+        return [] if roles == "<none>" else roles.split(",")
+
+    def status(self, node_name):
+        """
+        Get the node status the way 'oc get node' shows it, e.g. 'Ready' or
+        'Ready,SchedulingDisabled'
+
+        Args:
+            node_name (str): The node name
+
+        Returns:
+            str: The node status, None if the node wasn't listed
+
+        """
+        node_dict = self._by_name.get(node_name)
+        if node_dict is None:
+            return None
+        return resource_columns.node_status(node_dict)
+
+    def names_with_role(self, role, exclude_roles=None):
+        """
+        Get names of the nodes having the role
+
+        Args:
+            role (str): The node role (e.g. worker, master)
+            exclude_roles (list): Skip the nodes having any of these roles
+
+        Returns:
+            list: The node names
+
+        """
+        exclude_roles = set(exclude_roles or [])
+        names = []
+        for name in self._by_name:
+            roles = self.roles(name)
+            if role in roles and not exclude_roles.intersection(roles):
+                names.append(name)
+        return names
+
+    def get_objs(self, node_names=None):
+        """
+        Get node objects of the snapshot
+
+        Args:
+            node_names (list): The node names to get their objects for.
+                If None, objects of all the nodes are returned
+
+        Returns:
+            list: Node OCS objects, in the order of the listing
+
+        """
+        return [
+            OCS(**copy.deepcopy(node_dict))
+            for name, node_dict in self._by_name.items()
+            if node_names is None or name in node_names
+        ]
+
+
+def get_node_view(max_age=None):
+    """
+    Get the snapshot of the cluster nodes. The snapshot of the current
+    cluster context is reused while it is younger than max_age, otherwise
+    the nodes are listed again.
+
+    Args:
+        max_age (float): Maximal age of the reused snapshot in seconds, 0 to
+            always list the nodes. Default is RUN node_view_cache_ttl, which
+            is 0 unless configured, since the nodes can be changed by paths
+            which don't call invalidate_node_view.
+
+    Returns:
+        NodeView: The nodes snapshot
+
+    """
+    if max_age is None:
+        max_age = config.RUN.get("node_view_cache_ttl", 0)
+    cache_key = config.cluster_ctx.MULTICLUSTER.get("multicluster_index")
+    if max_age:
+        with _node_view_cache_lock:
+            node_view = _node_view_cache.get(cache_key)
+        if node_view and node_view.age < max_age:
+            log.debug(f"Using nodes snapshot taken {node_view.age:.1f}s ago")
+            return node_view
+    node_view = NodeView.fetch()
+    with _node_view_cache_lock:
+        _node_view_cache[cache_key] = node_view
+    return node_view
+
+
+def invalidate_node_view():
+    """
+    Drop the cached snapshots of the nodes, e.g. after the nodes were added,
+    removed or relabeled
+    """
+    with _node_view_cache_lock:
+        _node_view_cache.clear()
+
+
+def get_nodes(node_type=constants.WORKER_MACHINE, num_of_nodes=None, max_age=None):
     """
     Get cluster's nodes according to the node type (e.g. worker, master) and the
     number of requested nodes from that type.
@@ -87,6 +249,8 @@ def get_nodes(node_type=constants.WORKER_MACHINE, num_of_nodes=None):
     Args:
         node_type (str): The node type (e.g. worker, master)
         num_of_nodes (int): The number of nodes to be returned
+        max_age (float): Maximal age in seconds of the reused nodes snapshot,
+            see get_node_view
 
     Returns:
         list: The nodes OCP instances
@@ -94,33 +258,16 @@ def get_nodes(node_type=constants.WORKER_MACHINE, num_of_nodes=None):
     """
     from ocs_ci.ocs.cluster import is_hci_provider_cluster
 
-    if (
-        config.ENV_DATA["platform"].lower() in constants.MANAGED_SERVICE_PLATFORMS
-        and node_type == constants.WORKER_MACHINE
-    ):
-        typed_nodes = [
-            node
-            for node in get_node_objs()
-            if node_type
-            in node.ocp.get_resource(resource_name=node.name, column="ROLES")
-            and constants.INFRA_MACHINE
-            not in node.ocp.get_resource(resource_name=node.name, column="ROLES")
-        ]
-    else:
-        typed_nodes = [
-            node
-            for node in get_node_objs()
-            if node_type
-            in node.ocp.get_resource(resource_name=node.name, column="ROLES")
-        ]
-    if is_hci_provider_cluster() and node_type == constants.WORKER_MACHINE:
-        typed_nodes = [
-            node
-            for node in typed_nodes
-            if constants.MASTER_MACHINE
-            not in node.ocp.get_resource(resource_name=node.name, column="ROLES")
-        ]
-
+    exclude_roles = []
+    if node_type == constants.WORKER_MACHINE:
+        if config.ENV_DATA["platform"].lower() in constants.MANAGED_SERVICE_PLATFORMS:
+            exclude_roles.append(constants.INFRA_MACHINE)
+        if is_hci_provider_cluster():
+            exclude_roles.append(constants.MASTER_MACHINE)
+    node_view = get_node_view(max_age)
+    typed_nodes = node_view.get_objs(
+        node_view.names_with_role(node_type, exclude_roles=exclude_roles)
+    )
     if num_of_nodes:
         typed_nodes = typed_nodes[:num_of_nodes]
     return typed_nodes
@@ -177,21 +324,17 @@ def wait_for_nodes_status(
     """
     try:
         if not node_names:
-            for sample in TimeoutSampler(60, 3, get_node_objs):
-                if sample:
-                    node_names = [node.name for node in sample]
+            for sample in TimeoutSampler(60, 3, get_node_view, 0):
+                if sample.names:
+                    node_names = sample.names
                     break
         nodes_not_in_state = copy.deepcopy(node_names)
         log.info(f"Waiting for nodes {node_names} to reach status {status}")
-        for sample in TimeoutSampler(timeout, sleep, get_node_objs, nodes_not_in_state):
-            for node in sample:
-                try:
-                    if node.ocp.get_resource_status(node.name) == status:
-                        log.info(f"Node {node.name} reached status {status}")
-                        nodes_not_in_state.remove(node.name)
-                except CommandFailed as ex:
-                    log.info(f"failed to get the node status by error {ex}")
-                    continue
+        for node_view in TimeoutSampler(timeout, sleep, get_node_view, 0):
+            for node_name in list(nodes_not_in_state):
+                if node_view.status(node_name) == status:
+                    log.info(f"Node {node_name} reached status {status}")
+                    nodes_not_in_state.remove(node_name)
             if not nodes_not_in_state:
                 break
         log.info(f"The following nodes reached status {status}: {node_names}")
@@ -218,6 +361,7 @@ def unschedule_nodes(node_names):
     node_names_str = " ".join(node_names)
     log.info(f"Unscheduling nodes {node_names_str}")
     ocp.exec_oc_cmd(f"adm cordon {node_names_str}")
+    invalidate_node_view()
 
     wait_for_nodes_status(node_names, status=constants.NODE_READY_SCHEDULING_DISABLED)
 
@@ -233,6 +377,7 @@ def schedule_nodes(node_names):
     ocp = OCP(kind="node")
     node_names_str = " ".join(node_names)
     ocp.exec_oc_cmd(f"adm uncordon {node_names_str}")
+    invalidate_node_view()
     log.info(f"Scheduling nodes {node_names_str}")
     wait_for_nodes_status(node_names)
 
@@ -321,6 +466,7 @@ def remove_nodes(nodes):
     # delete the nodes
     log.info(f"Deleting nodes {node_names_str}")
     ocp.exec_oc_cmd(f"delete nodes {node_names_str}")
+    invalidate_node_view()
 
 
 def get_node_ips(node_type="worker"):
@@ -410,6 +556,7 @@ def add_new_node_and_label_it(machineset_name, num_nodes=1, mark_for_ocs_label=T
     # wait for the new node to come to ready state
     log.info("Waiting for the new node to be in ready state")
     machine.wait_for_new_node_to_be_ready(machineset_name, timeout=900)
+    invalidate_node_view()
 
     # Get the node name of new spun node
     nodes_after_new_spun_node = get_worker_nodes()
@@ -429,6 +576,7 @@ def add_new_node_and_label_it(machineset_name, num_nodes=1, mark_for_ocs_label=T
                     resource_name=new_spun_node, label=constants.OPERATOR_NODE_LABEL
                 )
                 log.info(f"Successfully labeled {new_spun_node} with OCS storage label")
+        invalidate_node_view()
 
     return new_spun_nodes
 
@@ -456,6 +604,7 @@ def add_new_node_and_label_upi(
     plt = PlatformNodesFactory()
     node_util = plt.get_nodes_platform()
     node_util.create_and_attach_nodes_to_cluster(node_conf, node_type, num_nodes)
+    invalidate_node_view()
     for sample in TimeoutSampler(timeout=600, sleep=6, func=get_worker_nodes):
         if len(sample) == len(initial_nodes) + num_nodes:
             break
@@ -480,6 +629,7 @@ def add_new_node_and_label_upi(
                 resource_name=new_spun_node, label=constants.OPERATOR_NODE_LABEL
             )
             log.info(f"Successfully labeled {new_spun_node} with OCS storage label")
+        invalidate_node_view()
     return new_spun_nodes
 
 
@@ -514,6 +664,7 @@ def add_new_nodes_and_label_them_rosa_hcp(
     node_util = plt.get_nodes_platform()
 
     node_util.create_and_attach_nodes_to_cluster(node_conf, node_type, num_nodes)
+    invalidate_node_view()
     nodes_after_exp = get_worker_nodes()
     wait_for_nodes_status(node_names=get_worker_nodes(), status=constants.NODE_READY)
 
@@ -525,6 +676,7 @@ def add_new_nodes_and_label_them_rosa_hcp(
                 resource_name=new_spun_node, label=constants.OPERATOR_NODE_LABEL
             )
             log.info(f"Successfully labeled {new_spun_node} with OCS storage label")
+        invalidate_node_view()
     return new_spun_nodes
 
 
@@ -735,7 +887,11 @@ def get_osd_running_nodes():
         list: OSD node names
 
     """
-    return list({pod.get_pod_node(osd_node).name for osd_node in pod.get_osd_pods()})
+    osd_pods = pod.get_osd_pods()
+    pods_node_names = pod.get_pods_node_names(osd_pods)
+    return list(
+        {pod.get_pod_node_name(osd_pod, pods_node_names) for osd_pod in osd_pods}
+    )
 
 
 def get_osds_per_node():
@@ -764,7 +920,8 @@ def get_app_pod_running_nodes(pod_obj):
         list: App pod running node names
 
     """
-    return [pod.get_pod_node(obj_pod).name for obj_pod in pod_obj]
+    pods_node_names = pod.get_pods_node_names(pod_obj)
+    return [pod.get_pod_node_name(obj_pod, pods_node_names) for obj_pod in pod_obj]
 
 
 def get_both_osd_and_app_pod_running_node(osd_running_nodes, app_pod_running_nodes):
@@ -980,6 +1137,7 @@ def delete_and_create_osd_node_ipi(osd_node_name):
     new_machine_name = machine.delete_machine_and_check_state_of_new_spinned_machine(
         machine_name
     )
+    invalidate_node_view()
     if config.ENV_DATA.get("worker_replicas") == 0:
         new_node_name = get_node_from_machine_name(new_machine_name)
         log.info("Waiting for new worker node to be in ready state")
@@ -999,6 +1157,7 @@ def delete_and_create_osd_node_ipi(osd_node_name):
             resource_name=new_node_name, label=constants.OPERATOR_NODE_LABEL
         )
         log.info(f"Successfully labeled {new_node_name} with OCS storage label")
+        invalidate_node_view()
 
     log.info(f"Wait for the old machine {machine_name} to be deleted")
     if config.ENV_DATA.get("worker_replicas") == 0:
@@ -1048,6 +1207,7 @@ def delete_and_create_osd_node_managed_cp(osd_node_name):
     osd_node_objs = get_node_objs([osd_node_name])
     node_util.stop_nodes(osd_node_objs)
     node_util.terminate_nodes(osd_node_objs)
+    invalidate_node_view()
     machne_pools = MachinePools(config.ENV_DATA["cluster_name"])
     mp_filtered = machne_pools.filter(machinepool_id=config.ENV_DATA["machine_pool"])
     mp_filtered.wait_replicas_ready(
@@ -1075,6 +1235,7 @@ def delete_and_create_osd_node_managed_cp(osd_node_name):
             resource_name=new_node_name, label=constants.OPERATOR_NODE_LABEL
         )
         log.info(f"Successfully labeled {new_node_names} with OCS storage label")
+        invalidate_node_view()
 
     return new_node_name
 
@@ -1305,6 +1466,7 @@ def label_nodes(nodes, label=constants.OPERATOR_NODE_LABEL):
         log.info(
             f"Successfully labeled {new_node_to_label.name} " f"with OCS storage label"
         )
+    invalidate_node_view()
 
 
 def get_master_nodes():
@@ -1664,19 +1826,26 @@ def get_node_pods(node_name, pods_to_search=None, raise_pod_not_found_error=Fals
         list: list of all the pods of the specified node
 
     """
-    node_pods = []
-    pods_to_search = pods_to_search or pod.get_all_pods()
+    if not pods_to_search:
+        # the pods of the node are selected by the server
+        return pod.get_all_pods(field_selector=f"spec.nodeName={node_name}")
 
+    node_pods = []
+    pods_node_names = pod.get_pods_node_names(pods_to_search)
     for p in pods_to_search:
-        try:
-            if pod.get_pod_node(p).name == node_name:
-                node_pods.append(p)
-        # Check if the command failed because the pod not found
-        except (CommandFailed, NotFoundError) as ex:
-            if "not found" not in str(ex):
-                raise ex
+        pod_node_name = pods_node_names.get((p.namespace, p.name))
+        if pod_node_name == node_name:
+            node_pods.append(p)
+        elif not pod_node_name:
             # Check the 2 cases of pod not found error
-            pod_not_found_error_message = f"Failed to get the pod node of the pod {p.name} due to the exception {ex}"
+            reason = (
+                "the pod is not scheduled"
+                if (p.namespace, p.name) in pods_node_names
+                else "the pod is not found"
+            )
+            pod_not_found_error_message = (
+                f"Failed to get the pod node of the pod {p.name}, {reason}"
+            )
             if raise_pod_not_found_error:
                 raise ResourceNotFoundError(pod_not_found_error_message)
             else:
@@ -2057,15 +2226,15 @@ def get_nodes_in_statuses(statuses, node_objs=None):
         list: OCP objects representing the nodes in the specific statuses
 
     """
+    node_view = get_node_view(0)
     if not node_objs:
-        node_objs = get_node_objs()
+        node_objs = node_view.get_objs()
 
     nodes_in_statuses = []
     for n in node_objs:
-        try:
-            node_status = get_node_status(n)
-        except CommandFailed as e:
-            log.warning(f"Failed to get the node status due to the error: {str(e)}")
+        node_status = node_view.status(n.name)
+        if node_status is None:
+            log.warning(f"Failed to get the status of the node {n.name}")
             continue
 
         if node_status in statuses:
@@ -2126,7 +2295,7 @@ def get_nodes_where_ocs_pods_running():
 
     """
     pods_openshift_storage = pod.get_all_pods(
-        namespace=config.ENV_DATA["cluster_namespace"]
+        namespace=config.ENV_DATA["cluster_namespace"], use_cache=True
     )
     ocs_nodes = list()
     for pod_obj in pods_openshift_storage:
@@ -2495,9 +2664,17 @@ def get_node_rook_ceph_pod_names(node_name):
         list: The rook ceph pod names associated with the node
 
     """
-    rook_ceph_pods = pod.get_pod_objs(pod.get_rook_ceph_pod_names())
-    node_rook_ceph_pods = get_node_pods(node_name, rook_ceph_pods)
-    return [p.name for p in node_rook_ceph_pods]
+    node_pods = pod.get_all_pods(
+        namespace=config.ENV_DATA["cluster_namespace"],
+        field_selector=f"spec.nodeName={node_name}",
+        use_cache=True,
+    )
+    # Exclude the rook ceph pod tools because it creates by OCS and not rook ceph operator
+    return [
+        p.name
+        for p in node_pods
+        if "rook-ceph-" in p.name and not p.name.startswith("rook-ceph-tools-")
+    ]
 
 
 def get_node_internal_ip(node_obj):
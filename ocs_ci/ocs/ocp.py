@@ -19,14 +19,15 @@ from ocs_ci.ocs.exceptions import (
     ResourceWrongStatusException,
     ResourceNameNotSpecifiedException,
     TimeoutExpiredError,
+    UnknownResourceColumn,
 )
 from ocs_ci.utility.proxy import update_kubeconfig_with_proxy_url_for_client
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.utility.utils import exec_cmd, run_cmd, update_container_with_mirrored_image
 from ocs_ci.utility.templating import dump_data_to_temp_yaml, load_yaml
-from ocs_ci.utility import version
-from ocs_ci.ocs import constants
+from ocs_ci.utility import parsing, version
+from ocs_ci.ocs import constants, kube_api_backend, resource_columns
 from ocs_ci.framework import config
 
 
@@ -142,6 +143,71 @@ class OCP(object):
         """
         self._data = self.get()
 
+    def get_api_backend(self, cluster_config=None):
+        """
+        Get the in-process Kubernetes API backend for this object, if it's
+        enabled by config.RUN["oc_backend"], see ocs_ci.ocs.kube_api_backend
+
+        Args:
+            cluster_config (MultiClusterConfig): config of the cluster, the
+                cluster where the resource was created is used if not provided
+
+        Returns:
+            KubeAPIBackend: backend instance or None if oc binary has to be used
+
+        """
+        if not kube_api_backend.is_enabled() or self.skip_tls_verify:
+            return None
+        if not cluster_config:
+            cluster_config = config
+            if (
+                config.multicluster
+                and self.cluster_context is not None
+                and config.cluster_ctx.MULTICLUSTER.get("multicluster_index")
+                != self.cluster_context
+            ):
+                cluster_config = config.clusters[self.cluster_context]
+        kubeconfig = None
+        if self.cluster_kubeconfig and os.path.exists(self.cluster_kubeconfig):
+            kubeconfig = self.cluster_kubeconfig
+        else:
+            cluster_dir_kubeconfig = os.path.join(
+                cluster_config.ENV_DATA["cluster_path"],
+                cluster_config.RUN.get("kubeconfig_location"),
+            )
+            for path in (
+                cluster_dir_kubeconfig,
+                cluster_config.RUN.get("kubeconfig"),
+                os.getenv("KUBECONFIG"),
+            ):
+                if path and os.path.exists(path):
+                    kubeconfig = path
+                    break
+        if not kubeconfig:
+            return None
+        return kube_api_backend.get_backend(kubeconfig)
+
+    def get_api_namespace(self, api_backend, all_namespaces=False):
+        """
+        Get the namespace of the API backend request, chosen in the same way
+        as oc does it for the command of this object: the namespace of the
+        object, all namespaces if requested, the namespace of the current
+        kubeconfig context otherwise
+
+        Args:
+            api_backend (KubeAPIBackend): The backend of the request
+            all_namespaces (bool): Whether all namespaces are requested
+
+        Returns:
+            str: The namespace, None for all namespaces
+
+        """
+        if self.namespace:
+            return self.namespace
+        if all_namespaces:
+            return None
+        return api_backend.context_namespace
+
     def exec_oc_cmd(
         self,
         command,
@@ -190,25 +256,9 @@ class OCP(object):
             original_context = config.cluster_ctx.MULTICLUSTER.get("multicluster_index")
             config.switch_ctx(self.cluster_context)
 
-        oc_cmd = "oc "
-        env_kubeconfig = None
+        oc_cmd = self.get_oc_cmd_prefix(cluster_config)
         if not cluster_config:
             cluster_config = config
-            env_kubeconfig = os.getenv("KUBECONFIG")
-        kubeconfig_path = (
-            self.cluster_kubeconfig if os.path.exists(self.cluster_kubeconfig) else None
-        )
-
-        if kubeconfig_path or not env_kubeconfig or not os.path.exists(env_kubeconfig):
-            cluster_dir_kubeconfig = kubeconfig_path or os.path.join(
-                cluster_config.ENV_DATA["cluster_path"],
-                cluster_config.RUN.get("kubeconfig_location"),
-            )
-            if os.path.exists(cluster_dir_kubeconfig):
-                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
-
-        if self.namespace:
-            oc_cmd += f"-n {self.namespace} "
         if skip_tls_verify or self.skip_tls_verify:
             command += " --insecure-skip-tls-verify"
 
@@ -232,12 +282,46 @@ class OCP(object):
             pass
 
         if out_yaml_format:
-            return yaml.safe_load(out)
+            return parsing.load_output(out)
 
         if original_context:
             config.switch_ctx(original_context)
         return out
 
+    def get_oc_cmd_prefix(self, cluster_config=None):
+        """
+        Get the beginning of the oc command for this object, with the
+        kubeconfig and namespace options
+
+        Args:
+            cluster_config (MultiClusterConfig): cluster_config will be used only in the context of multiclsuter
+                executions
+
+        Returns:
+            str: oc command prefix, e.g. 'oc --kubeconfig <path> -n <namespace> '
+
+        """
+        oc_cmd = "oc "
+        env_kubeconfig = None
+        if not cluster_config:
+            cluster_config = config
+            env_kubeconfig = os.getenv("KUBECONFIG")
+        kubeconfig_path = (
+            self.cluster_kubeconfig if os.path.exists(self.cluster_kubeconfig) else None
+        )
+
+        if kubeconfig_path or not env_kubeconfig or not os.path.exists(env_kubeconfig):
+            cluster_dir_kubeconfig = kubeconfig_path or os.path.join(
+                cluster_config.ENV_DATA["cluster_path"],
+                cluster_config.RUN.get("kubeconfig_location"),
+            )
+            if os.path.exists(cluster_dir_kubeconfig):
+                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
+
+        if self.namespace:
+            oc_cmd += f"-n {self.namespace} "
+        return oc_cmd
+
     @retry(CommandFailed, tries=3, delay=30, backoff=1)
     def exec_oc_debug_cmd(
         self, node, cmd_list, timeout=300, namespace="default", use_root=True
@@ -299,7 +383,8 @@ class OCP(object):
 
         Args:
             resource_name (str): The resource name to fetch
-            out_yaml_format (bool): Adding '-o yaml' to oc command
+            out_yaml_format (bool): Adding '-o json' to oc command and returning
+                the parsed output
             selector (str): The label selector to look for.
             all_namespaces (bool): Equal to oc get <resource> -A
             retry (int): Number of attempts to retry to get resource
@@ -324,20 +409,33 @@ class OCP(object):
         field_selector = field_selector if field_selector else self.field_selector
         if selector or field_selector:
             resource_name = ""
+        api_backend = None
+        if out_yaml_format and not ("," in self.kind or " " in resource_name):
+            api_backend = self.get_api_backend(cluster_config)
         command = f"get {self.kind} {resource_name}"
         if all_namespaces and not self.namespace:
             command += " -A"
         elif self.namespace:
             command += f" -n {self.namespace}"
+        # set based selectors contain spaces and parentheses
         if selector is not None:
-            command += f" --selector={selector}"
+            command += f" --selector={shlex.quote(selector)}"
         if field_selector is not None:
-            command += f" --field-selector={field_selector}"
+            command += f" --field-selector={shlex.quote(field_selector)}"
         if out_yaml_format:
-            command += " -o yaml"
+            command += " -o json"
         retry += 1
         while retry:
             try:
+                if api_backend and not skip_tls_verify:
+                    return api_backend.get(
+                        self.kind,
+                        api_version=self.api_version,
+                        name=resource_name,
+                        namespace=self.get_api_namespace(api_backend, all_namespaces),
+                        selector=selector,
+                        field_selector=field_selector,
+                    )
                 return self.exec_oc_cmd(
                     command,
                     silent=silent,
@@ -451,12 +549,50 @@ class OCP(object):
             if config.RUN["resource_checker"]:
                 config.RUN["RESOURCE_DICT_TEST"][self.kind] = resource_name
         if out_yaml_format:
-            command += " -o yaml"
-        output = self.exec_oc_cmd(command)
+            command += " -o json"
+        api_backend = self.get_api_backend() if yaml_file and out_yaml_format else None
+        if api_backend:
+            output = self._create_with_api_backend(api_backend, yaml_file)
+        else:
+            output = self.exec_oc_cmd(command)
         log.debug(f"{yaml.dump(output)}")
         self.cluster_context = config.cluster_ctx.MULTICLUSTER.get("multicluster_index")
         return output
 
+    def _create_with_api_backend(self, api_backend, yaml_file):
+        """
+        Create resources from the yaml file through the API backend
+
+        Args:
+            api_backend (KubeAPIBackend): backend to use
+            yaml_file (str): Path to a yaml file with one or more documents
+
+        Returns:
+            dict: created resource, or List of them for more documents
+
+        """
+        with open(yaml_file) as fd:
+            docs = []
+            for doc in yaml.safe_load_all(fd):
+                if not doc:
+                    continue
+                if doc.get("kind") == "List":
+                    docs.extend(doc.get("items", []))
+                else:
+                    docs.append(doc)
+        created = [
+            api_backend.create(doc, namespace=self.get_api_namespace(api_backend))
+            for doc in docs
+        ]
+        if len(created) == 1:
+            return created[0]
+        return {
+            "apiVersion": "v1",
+            "items": created,
+            "kind": "List",
+            "metadata": {"resourceVersion": ""},
+        }
+
     def delete(
         self, yaml_file=None, resource_name="", wait=True, force=False, timeout=600
     ):
@@ -484,6 +620,17 @@ class OCP(object):
                 "At least one of resource_name or yaml_file have to " "be provided"
             )
 
+        api_backend = self.get_api_backend()
+        if api_backend and resource_name and " " not in resource_name:
+            return api_backend.delete(
+                self.kind,
+                resource_name,
+                api_version=self.api_version,
+                namespace=self.get_api_namespace(api_backend),
+                wait=wait,
+                force=force,
+                timeout=timeout,
+            )
         command = "delete "
         if resource_name:
             command += f"{self.kind} {resource_name}"
@@ -524,13 +671,24 @@ class OCP(object):
 
         """
         resource_name = resource_name or self.resource_name
+        api_backend = self.get_api_backend()
+        if api_backend:
+            result = api_backend.patch(
+                self.kind,
+                resource_name,
+                params,
+                api_version=self.api_version,
+                namespace=self.get_api_namespace(api_backend),
+                format_type=format_type,
+            )
+            return "patched" in result and "(no change)" not in result
         params = "'" + f"{params}" + "'"
         command = f"patch {self.kind} {resource_name} -n {self.namespace} -p {params}"
         if format_type:
             command += f" --type {format_type}"
         log.info(f"Command: {command}")
         result = self.exec_oc_cmd(command)
-        if "patched" in result:
+        if "patched" in result and "(no change)" not in result:
             return True
         return False
 
@@ -555,6 +713,20 @@ class OCP(object):
 
         """
         resource_name = resource_name if resource_name else self.resource_name
+        api_backend = self.get_api_backend()
+        if api_backend:
+            try:
+                return api_backend.wait(
+                    self.kind,
+                    condition,
+                    name=resource_name,
+                    api_version=self.api_version,
+                    namespace=self.get_api_namespace(api_backend),
+                    selector=selector,
+                    timeout=timeout,
+                )
+            except CommandFailed:
+                return False
         command = f"wait {self.kind} {resource_name} --for=condition={condition}"
         if timeout:
             command += f" --timeout={timeout}s"
@@ -762,10 +934,15 @@ class OCP(object):
         sleep=3,
         dont_allow_other_resources=False,
         error_condition=None,
+        use_watch=None,
     ):
         """
         Wait for a resource to reach to a desired condition
 
+        The column values are computed from the objects of the single 'oc get'
+        per sample (see ocs_ci.ocs.resource_columns), the table output of oc
+        is parsed per resource only for the columns which can't be computed.
+
         Args:
             condition (str): The desired state the resource that is sampled
                 from 'oc get <kind> <resource_name>' command
@@ -790,6 +967,11 @@ class OCP(object):
                 unrecoverable state of the resource(s) which is not expected to
                 be part of a workflow under test, and at the same time, the
                 timeout itself is large.
+            use_watch (bool): If True, the resources are sampled on each change
+                reported by the watch stream of the API server instead of
+                polling every `sleep` seconds. It's used only with the in-process
+                API backend (RUN["oc_backend"] = "api"). Default is taken from
+                RUN["wait_for_resource_watch"].
 
         Returns:
             bool: True in case all resources reached desired condition,
@@ -819,19 +1001,41 @@ class OCP(object):
         # now prevents UnboundLocalError raised when waiting timeouts
         actual_status = None
 
-        try:
-            for sample in TimeoutSampler(
+        if use_watch is None:
+            use_watch = config.RUN.get("wait_for_resource_watch", False)
+        api_backend = self.get_api_backend() if use_watch else None
+        if api_backend:
+            samples = self._watch_resource_samples(
+                api_backend, resource_name, selector, timeout
+            )
+        else:
+            samples = TimeoutSampler(
                 timeout, sleep, self.get, resource_name, True, selector
-            ):
+            )
+
+        try:
+            for sample in samples:
                 # Only 1 resource expected to be returned
                 if resource_name:
-                    retry = int(timeout / sleep if sleep else timeout / 1)
-                    status = self.get_resource(
-                        resource_name,
-                        column,
-                        retry=retry,
-                        wait=sleep,
-                    )
+                    if sample.get("kind") == "List":
+                        sample = next(
+                            (
+                                item
+                                for item in sample["items"]
+                                if item["metadata"]["name"] == resource_name
+                            ),
+                            {},
+                        )
+                    try:
+                        status = self.compute_item_column(sample, column)
+                    except UnknownResourceColumn:
+                        retry = int(timeout / sleep if sleep else timeout / 1)
+                        status = self.get_resource(
+                            resource_name,
+                            column,
+                            retry=retry,
+                            wait=sleep,
+                        )
                     if status == condition:
                         log.info(
                             f"status of {resource_name} at {column}"
@@ -862,7 +1066,7 @@ class OCP(object):
                     for item in sample:
                         try:
                             item_name = item.get("metadata").get("name")
-                            status = self.get_resource(item_name, column)
+                            status = self.get_item_column(item, column)
                             actual_status.append(status)
                             if status == condition:
                                 in_condition.append(item)
@@ -951,6 +1155,181 @@ class OCP(object):
 
         return False
 
+    def get_item_column(self, item, column):
+        """
+        Get a column value of the resource from the already fetched object.
+        Fall back to 'oc get <kind> <name>' table output if the column can't
+        be computed from the object.
+
+        Args:
+            item (dict): resource object, e.g. item of the list returned by get
+            column (str): The name of the column to retrieve
+
+        Returns:
+            str: value of the column
+
+        """
+        try:
+            return self.compute_item_column(item, column)
+        except UnknownResourceColumn:
+            return self._get_resource_from_table(item["metadata"]["name"], column)
+
+    def compute_item_column(self, item, column):
+        """
+        Compute a column value of the resource from the object, using the
+        printer columns of its CRD for custom resources.
+
+        Args:
+            item (dict): resource object
+            column (str): The name of the column to compute
+
+        Returns:
+            str: value of the column
+
+        Raises:
+            UnknownResourceColumn: if the column can't be computed
+
+        """
+        kind = item.get("kind") or self.kind
+        printer_columns = None
+        if not resource_columns.is_builtin_kind(kind):
+            try:
+                printer_columns = resource_columns.get_crd_printer_columns(
+                    item,
+                    self._list_crds,
+                    cluster=(self.cluster_context, self.cluster_kubeconfig),
+                )
+            except CommandFailed as ex:
+                log.warning(f"Failed to get printer columns of {kind}: {ex}")
+        return resource_columns.get_column_value(
+            item, column, kind=kind, printer_columns=printer_columns
+        )
+
+    def get_column_values(self, column, items=None, selector=None):
+        """
+        Get column values of all the resources in a single pass over the
+        objects, without running 'oc get' per resource.
+
+        Args:
+            column (str): The name of the column, e.g. STATUS
+            items (list): resource objects, listed by get if not provided
+            selector (str): The resource selector used for listing
+
+        Returns:
+            dict: resource name -> column value
+
+        """
+        if items is None:
+            data = self.get(selector=selector)
+            items = data.get("items") if data.get("kind") == "List" else [data]
+        return {
+            item["metadata"]["name"]: self.get_item_column(item, column)
+            for item in items
+        }
+
+    def _list_crds(self):
+        """
+        List CRDs of the cluster the resource is in
+
+        Returns:
+            list: CRD objects
+
+        """
+        crd = OCP(
+            kind="CustomResourceDefinition",
+            cluster_kubeconfig=self.cluster_kubeconfig,
+        )
+        crd.cluster_context = self.cluster_context
+        return crd.get()["items"]
+
+    def _watch_resource_samples(self, api_backend, resource_name, selector, timeout):
+        """
+        Generator of the samples for wait_for_resource served by the watch
+        stream. The resources are listed once and then the stream is resumed
+        from the resourceVersion of the last seen change, listing is repeated
+        only when the resourceVersion expired.
+
+        Args:
+            api_backend (KubeAPIBackend): backend to use
+            resource_name (str): The name of the resource to wait for
+            selector (str): The resource selector to search with
+            timeout (int): Time in seconds to wait
+
+        Yields:
+            dict: the resource or List of the resources after each change, in
+                the same format as returned by get
+
+        Raises:
+            TimeoutExpiredError: when timeout is reached
+
+        """
+        end_time = time.time() + timeout
+        field_selector = None
+        if resource_name and not selector:
+            field_selector = f"metadata.name={resource_name}"
+        resources = {}
+        resource_version = None
+
+        def make_sample():
+            if field_selector:
+                return resources.get(resource_name)
+            return {
+                "apiVersion": "v1",
+                "items": list(resources.values()),
+                "kind": "List",
+                "metadata": {"resourceVersion": resource_version},
+            }
+
+        while time.time() < end_time:
+            if resource_version is None:
+                listed = api_backend.get(
+                    self.kind,
+                    api_version=self.api_version,
+                    namespace=self.get_api_namespace(api_backend),
+                    selector=selector,
+                    field_selector=field_selector,
+                )
+                resources = {item["metadata"]["name"]: item for item in listed["items"]}
+                resource_version = listed["metadata"]["resourceVersion"]
+                sample = make_sample()
+                if sample is not None:
+                    yield sample
+            try:
+                for event in api_backend.watch(
+                    self.kind,
+                    api_version=self.api_version,
+                    namespace=self.get_api_namespace(api_backend),
+                    selector=selector,
+                    field_selector=field_selector,
+                    resource_version=resource_version,
+                    timeout=end_time - time.time(),
+                ):
+                    obj = event["raw_object"]
+                    resource_version = obj.get("metadata", {}).get(
+                        "resourceVersion", resource_version
+                    )
+                    if event["type"] == "BOOKMARK":
+                        continue
+                    if event["type"] == "DELETED":
+                        resources.pop(obj["metadata"]["name"], None)
+                    else:
+                        resources[obj["metadata"]["name"]] = obj
+                    sample = make_sample()
+                    if sample is not None:
+                        yield sample
+                    if time.time() >= end_time:
+                        break
+            except CommandFailed as ex:
+                if "Expired" not in str(ex):
+                    raise
+                log.info(f"Watch of {self.kind} expired, listing the resources again")
+                resource_version = None
+        raise TimeoutExpiredError(
+            timeout,
+            f"Timed out after {timeout}s watching {self.kind} "
+            f"{resource_name or ''} selector: {selector}",
+        )
+
     def wait_for_delete(
         self,
         resource_name="",
@@ -1009,6 +1388,10 @@ class OCP(object):
         Get a column value for a resource based on:
         'oc get <resource_kind> <resource_name>' command
 
+        The value is computed from the resource object by the printer columns
+        of the kind (see ocs_ci.ocs.resource_columns), the table output of oc
+        is parsed only for the columns which can't be computed.
+
         Args:
             resource_name (str): The name of the resource to get its column value
             column (str): The name of the column to retrive
@@ -1022,6 +1405,42 @@ class OCP(object):
         """
         resource_name = resource_name if resource_name else self.resource_name
         selector = selector if selector else self.selector
+        if resource_columns.can_compute_column(self.kind, column):
+            data = self.get(
+                resource_name=resource_name,
+                retry=retry,
+                wait=wait,
+                selector=selector,
+            )
+            items = data.get("items") if data.get("kind") == "List" else [data]
+            if items:
+                try:
+                    return self.compute_item_column(items[0], column)
+                except UnknownResourceColumn as ex:
+                    log.debug(f"{ex}, parsing the table output of oc get")
+                    resource_columns.mark_column_unknown(self.kind, column)
+        return self._get_resource_from_table(
+            resource_name, column, retry=retry, wait=wait, selector=selector
+        )
+
+    def _get_resource_from_table(
+        self, resource_name, column, retry=0, wait=3, selector=None
+    ):
+        """
+        Get a column value for a resource by parsing the table output of:
+        'oc get <resource_kind> <resource_name>' command
+
+        Args:
+            resource_name (str): The name of the resource to get its column value
+            column (str): The name of the column to retrive
+            retry (int): Number of attempts to retry to get resource
+            wait (int): Number of seconds to wait beteween attempts for retry
+            selector (str): The resource selector to search with.
+
+        Returns:
+            str: The output returned by 'oc get' command not in the 'yaml'
+                format
+        """
         # Get the resource in str format
         resource = self.get(
             resource_name=resource_name,
@@ -20,7 +20,11 @@ from ocs_ci.helpers.performance_lib import run_oc_command
 from ocs_ci.ocs import benchmark_operator, constants, defaults, exceptions, node
 from ocs_ci.ocs.cluster import CephCluster
 from ocs_ci.ocs.defaults import ELASTICSEARCE_SCHEME
-from ocs_ci.ocs.elasticsearch import elasticsearch_load
+from ocs_ci.ocs.elasticsearch import (
+    ES_BULK_CHUNK_SIZE,
+    ES_BULK_THREAD_COUNT,
+    elasticsearch_load,
+)
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     MissingRequiredConfigKeyError,
@@ -559,7 +563,14 @@ class PASTest(BaseTest):
             es_connection = self.backup_es
             es_connection["host"] = es_connection.pop("server")
             es_connection.pop("url")
-            if elasticsearch_load(self.main_es, self.full_log_path):
+            if elasticsearch_load(
+                self.main_es,
+                self.full_log_path,
+                chunk_size=config.RUN.get("es_bulk_chunk_size", ES_BULK_CHUNK_SIZE),
+                thread_count=config.RUN.get(
+                    "es_bulk_thread_count", ES_BULK_THREAD_COUNT
+                ),
+            ):
                 # Adding this sleep between the copy and the analyzing of the results
                 # since sometimes the results of the read (just after write) are empty
                 time.sleep(10)
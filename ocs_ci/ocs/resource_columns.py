@@ -0,0 +1,461 @@
+"""
+Computing values of the 'oc get <kind>' table columns from the resource
+objects (parsed yaml) we already have, instead of running another 'oc get'
+in table format and parsing its output.
+
+The values are computed in the same way as the oc printers do, so they can be
+compared with the values parsed from the table (e.g. STATUS of the pod is
+'Running', 'Completed', 'Init:0/1', 'Terminating', 'ContainerCreating', ...).
+
+Columns of the built-in kinds are defined in BUILTIN_COLUMNS, columns of the
+custom resources are taken from additionalPrinterColumns of their CRDs, which
+are fetched once per cluster and cached.
+"""
+
+import json
+import logging
+import re
+import threading
+
+from ocs_ci.ocs.exceptions import UnknownResourceColumn
+
+log = logging.getLogger(__name__)
+
+NODE_ROLE_LABEL_PREFIX = "node-role.kubernetes.io/"
+
+# cluster -> {(group, kind): {version: {COLUMN: (jsonPath, type)}}}
+_crd_printer_columns = {}
+# cluster -> set of (group, kind) which are not served by any CRD
+_not_crd_kinds = {}
+_crd_printer_columns_lock = threading.Lock()
+# (kind, column) pairs which were found not computable from the objects
+_unknown_columns = set()
+
+JSON_PATH_TOKEN = re.compile(
+    r"\.(?P<key>[^.\[]+)"
+    r"|\[(?P<index>-?\d+|\*)\]"
+    r"|\[\?\(@\.(?P<filter_key>[^=!]+?)\s*==\s*[\"']?(?P<filter_value>[^\"')]*)[\"']?\)\]"
+)
+
+
+def _get(item, *path, default=None):
+    """
+    Get nested value from the dict, default if any of the keys is missing
+    """
+    for key in path:
+        if not isinstance(item, dict):
+            return default
+        item = item.get(key)
+        if item is None:
+            return default
+    return item
+
+
+def pod_status(pod):
+    """
+    Compute the STATUS column of the pod in the way 'oc get pod' does
+
+    Args:
+        pod (dict): pod object
+
+    Returns:
+        str: status of the pod
+
+    """
+    status = pod.get("status") or {}
+    reason = status.get("reason") or status.get("phase") or ""
+    initializing = False
+    init_containers = _get(pod, "spec", "initContainers", default=[])
+    for index, container in enumerate(status.get("initContainerStatuses") or []):
+        state = container.get("state") or {}
+        terminated = state.get("terminated")
+        waiting = state.get("waiting")
+        if terminated and terminated.get("exitCode") == 0:
+            continue
+        initializing = True
+        if terminated:
+            if terminated.get("reason"):
+                reason = f"Init:{terminated['reason']}"
+            elif terminated.get("signal"):
+                reason = f"Init:Signal:{terminated['signal']}"
+            else:
+                reason = f"Init:ExitCode:{terminated.get('exitCode')}"
+        elif waiting and waiting.get("reason") not in (None, "", "PodInitializing"):
+            reason = f"Init:{waiting['reason']}"
+        else:
+            reason = f"Init:{index}/{len(init_containers)}"
+        break
+    if not initializing:
+        has_running = False
+        for container in reversed(status.get("containerStatuses") or []):
+            state = container.get("state") or {}
+            terminated = state.get("terminated")
+            waiting = state.get("waiting")
+            if waiting and waiting.get("reason"):
+                reason = waiting["reason"]
+            elif terminated and terminated.get("reason"):
+                reason = terminated["reason"]
+            elif terminated:
+                if terminated.get("signal"):
+                    reason = f"Signal:{terminated['signal']}"
+                else:
+                    reason = f"ExitCode:{terminated.get('exitCode')}"
+            elif container.get("ready") and state.get("running") is not None:
+                has_running = True
+        # change pod status back to "Running" if there is at least one
+        # container still reporting as "Running" status
+        if reason == "Completed" and has_running:
+            ready = any(
+                cond.get("type") == "Ready" and cond.get("status") == "True"
+                for cond in status.get("conditions") or []
+            )
+            reason = "Running" if ready else "NotReady"
+    if _get(pod, "metadata", "deletionTimestamp"):
+        reason = "Unknown" if status.get("reason") == "NodeLost" else "Terminating"
+    return reason
+
+
+def pod_ready(pod):
+    """
+    Compute the READY column of the pod, e.g. '1/2'
+    """
+    statuses = _get(pod, "status", "containerStatuses", default=[])
+    ready = len([c for c in statuses if c.get("ready")])
+    total = len(_get(pod, "spec", "containers", default=[])) or len(statuses)
+    return f"{ready}/{total}"
+
+
+def node_status(node):
+    """
+    Compute the STATUS column of the node, e.g. 'Ready,SchedulingDisabled'
+    """
+    status = "Unknown"
+    for cond in _get(node, "status", "conditions", default=[]):
+        if cond.get("type") == "Ready":
+            status = "Ready" if cond.get("status") == "True" else "NotReady"
+    if _get(node, "spec", "unschedulable"):
+        status += ",SchedulingDisabled"
+    return status
+
+
+def node_roles(node):
+    """
+    Compute the ROLES column of the node from node-role.kubernetes.io labels
+    """
+    roles = sorted(
+        label[len(NODE_ROLE_LABEL_PREFIX) :]
+        for label in _get(node, "metadata", "labels", default={})
+        if label.startswith(NODE_ROLE_LABEL_PREFIX)
+    )
+    return ",".join(role for role in roles if role) or "<none>"
+
+
+def volume_status(item):
+    """
+    Compute the STATUS column of the PVC or PV, 'Terminating' if it is being
+    deleted, the phase otherwise
+    """
+    if _get(item, "metadata", "deletionTimestamp"):
+        return "Terminating"
+    return _get(item, "status", "phase", default="")
+
+
+def _pv_claim(pv):
+    claim = _get(pv, "spec", "claimRef")
+    if not claim:
+        return ""
+    return f"{claim.get('namespace')}/{claim.get('name')}"
+
+
+def _access_modes(item):
+    modes = {
+        "ReadWriteOnce": "RWO",
+        "ReadOnlyMany": "ROX",
+        "ReadWriteMany": "RWX",
+        "ReadWriteOncePod": "RWOP",
+    }
+    access_modes = _get(item, "status", "accessModes") or _get(
+        item, "spec", "accessModes", default=[]
+    )
+    return ",".join(modes.get(mode, mode) for mode in access_modes)
+
+
+def _replicas_ready(item):
+    ready = _get(item, "status", "readyReplicas", default=0)
+    return f"{ready}/{_get(item, 'spec', 'replicas', default=0)}"
+
+
+# kind (lowercase, as well as plural and short names) -> {COLUMN: function}
+BUILTIN_COLUMNS = {
+    "pod": {
+        "STATUS": pod_status,
+        "READY": pod_ready,
+        "NODE": lambda i: _get(i, "spec", "nodeName", default="<none>"),
+        "IP": lambda i: _get(i, "status", "podIP", default="<none>"),
+    },
+    "persistentvolumeclaim": {
+        "STATUS": volume_status,
+        "VOLUME": lambda i: _get(i, "spec", "volumeName", default=""),
+        "CAPACITY": lambda i: _get(i, "status", "capacity", "storage", default=""),
+        "ACCESS MODES": _access_modes,
+        "STORAGECLASS": lambda i: _get(i, "spec", "storageClassName", default=""),
+    },
+    "persistentvolume": {
+        "STATUS": volume_status,
+        "CAPACITY": lambda i: _get(i, "spec", "capacity", "storage", default=""),
+        "ACCESS MODES": _access_modes,
+        "RECLAIM POLICY": lambda i: _get(
+            i, "spec", "persistentVolumeReclaimPolicy", default=""
+        ),
+        "CLAIM": _pv_claim,
+        "STORAGECLASS": lambda i: _get(i, "spec", "storageClassName", default=""),
+    },
+    "namespace": {"STATUS": lambda i: _get(i, "status", "phase", default="")},
+    "project": {"STATUS": lambda i: _get(i, "status", "phase", default="")},
+    "node": {"STATUS": node_status, "ROLES": node_roles},
+    "deployment": {
+        "READY": _replicas_ready,
+        "UP-TO-DATE": lambda i: str(_get(i, "status", "updatedReplicas", default=0)),
+        "AVAILABLE": lambda i: str(_get(i, "status", "availableReplicas", default=0)),
+    },
+    "statefulset": {"READY": _replicas_ready},
+    "job": {
+        "COMPLETIONS": lambda i: (
+            f"{_get(i, 'status', 'succeeded', default=0)}"
+            f"/{_get(i, 'spec', 'completions', default=1)}"
+        ),
+    },
+}
+
+KIND_ALIASES = {
+    "pods": "pod",
+    "po": "pod",
+    "persistentvolumeclaims": "persistentvolumeclaim",
+    "pvc": "persistentvolumeclaim",
+    "persistentvolumes": "persistentvolume",
+    "pv": "persistentvolume",
+    "namespaces": "namespace",
+    "ns": "namespace",
+    "projects": "project",
+    "nodes": "node",
+    "no": "node",
+    "deployments": "deployment",
+    "deploy": "deployment",
+    "statefulsets": "statefulset",
+    "sts": "statefulset",
+    "jobs": "job",
+}
+
+
+def evaluate_json_path(item, json_path):
+    """
+    Evaluate simple JSONPath expression, as used in additionalPrinterColumns
+    of CRDs, e.g. '.status.phase' or '.status.conditions[?(@.type=="Ready")].status'
+
+    Args:
+        item (dict): resource object
+        json_path (str): JSONPath expression
+
+    Returns:
+        list: matched values
+
+    Raises:
+        UnknownResourceColumn: if the expression is not supported
+
+    """
+    expression = json_path.strip().strip("{}").lstrip("$")
+    values = [item]
+    position = 0
+    while position < len(expression):
+        match = JSON_PATH_TOKEN.match(expression, position)
+        if not match:
+            raise UnknownResourceColumn(f"Unsupported JSONPath {json_path}")
+        position = match.end()
+        matched = []
+        for value in values:
+            if match.group("key") is not None:
+                if isinstance(value, dict) and match.group("key") in value:
+                    matched.append(value[match.group("key")])
+            elif not isinstance(value, list):
+                continue
+            elif match.group("index") == "*":
+                matched.extend(value)
+            elif match.group("index") is not None:
+                index = int(match.group("index"))
+                if -len(value) <= index < len(value):
+                    matched.append(value[index])
+            else:
+                matched.extend(
+                    element
+                    for element in value
+                    if isinstance(element, dict)
+                    and str(element.get(match.group("filter_key").strip()))
+                    == match.group("filter_value")
+                )
+        values = matched
+    return values
+
+
+def _format_json_path_value(value):
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return str(value)
+
+
+def _parse_api_version(api_version):
+    group, _, version = (api_version or "").rpartition("/")
+    return group, version
+
+
+def get_crd_printer_columns(item, crd_lister, cluster=None):
+    """
+    Get the additionalPrinterColumns of the CRD serving the resource.
+    All the CRDs are listed once per cluster and their printer columns are
+    cached, the listing is repeated only for kinds not found in the cache.
+
+    Args:
+        item (dict): resource object with apiVersion and kind
+        crd_lister (callable): function returning list of the CRD objects
+        cluster (hashable): identification of the cluster the resource is from
+
+    Returns:
+        dict: column name (upper case) -> (jsonPath, type), empty dict for
+            the kinds not served by CRDs
+
+    """
+    group, version = _parse_api_version(item.get("apiVersion"))
+    key = (group, item.get("kind"))
+    if not group or not key[1]:
+        return {}
+    with _crd_printer_columns_lock:
+        columns = _crd_printer_columns.get(cluster, {}).get(key)
+        if columns is None and key not in _not_crd_kinds.get(cluster, set()):
+            log.debug(f"Loading printer columns of CRDs to resolve {key}")
+            index = {}
+            for crd in crd_lister():
+                spec = crd.get("spec", {})
+                crd_key = (spec.get("group"), spec.get("names", {}).get("kind"))
+                index[crd_key] = {
+                    crd_version["name"]: {
+                        column["name"].upper(): (
+                            column["jsonPath"],
+                            column.get("type"),
+                        )
+                        for column in crd_version.get("additionalPrinterColumns") or []
+                    }
+                    for crd_version in spec.get("versions") or []
+                }
+            _crd_printer_columns[cluster] = index
+            columns = index.get(key)
+            if columns is None:
+                _not_crd_kinds.setdefault(cluster, set()).add(key)
+    if not columns:
+        return {}
+    return columns.get(version) or next(iter(columns.values()))
+
+
+def invalidate_crd_printer_columns(cluster=None):
+    """
+    Drop the cached printer columns of the CRDs, e.g. after upgrade
+
+    Args:
+        cluster (hashable): identification of the cluster, all if not provided
+
+    """
+    with _crd_printer_columns_lock:
+        _unknown_columns.clear()
+        if cluster is None:
+            _crd_printer_columns.clear()
+            _not_crd_kinds.clear()
+        else:
+            _crd_printer_columns.pop(cluster, None)
+            _not_crd_kinds.pop(cluster, None)
+
+
+def is_builtin_kind(kind):
+    """
+    Check whether the kind is one of the built-in kinds with known columns
+
+    Args:
+        kind (str): kind, plural or short name of the resource
+
+    Returns:
+        bool: True if the columns of the kind are defined in BUILTIN_COLUMNS
+
+    """
+    kind = kind.lower()
+    return KIND_ALIASES.get(kind, kind) in BUILTIN_COLUMNS
+
+
+def can_compute_column(kind, column):
+    """
+    Check whether it makes sense to fetch the object to compute the column.
+    It's False only for the built-in kinds, where we know all computable
+    columns in advance, for the custom resources the CRD decides.
+
+    Args:
+        kind (str): kind of the resource
+        column (str): name of the column
+
+    Returns:
+        bool: False if the column can't be computed from the object
+
+    """
+    kind = kind.lower()
+    kind = KIND_ALIASES.get(kind, kind)
+    if kind not in BUILTIN_COLUMNS:
+        return (kind, column) not in _unknown_columns
+    return column in BUILTIN_COLUMNS[kind] or column in ("NAME", "PHASE")
+
+
+def mark_column_unknown(kind, column):
+    """
+    Remember that the column of the kind can't be computed from the objects,
+    so next time the table output of oc is used directly.
+
+    Args:
+        kind (str): kind of the resource
+        column (str): name of the column
+
+    """
+    kind = kind.lower()
+    _unknown_columns.add((KIND_ALIASES.get(kind, kind), column))
+
+
+def get_column_value(item, column, kind=None, printer_columns=None):
+    """
+    Compute the value of the 'oc get' table column from the resource object
+
+    Args:
+        item (dict): resource object
+        column (str): name of the column, e.g. STATUS
+        kind (str): kind of the resource, taken from the object if not provided
+        printer_columns (dict): printer columns of the CRD of the resource, as
+            returned by get_crd_printer_columns
+
+    Returns:
+        str: value of the column
+
+    Raises:
+        UnknownResourceColumn: if the column can't be computed from the object,
+            the caller has to fall back to the table output of oc
+
+    """
+    kind = (kind or item.get("kind") or "").lower()
+    kind = KIND_ALIASES.get(kind, kind)
+    column_func = BUILTIN_COLUMNS.get(kind, {}).get(column)
+    if column_func is None and printer_columns and column in printer_columns:
+        json_path, column_type = printer_columns[column]
+        if column_type == "date":
+            raise UnknownResourceColumn(f"Column {column} of kind {kind} is a date")
+        values = evaluate_json_path(item, json_path)
+        return ",".join(_format_json_path_value(value) for value in values)
+    if column_func is None:
+        if column == "NAME":
+            return _get(item, "metadata", "name", default="")
+        if column == "PHASE" and _get(item, "status", "phase") is not None:
+            return item["status"]["phase"]
+        raise UnknownResourceColumn(f"Column {column} of kind {kind} is not known")
+    return column_func(item)
@@ -61,10 +61,8 @@ class OCS(object):
             namespace=self._namespace,
             threading_lock=self.threading_lock,
         )
-        with tempfile.NamedTemporaryFile(
-            mode="w+", prefix=self._kind, delete=False
-        ) as temp_file_info:
-            self.temp_yaml = temp_file_info.name
+        # The temporary yaml file is created on first use, see temp_yaml
+        self._temp_yaml = None
         # This _is_delete flag is set to True if the delete method was called
         # on object of this class and was successfull.
         self._is_deleted = False
@@ -73,6 +71,28 @@ class OCS(object):
     def api_version(self):
         return self._api_version
 
+    @property
+    def temp_yaml(self):
+        """
+        Path of the temporary yaml file of the resource, the file is created
+        on first use, so listing of many resources doesn't create a file per
+        resource
+        """
+        if self.__dict__.get("_temp_yaml") is None:
+            with tempfile.NamedTemporaryFile(
+                mode="w+", prefix=self._kind, delete=False
+            ) as temp_file_info:
+                self._temp_yaml = temp_file_info.name
+        return self._temp_yaml
+
+    @temp_yaml.setter
+    def temp_yaml(self, path):
+        self._temp_yaml = path
+
+    @temp_yaml.deleter
+    def temp_yaml(self):
+        self.__dict__.pop("_temp_yaml", None)
+
     @property
     def kind(self):
         return self._kind
@@ -187,7 +207,8 @@ class OCS(object):
         return status
 
     def delete_temp_yaml_file(self):
-        utils.delete_file(self.temp_yaml)
+        if self.__dict__.get("_temp_yaml"):
+            utils.delete_file(self._temp_yaml)
 
     def __getstate__(self):
         """
@@ -9,20 +9,20 @@ from datetime import datetime, timedelta
 import logging
 import os
 import re
-import yaml
 import tempfile
 import time
 import calendar
-from threading import Thread
+from threading import Lock, Thread
 import base64
 from semantic_version import Version
 
 from ocs_ci.ocs.ocp import get_images, OCP, verify_images_upgraded, get_sha256_digest
 from ocs_ci.helpers import helpers
 from ocs_ci.helpers.proxy import update_container_with_proxy_env
-from ocs_ci.ocs import constants, defaults, node, workload, ocp
+from ocs_ci.ocs import ceph_exec_session, constants, defaults, workload, ocp
 from ocs_ci.framework import config
 from ocs_ci.ocs.exceptions import (
+    CephExecSessionError,
     CephToolBoxNotFoundException,
     CommandFailed,
     NotAllPodsHaveSameImagesError,
@@ -39,7 +39,7 @@ from ocs_ci.ocs.exceptions import (
 from ocs_ci.ocs.utils import setup_ceph_toolbox, get_pod_name_by_pattern
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs.resources.job import get_job_obj, get_jobs_with_prefix
-from ocs_ci.utility import templating
+from ocs_ci.utility import parsing, templating
 from ocs_ci.utility.utils import (
     get_primary_nb_db_pod,
     run_cmd,
@@ -53,6 +53,23 @@ from ocs_ci.utility.retry import retry
 logger = logging.getLogger(__name__)
 FIO_TIMEOUT = 600
 
+# Resolved running ceph toolbox pods per cluster context:
+# (multicluster index, cluster kubeconfig, namespace) -> (Pod, expiration time)
+_ceph_tools_pod_cache = dict()
+_ceph_tools_pod_cache_lock = Lock()
+
+# Pod objects returned by get_all_pods(use_cache=True):
+# (multicluster index, cluster kubeconfig, namespace, selectors) ->
+# {uid: (resourceVersion, Pod)}
+_all_pods_cache = dict()
+_all_pods_cache_lock = Lock()
+
+# Syntax of the label keys and values, see build_set_label_selector
+LABEL_KEY_PATTERN = re.compile(
+    r"([A-Za-z0-9]([-A-Za-z0-9.]*[A-Za-z0-9])?/)?[A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?"
+)
+LABEL_VALUE_PATTERN = re.compile(r"[A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?")
+
 TEXT_CONTENT = (
     "Lorem ipsum dolor sit amet, consectetur adipiscing elit, "
     "sed do eiusmod tempor incididunt ut labore et dolore magna "
@@ -84,10 +101,6 @@ class Pod(OCS):
         update_container_with_proxy_env(self.pod_data)
         super(Pod, self).__init__(**kwargs)
 
-        with tempfile.NamedTemporaryFile(
-            mode="w+", prefix="POD_", delete=False
-        ) as temp_info:
-            self.temp_yaml = temp_info.name
         self._name = self.pod_data.get("metadata").get("name")
         self._labels = self.get_labels()
         self._roles = []
@@ -134,21 +147,41 @@ class Pod(OCS):
         """
         self._roles.append(role)
 
-    def get_fio_results(self, timeout=FIO_TIMEOUT):
+    def get_fio_results(self, timeout=FIO_TIMEOUT, queue_timeout=None):
         """
         Get FIO execution results
 
+        Args:
+            timeout (int): Time in seconds to wait for the results, counted
+                from the start of FIO, the time FIO waited in the queue of
+                the workload scheduler is not counted
+            queue_timeout (int): Time in seconds to wait for FIO to start
+                when it is queued in the workload scheduler, e.g. behind
+                other workloads of the pod. Default is the timeout.
+
         Returns:
             dict: Dictionary represents the FIO execution results
 
         Raises:
+            TimeoutError: In case FIO didn't start within the queue_timeout
             Exception: In case of exception from FIO
         """
+        if queue_timeout is None:
+            queue_timeout = timeout
         logger.info(f"Waiting for FIO results from pod {self.name}")
         try:
+            started = getattr(self.fio_thread, "started", None)
+            if started is not None and not started.is_set():
+                logger.info(f"Waiting for FIO on pod {self.name} to start")
+                if not started.wait(queue_timeout):
+                    raise TimeoutError(
+                        f"FIO on pod {self.name} didn't start within "
+                        f"{queue_timeout} seconds, it is queued behind other "
+                        f"workloads"
+                    )
             result = self.fio_thread.result(timeout)
             if result:
-                return yaml.safe_load(result)
+                return parsing.load_output(result)
             raise CommandFailed(f"FIO execution results: {result}.")
 
         except CommandFailed as ex:
@@ -191,14 +224,20 @@ class Pod(OCS):
         else:
             cmd = f"rsh {self.name} "
             cmd += command
-        return self.ocp.exec_oc_cmd(
-            cmd,
-            out_yaml_format,
-            secrets=secrets,
-            timeout=timeout,
-            cluster_config=cluster_config,
-            **kwargs,
-        )
+        try:
+            return self.ocp.exec_oc_cmd(
+                cmd,
+                out_yaml_format,
+                secrets=secrets,
+                timeout=timeout,
+                cluster_config=cluster_config,
+                **kwargs,
+            )
+        except CommandFailed:
+            # the pod might be gone or unreachable (e.g. its node is down),
+            # don't serve it as cached toolbox pod anymore
+            invalidate_ceph_tools_pod_cache(pod_name=self.name)
+            raise
 
     def exec_s3_cmd_on_pod(self, command, mcg_obj=None):
         """
@@ -373,19 +412,67 @@ class Pod(OCS):
         Raises:
             CommandFailed: In case the pod is not a toolbox pod
         """
+        return self.exec_ceph_cmds(
+            [ceph_cmd], format=format, out_yaml_format=out_yaml_format, timeout=timeout
+        )[0]
+
+    def exec_ceph_cmds(
+        self, ceph_cmds, format="json-pretty", out_yaml_format=True, timeout=600
+    ):
+        """
+        Execute Ceph commands on the Ceph tools pod. If config.RUN["ceph_exec_session"]
+        is set, all the commands are sent in one round trip to the persistent
+        exec session to the pod (see ocs_ci.ocs.ceph_exec_session), otherwise
+        they are executed one by one.
+
+        Args:
+            ceph_cmds (list): The Ceph commands to execute on the Ceph tools pod
+            format (str): The returning output format of the Ceph commands
+            out_yaml_format (bool): whether to return yaml loaded python
+                objects OR to return raw outputs
+            timeout (int): timeout for the commands, defaults to 600 seconds
+
+        Returns:
+            list: Ceph commands outputs, in the order of the commands
+
+        Raises:
+            CommandFailed: In case the pod is not a toolbox pod or in case
+                any of the commands fails
+
+        """
         if "rook-ceph-tools" not in self.labels.values():
             raise CommandFailed("Ceph commands can be executed only on toolbox pod")
-        ceph_cmd = ceph_cmd
         if format:
-            ceph_cmd += f" --format {format}"
-        out = self.exec_cmd_on_pod(
-            ceph_cmd, out_yaml_format=out_yaml_format, timeout=timeout
-        )
+            ceph_cmds = [f"{ceph_cmd} --format {format}" for ceph_cmd in ceph_cmds]
+        outs = None
+        if ceph_exec_session.is_enabled():
+            try:
+                outs = ceph_exec_session.get_session(self).run_batch(
+                    ceph_cmds, timeout=timeout
+                )
+            except CephExecSessionError as ex:
+                logger.warning(f"Falling back to oc rsh, exec session failed: {ex}")
+            else:
+                if out_yaml_format:
+                    outs = [
+                        parsing.load_output(
+                            out[out.find("{") :] if out.startswith("hints = ") else out
+                        )
+                        for out in outs
+                    ]
+        if outs is None:
+            outs = [
+                self.exec_cmd_on_pod(
+                    ceph_cmd, out_yaml_format=out_yaml_format, timeout=timeout
+                )
+                for ceph_cmd in ceph_cmds
+            ]
 
         # For some commands, like "ceph fs ls", the returned output is a list
-        if isinstance(out, list):
-            return [item for item in out if item]
-        return out
+        return [
+            [item for item in out if item] if isinstance(out, list) else out
+            for out in outs
+        ]
 
     def get_storage_path(self, storage_type="fs"):
         """
@@ -757,10 +844,15 @@ def get_all_pods(
     wait=False,
     field_selector=None,
     cluster_kubeconfig="",
+    use_cache=False,
 ):
     """
     Get all pods in a namespace.
 
+    The pods are filtered by the selector on the server side, so only the
+    matching pods are listed, when it can be expressed by set based label
+    selector (see build_set_label_selector).
+
     Args:
         namespace (str): Name of the namespace
             If namespace is None - get all pods
@@ -772,6 +864,12 @@ def get_all_pods(
             '=', '==', and '!='. (e.g. status.phase=Running)
         wait (bool): True if you want to wait for the pods to be Running
         cluster_kubeconfig (str): Path to the kubeconfig file for the cluster
+        use_cache (bool): If True, the Pod objects of the pods whose
+            resourceVersion didn't change since the previous call with the
+            same arguments are returned again instead of constructing new
+            ones. The cached objects are shared, so they shouldn't be
+            modified by the caller, so it's used by the helpers which only
+            read the listed pods and are usually polled.
 
     Returns:
         list: List of Pod objects
@@ -791,8 +889,13 @@ def get_all_pods(
         wait_time = 180
         logger.info(f"Waiting for {wait_time}s for the pods to stabilize")
         time.sleep(wait_time)
-    pods = ocp_pod_obj.get()["items"]
-    if selector:
+    label_selector = None
+    if selector and not isinstance(selector, str):
+        label_selector = build_set_label_selector(
+            selector_label, selector, exclude=exclude_selector
+        )
+    pods = ocp_pod_obj.get(selector=label_selector)["items"]
+    if selector and not label_selector:
         if exclude_selector:
             pods_new = [
                 pod
@@ -806,10 +909,88 @@ def get_all_pods(
                 if pod["metadata"].get("labels", {}).get(selector_label) in selector
             ]
         pods = pods_new
+    if use_cache:
+        cache_key = (
+            config.cluster_ctx.MULTICLUSTER["multicluster_index"],
+            cluster_kubeconfig,
+            namespace,
+            label_selector,
+            str(selector) if selector and not label_selector else None,
+            exclude_selector,
+            field_selector,
+        )
+        return _get_cached_pod_objs(cache_key, pods)
     pod_objs = [Pod(**pod) for pod in pods]
     return pod_objs
 
 
+def build_set_label_selector(label, values, exclude=False):
+    """
+    Build set based label selector matching the resources with the label
+    having (or not having) one of the values, e.g. 'app in (a,b)'. The
+    resources without the label match the selector with exclude.
+
+    Args:
+        label (str): key of the label, e.g. app
+        values (list): values of the label
+        exclude (bool): True for the resources with other values of the label
+
+    Returns:
+        str: label selector, None if the label or any value doesn't have
+            valid syntax, so the resources have to be filtered on client side
+
+    """
+    values = list(values)
+    if not values or not LABEL_KEY_PATTERN.fullmatch(label or ""):
+        return None
+    for value in values:
+        if not isinstance(value, str) or not LABEL_VALUE_PATTERN.fullmatch(value):
+            return None
+    operator = "notin" if exclude else "in"
+    return f"{label} {operator} ({','.join(values)})"
+
+
+def _get_cached_pod_objs(cache_key, pods):
+    """
+    Get Pod objects of the listed pods, reusing the cached objects of the
+    pods whose resourceVersion didn't change
+
+    Args:
+        cache_key (tuple): key of the listing in the cache
+        pods (list): listed pod resources
+
+    Returns:
+        list: List of Pod objects in order of the pods
+
+    """
+    with _all_pods_cache_lock:
+        cached = _all_pods_cache.get(cache_key, {})
+    pod_objs = []
+    current = {}
+    for pod in pods:
+        metadata = pod["metadata"]
+        uid = metadata.get("uid") or (metadata.get("namespace"), metadata["name"])
+        version = metadata.get("resourceVersion")
+        cached_version, pod_obj = cached.get(uid, (None, None))
+        if pod_obj is None or version is None or cached_version != version:
+            pod_obj = Pod(**pod)
+        current[uid] = (version, pod_obj)
+        pod_objs.append(pod_obj)
+    reused = sum(1 for uid, entry in current.items() if cached.get(uid) is entry)
+    logger.debug(f"Reused {reused} of {len(pod_objs)} cached Pod objects")
+    with _all_pods_cache_lock:
+        _all_pods_cache[cache_key] = current
+    return pod_objs
+
+
+def invalidate_all_pods_cache():
+    """
+    Drop all the Pod objects cached by get_all_pods
+    """
+    with _all_pods_cache_lock:
+        _all_pods_cache.clear()
+
+
 def get_ceph_tools_pod(
     skip_creating_pod=False, wait=False, namespace=None, get_running_pods=True
 ):
@@ -824,6 +1005,10 @@ def get_ceph_tools_pod(
         get_running_pods (bool): If True, get only the ceph tool pods in a Running status.
             If False, get the ceph tool pods even if they are not in a Running status.
 
+    The resolved running tools pod is cached per cluster context for
+    config.RUN["ceph_tools_pod_cache_ttl"] seconds, it's dropped from the cache
+    when a command executed on it fails, see invalidate_ceph_tools_pod_cache.
+
     Returns:
         Pod object: The Ceph tools pod object
 
@@ -858,6 +1043,19 @@ def get_ceph_tools_pod(
     else:
         namespace = namespace or config.ENV_DATA["cluster_namespace"]
 
+    cache_ttl = config.RUN.get("ceph_tools_pod_cache_ttl", 30)
+    cache_key = (
+        config.cluster_ctx.MULTICLUSTER.get("multicluster_index"),
+        cluster_kubeconfig,
+        namespace,
+    )
+    if get_running_pods and cache_ttl:
+        with _ceph_tools_pod_cache_lock:
+            ceph_pod, expiration = _ceph_tools_pod_cache.get(cache_key, (None, 0))
+        if ceph_pod and time.monotonic() < expiration:
+            logger.debug(f"Using cached ceph tool box pod {ceph_pod.name}")
+            return ceph_pod
+
     ocp_pod_obj = OCP(
         kind=constants.POD,
         namespace=namespace,
@@ -916,9 +1114,7 @@ def get_ceph_tools_pod(
         )
         running_ct_pods = list()
         for pod in ct_pod_items:
-            pod_status = ocp_pod_obj.get_resource_status(
-                pod.get("metadata").get("name")
-            )
+            pod_status = ocp_pod_obj.get_item_column(pod, "STATUS")
             logger.info(f"Pod name: {pod.get('metadata').get('name')}")
             logger.info(f"Pod status: {pod_status}")
             if pod_status == constants.STATUS_RUNNING:
@@ -947,9 +1143,32 @@ def get_ceph_tools_pod(
         new_ceph_pod = patch_consumer_toolbox(consumer_tools_pod=ceph_pod)
         ceph_pod = new_ceph_pod or ceph_pod
 
+    if get_running_pods and cache_ttl:
+        with _ceph_tools_pod_cache_lock:
+            _ceph_tools_pod_cache[cache_key] = (
+                ceph_pod,
+                time.monotonic() + cache_ttl,
+            )
     return ceph_pod
 
 
+def invalidate_ceph_tools_pod_cache(pod_name=None):
+    """
+    Invalidate the ceph tool box pods cached by get_ceph_tools_pod, e.g. after
+    node disruption or when the cached pod is gone.
+
+    Args:
+        pod_name (str): invalidate only the cache entries of the pod with this
+            name, all entries are invalidated if not provided
+
+    """
+    with _ceph_tools_pod_cache_lock:
+        for key, (ceph_pod, _) in list(_ceph_tools_pod_cache.items()):
+            if pod_name is None or ceph_pod.name == pod_name:
+                logger.debug(f"Invalidating cached ceph tool box pod {ceph_pod.name}")
+                del _ceph_tools_pod_cache[key]
+
+
 def get_csi_provisioner_pod(interface):
     """
     Get the provisioner pod based on interface
@@ -1659,6 +1878,39 @@ def get_pods_having_label(
     return pods
 
 
+def match_label_selector(pod, label):
+    """
+    Check whether the already fetched pod matches the equality based label
+    selector, in the same way as 'oc get pods -l <label>' filters the pods
+
+    Args:
+        pod (dict): pod resource, e.g. item of the list returned by OCP.get
+        label (str): label selector, e.g. 'app=rook-ceph-mon' or
+            'app=rook-ceph-osd,ceph-osd-id!=0'
+
+    Returns:
+        bool: True if the pod matches all the requirements of the selector
+
+    """
+    labels = pod["metadata"].get("labels") or {}
+    for requirement in filter(None, label.split(",")):
+        requirement = requirement.strip()
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif "=" in requirement:
+            key, value = requirement.split("=", 1)
+            if labels.get(key.strip()) != value.lstrip("=").strip():
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:] in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
+
+
 def get_deployments_having_label(label, namespace):
     """
     Fetches deployment resources with given label in given namespace
@@ -1905,24 +2157,72 @@ def get_pod_logs(
     return pod.exec_oc_cmd(cmd, out_yaml_format=False)
 
 
-def get_pod_node(pod_obj):
+def get_pod_node_name(pod_obj, pods_node_names=None):
     """
-    Get the node that the pod is running on
+    Get the name of the node that the pod is running on
 
     Args:
         pod_obj (OCS): The pod object
+        pods_node_names (dict): node names of the pods returned by
+            get_pods_node_names, the pod is fetched if not provided
 
     Returns:
-        ocs_ci.ocs.ocp.OCP: The node object
+        str: The node name
 
     Raises:
         NotFoundError when the node name is not found
 
     """
-    node_name = pod_obj.get().get("spec").get("nodeName")
+    if pods_node_names is None:
+        node_name = pod_obj.get().get("spec").get("nodeName")
+    else:
+        node_name = pods_node_names.get((pod_obj.namespace, pod_obj.name))
     if not node_name:
         raise NotFoundError(f"Node name not found for the pod {pod_obj.name}")
-    return node.get_node_objs(node_names=node_name)[0]
+    return node_name
+
+
+def get_pod_node(pod_obj, pods_node_names=None):
+    """
+    Get the node that the pod is running on
+
+    Args:
+        pod_obj (OCS): The pod object
+        pods_node_names (dict): node names of the pods returned by
+            get_pods_node_names, the pod is fetched if not provided
+
+    Returns:
+        ocs_ci.ocs.ocp.OCP: The node object
+
+    Raises:
+        NotFoundError when the node name is not found
+
+    """
+    node_name = get_pod_node_name(pod_obj, pods_node_names)
+    return OCS(**OCP(kind=constants.NODE).get(resource_name=node_name))
+
+
+def get_pods_node_names(pod_objs):
+    """
+    Get the names of the nodes the pods are running on. The pods are listed
+    once per namespace instead of fetching each of them.
+
+    Args:
+        pod_objs (list): The pod objects
+
+    Returns:
+        dict: (namespace, pod name) -> name of the node the pod is running
+            on, None if it's not scheduled. The pods which don't exist
+            anymore are missing.
+
+    """
+    pods_node_names = {}
+    for namespace in {pod_obj.namespace for pod_obj in pod_objs}:
+        for item in OCP(kind=constants.POD, namespace=namespace).get()["items"]:
+            pods_node_names[(namespace, item["metadata"]["name"])] = item.get(
+                "spec", {}
+            ).get("nodeName")
+    return pods_node_names
 
 
 def delete_pods(pod_objs, wait=True):
@@ -2503,7 +2803,10 @@ def check_pods_in_running_state(
             pod_names, raise_pod_not_found_error, cluster_kubeconfig=cluster_kubeconfig
         )
     else:
-        list_of_pods = get_all_pods(namespace, cluster_kubeconfig=cluster_kubeconfig)
+        # the check is usually polled, the pods are only read
+        list_of_pods = get_all_pods(
+            namespace, cluster_kubeconfig=cluster_kubeconfig, use_cache=True
+        )
 
     ocp_pod_obj = OCP(
         kind=constants.POD, namespace=namespace, cluster_kubeconfig=cluster_kubeconfig
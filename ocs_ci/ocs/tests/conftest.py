@@ -0,0 +1,64 @@
+# -*- coding: utf8 -*-
+
+import contextlib
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import kube_api_backend
+from ocs_ci.ocs.tests.fake_kube_api import FakeKubeAPIServer, FakeOc
+from ocs_ci.utility import utils
+
+
+@pytest.fixture
+def kube_api_cluster(tmp_path, monkeypatch):
+    """
+    Factory starting the fake API server with the given objects as the
+    cluster of the current config context, used by the API backend.
+
+    The factory takes the objects served by the API server and ENV_DATA
+    items to set (e.g. cluster_namespace) and returns the started
+    FakeKubeAPIServer. Its kubeconfig is set as RUN kubeconfig.
+    """
+    with contextlib.ExitStack() as stack:
+
+        def start(objects, **env_data):
+            monkeypatch.setitem(config.RUN, "oc_backend", "api")
+            monkeypatch.setitem(config.RUN, "resource_checker", False)
+            monkeypatch.setitem(config.ENV_DATA, "cluster_path", str(tmp_path))
+            for key in ("http_proxy", "https_proxy", "no_proxy"):
+                monkeypatch.setitem(config.ENV_DATA, key, "")
+            for key, value in env_data.items():
+                monkeypatch.setitem(config.ENV_DATA, key, value)
+            server = stack.enter_context(FakeKubeAPIServer(objects))
+            kubeconfig = server.write_kubeconfig(str(tmp_path / "kubeconfig"))
+            monkeypatch.setitem(config.RUN, "kubeconfig", kubeconfig)
+            return server
+
+        yield start
+    kube_api_backend.reset_backends()
+
+
+@pytest.fixture
+def oc_cluster(tmp_path, monkeypatch):
+    """
+    Factory serving the given objects to the 'oc get' commands of the oc
+    backend as the cluster of the current config context.
+
+    The factory takes the objects and ENV_DATA items to set (e.g.
+    cluster_namespace) and returns the FakeOc which replaced exec_cmd.
+    """
+
+    def start(objects, **env_data):
+        monkeypatch.setitem(config.RUN, "oc_backend", "oc")
+        monkeypatch.setitem(config.RUN, "resource_checker", False)
+        monkeypatch.setitem(config.ENV_DATA, "cluster_path", str(tmp_path))
+        for key in ("http_proxy", "https_proxy", "no_proxy"):
+            monkeypatch.setitem(config.ENV_DATA, key, "")
+        for key, value in env_data.items():
+            monkeypatch.setitem(config.ENV_DATA, key, value)
+        fake_oc = FakeOc(objects)
+        monkeypatch.setattr(utils, "exec_cmd", fake_oc)
+        return fake_oc
+
+    return start
@@ -0,0 +1,505 @@
+# -*- coding: utf8 -*-
+"""
+Minimal local stand-in for the Kubernetes API server, serving discovery and
+get/list/create/delete/patch/watch of a few resource kinds from memory. It's
+used by unit tests and benchmarks of the in-process API backend. FakeOc
+serves 'oc get' of the same objects to the tests of the oc backend.
+"""
+
+import copy
+import json
+import os
+import re
+import shlex
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import yaml
+
+from ocs_ci.ocs.exceptions import CommandFailed
+
+# (group, version, plural) -> (kind, namespaced, short names)
+RESOURCES = {
+    ("", "v1", "pods"): ("Pod", True, ["po"]),
+    ("", "v1", "namespaces"): ("Namespace", False, ["ns"]),
+    ("", "v1", "persistentvolumeclaims"): ("PersistentVolumeClaim", True, ["pvc"]),
+    ("", "v1", "nodes"): ("Node", False, ["no"]),
+    ("ocs.openshift.io", "v1", "storageclusters"): ("StorageCluster", True, []),
+    ("apiextensions.k8s.io", "v1", "customresourcedefinitions"): (
+        "CustomResourceDefinition",
+        False,
+        ["crd"],
+    ),
+}
+
+
+def make_pod(name, namespace="default", phase="Running", labels=None, node=None):
+    """
+    Build a Pod object as returned by the API server
+
+    Args:
+        name (str): name of the pod
+        namespace (str): namespace of the pod
+        phase (str): status.phase of the pod
+        labels (dict): labels of the pod
+        node (str): name of the node the pod is scheduled to
+
+    Returns:
+        dict: pod object
+
+    """
+    ready = "True" if phase == "Running" else "False"
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": labels or {},
+            "resourceVersion": "1",
+        },
+        "spec": {"nodeName": node, "containers": [{"name": "main"}]},
+        "status": {
+            "phase": phase,
+            "conditions": [{"type": "Ready", "status": ready}],
+            "containerStatuses": [{"name": "main", "ready": ready == "True"}],
+        },
+    }
+
+
+def make_node(name, roles=(), ready=True, unschedulable=False):
+    """
+    Build a Node object as returned by the API server
+
+    Args:
+        name (str): name of the node
+        roles (list): roles of the node, set as node-role labels
+        ready (bool): status of the Ready condition of the node
+        unschedulable (bool): True for cordoned node
+
+    Returns:
+        dict: node object
+
+    """
+    return {
+        "apiVersion": "v1",
+        "kind": "Node",
+        "metadata": {
+            "name": name,
+            "labels": {f"node-role.kubernetes.io/{role}": "" for role in roles},
+            "resourceVersion": "1",
+        },
+        "spec": {"unschedulable": True} if unschedulable else {},
+        "status": {
+            "conditions": [
+                {"type": "MemoryPressure", "status": "False"},
+                {"type": "Ready", "status": "True" if ready else "False"},
+            ]
+        },
+    }
+
+
+def _match_selector(obj, selector):
+    labels = obj["metadata"].get("labels") or {}
+    # split the requirements on the commas outside of the value sets
+    for requirement in re.split(r",(?![^(]*\))", selector or ""):
+        requirement = requirement.strip()
+        if not requirement:
+            continue
+        set_match = re.fullmatch(r"(\S+)\s+(in|notin)\s+\((.*)\)", requirement)
+        if set_match:
+            key, operator, values = set_match.groups()
+            values = [value.strip() for value in values.split(",")]
+            if (labels.get(key) in values) != (operator == "in"):
+                return False
+            continue
+        key, _, value = requirement.partition("=")
+        if labels.get(key.rstrip("=!")) != value.lstrip("="):
+            return False
+    return True
+
+
+def _match_field_selector(obj, field_selector):
+    for requirement in filter(None, (field_selector or "").split(",")):
+        path, _, value = requirement.partition("=")
+        current = obj
+        for part in path.split("."):
+            current = (current or {}).get(part)
+        if str(current) != value.lstrip("="):
+            return False
+    return True
+
+
+class FakeKubeAPIServer(object):
+    """
+    Threaded HTTP/1.1 server with keep-alive, counting the requests and the
+    TCP connections it accepted.
+    """
+
+    def __init__(self, objects=None):
+        """
+        Args:
+            objects (list): objects (dicts) the server is populated with
+
+        """
+        self.store = {}
+        self.requests = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+        for obj in objects or []:
+            self.add(obj)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def add(self, obj):
+        """
+        Add or replace object in the store
+
+        Args:
+            obj (dict): object with apiVersion, kind and metadata
+
+        """
+        plural = self._plural(obj["apiVersion"], obj["kind"])
+        key = (plural, obj["metadata"].get("namespace"), obj["metadata"]["name"])
+        self.store[key] = obj
+
+    @staticmethod
+    def _plural(api_version, kind):
+        group, _, version = api_version.rpartition("/")
+        for (res_group, res_version, plural), res in RESOURCES.items():
+            if (res_group, res_version, res[0]) == (group, version, kind):
+                return plural
+        raise KeyError(f"Unknown kind {api_version} {kind}")
+
+    def write_kubeconfig(self, path, namespace=None):
+        """
+        Write kubeconfig pointing to this server
+
+        Args:
+            path (str): path of the kubeconfig to write
+            namespace (str): namespace of the context
+
+        Returns:
+            str: path of the kubeconfig
+
+        """
+        kubeconfig = {
+            "apiVersion": "v1",
+            "kind": "Config",
+            "clusters": [{"name": "fake", "cluster": {"server": self.url}}],
+            "users": [{"name": "fake", "user": {"token": "fake-token"}}],
+            "contexts": [
+                {"name": "fake", "context": {"cluster": "fake", "user": "fake"}}
+            ],
+            "current-context": "fake",
+        }
+        if namespace:
+            kubeconfig["contexts"][0]["context"]["namespace"] = namespace
+        with open(path, "w") as fd:
+            yaml.safe_dump(kubeconfig, fd)
+        return os.path.abspath(path)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, code, body):
+                data = json.dumps(body).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _not_found(self, plural, name):
+                self._send(
+                    404,
+                    {
+                        "kind": "Status",
+                        "apiVersion": "v1",
+                        "status": "Failure",
+                        "reason": "NotFound",
+                        "message": f'{plural} "{name}" not found',
+                        "code": 404,
+                    },
+                )
+
+            def _body(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def _route(self):
+                """
+                Returns:
+                    tuple: (group, version, plural, namespace, name),
+                        discovery response (dict) or None for unknown paths
+
+                """
+                parts = [p for p in urlparse(self.path).path.split("/") if p]
+                if parts == ["version"]:
+                    return {"major": "1", "minor": "30", "gitVersion": "v1.30.0"}
+                if parts == ["api"]:
+                    return {"kind": "APIVersions", "versions": ["v1"]}
+                if parts == ["apis"]:
+                    groups = sorted({g for g, _, _ in RESOURCES if g})
+                    return {
+                        "kind": "APIGroupList",
+                        "apiVersion": "v1",
+                        "groups": [
+                            {
+                                "name": g,
+                                "versions": [
+                                    {"groupVersion": f"{g}/v1", "version": "v1"}
+                                ],
+                                "preferredVersion": {
+                                    "groupVersion": f"{g}/v1",
+                                    "version": "v1",
+                                },
+                            }
+                            for g in groups
+                        ],
+                    }
+                if parts[0] not in ("api", "apis"):
+                    return None
+                if parts[0] == "api":
+                    group, rest = "", parts[1:]
+                else:
+                    group, rest = parts[1], parts[2:]
+                version, rest = rest[0], rest[1:]
+                if not rest:
+                    return {
+                        "kind": "APIResourceList",
+                        "groupVersion": f"{group}/{version}".lstrip("/"),
+                        "resources": [
+                            {
+                                "name": plural,
+                                "singularName": kind.lower(),
+                                "namespaced": namespaced,
+                                "kind": kind,
+                                "shortNames": short_names,
+                                "verbs": ["get", "list", "create", "delete"],
+                            }
+                            for (g, v, plural), (
+                                kind,
+                                namespaced,
+                                short_names,
+                            ) in RESOURCES.items()
+                            if (g, v) == (group, version)
+                        ],
+                    }
+                namespace = None
+                if rest[0] == "namespaces" and len(rest) > 2:
+                    namespace, rest = rest[1], rest[2:]
+                name = rest[1] if len(rest) > 1 else None
+                return group, version, rest[0], namespace, name
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests += 1
+                route = self._route()
+                if route is None:
+                    return self._not_found("path", self.path)
+                if isinstance(route, dict):
+                    return self._send(200, route)
+                group, version, plural, namespace, name = route
+                kind = RESOURCES[(group, version, plural)][0]
+                if name:
+                    obj = server.store.get((plural, namespace, name))
+                    if obj is None:
+                        return self._not_found(plural, name)
+                    return self._send(200, obj)
+                query = parse_qs(urlparse(self.path).query)
+                items = [
+                    obj
+                    for (res_plural, res_ns, _), obj in sorted(server.store.items())
+                    if res_plural == plural
+                    and (namespace is None or res_ns == namespace)
+                    and _match_selector(obj, query.get("labelSelector", [""])[0])
+                    and _match_field_selector(obj, query.get("fieldSelector", [""])[0])
+                ]
+                # the items of list don't carry kind and apiVersion
+                items = [copy.deepcopy(obj) for obj in items]
+                for item in items:
+                    item.pop("kind", None)
+                    item.pop("apiVersion", None)
+                if query.get("watch"):
+                    data = b"".join(
+                        json.dumps(
+                            {
+                                "type": "ADDED",
+                                "object": dict(
+                                    item,
+                                    kind=kind,
+                                    apiVersion=f"{group}/{version}".lstrip("/"),
+                                ),
+                            }
+                        ).encode()
+                        + b"\n"
+                        for item in items
+                    )
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                self._send(
+                    200,
+                    {
+                        "apiVersion": f"{group}/{version}".lstrip("/"),
+                        "kind": f"{kind}List",
+                        "metadata": {"resourceVersion": "1"},
+                        "items": items,
+                    },
+                )
+
+            def do_POST(self):
+                with server.lock:
+                    server.requests += 1
+                group, version, plural, namespace, _ = self._route()
+                obj = self._body()
+                if namespace:
+                    obj["metadata"]["namespace"] = namespace
+                server.add(obj)
+                self._send(201, obj)
+
+            def do_DELETE(self):
+                with server.lock:
+                    server.requests += 1
+                group, version, plural, namespace, name = self._route()
+                obj = server.store.pop((plural, namespace, name), None)
+                if obj is None:
+                    return self._not_found(plural, name)
+                self._send(200, obj)
+
+            def do_PATCH(self):
+                with server.lock:
+                    server.requests += 1
+                group, version, plural, namespace, name = self._route()
+                obj = server.store.get((plural, namespace, name))
+                if obj is None:
+                    return self._not_found(plural, name)
+                before = copy.deepcopy(obj)
+                _merge(obj, self._body())
+                # the resourceVersion changes only when the object changed
+                if obj != before:
+                    version = int(obj["metadata"].get("resourceVersion", "0"))
+                    obj["metadata"]["resourceVersion"] = str(version + 1)
+                self._send(200, obj)
+
+        return Handler
+
+
+def _merge(orig, patch):
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(orig.get(key), dict):
+            _merge(orig[key], value)
+        else:
+            orig[key] = value
+
+
+class FakeOc(object):
+    """
+    Stand-in for exec_cmd serving 'oc get -o json' of the objects from
+    memory, for the tests of the oc backend. The commands are recorded.
+    """
+
+    def __init__(self, objects=None):
+        """
+        Args:
+            objects (list): objects (dicts) served by 'oc get'
+
+        """
+        self.objects = list(objects or [])
+        self.commands = []
+
+    @staticmethod
+    def _kind_matches(obj, kind):
+        kind = kind.lower()
+        for (_, _, plural), (res_kind, _, short_names) in RESOURCES.items():
+            if res_kind == obj["kind"]:
+                return kind in [res_kind.lower(), plural] + short_names
+        return False
+
+    def __call__(
+        self, cmd, secrets=None, timeout=600, ignore_error=False, *args, **kwargs
+    ):
+        self.commands.append(cmd)
+        args = shlex.split(cmd)
+        namespace = None
+        all_namespaces = False
+        selector = field_selector = None
+        positional = []
+        i = 1
+        while i < len(args):
+            arg = args[i]
+            if arg in ("-n", "--kubeconfig", "-o"):
+                if arg == "-n":
+                    namespace = args[i + 1]
+                i += 2
+                continue
+            if arg == "-A":
+                all_namespaces = True
+            elif arg.startswith("--selector="):
+                selector = arg.split("=", 1)[1]
+            elif arg.startswith("--field-selector="):
+                field_selector = arg.split("=", 1)[1]
+            else:
+                positional.append(arg)
+            i += 1
+        if positional[0] != "get":
+            raise ValueError(f"Unsupported command {cmd}")
+        kind, name = positional[1], (positional[2:] or [None])[0]
+        items = [
+            copy.deepcopy(obj)
+            for obj in sorted(self.objects, key=lambda o: o["metadata"]["name"])
+            if self._kind_matches(obj, kind)
+            and (
+                all_namespaces
+                or namespace is None
+                or obj["metadata"].get("namespace") in (None, namespace)
+            )
+            and (name is None or obj["metadata"]["name"] == name)
+            and _match_selector(obj, selector)
+            and _match_field_selector(obj, field_selector)
+        ]
+        if name is not None:
+            if not items:
+                stderr = f'Error from server (NotFound): {kind} "{name}" not found'
+                if not ignore_error:
+                    raise CommandFailed(
+                        f"Error during execution of command: {cmd}."
+                        f"\nError is {stderr}"
+                    )
+                return subprocess.CompletedProcess(args, 1, b"", stderr.encode())
+            output = items[0]
+        else:
+            output = {"apiVersion": "v1", "kind": "List", "items": items}
+        return subprocess.CompletedProcess(args, 0, json.dumps(output).encode(), b"")
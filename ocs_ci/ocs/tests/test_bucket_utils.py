@@ -0,0 +1,87 @@
+# -*- coding: utf8 -*-
+
+import subprocess
+from sys import platform
+
+import pytest
+
+from ocs_ci.ocs import bucket_utils
+
+pytestmark = pytest.mark.skipif(
+    platform.startswith("win"), reason="requires posix shell"
+)
+
+
+class LocalPod(object):
+    """
+    Stand-in for the pod, running the shell commands locally and counting
+    the execs.
+    """
+
+    def __init__(self):
+        self.execs = 0
+
+    def exec_sh_cmd_on_pod(self, command, sh="bash", timeout=600, **kwargs):
+        self.execs += 1
+        return subprocess.run(
+            [sh, "-c", command], capture_output=True, check=True, text=True
+        ).stdout
+
+
+@pytest.fixture
+def object_dirs(tmp_path):
+    """
+    Original and result directory with the same objects.
+    """
+    dirs = []
+    for name in ("original", "result"):
+        directory = tmp_path / name
+        directory.mkdir()
+        for i in range(20):
+            (directory / f"ObjKey-{i}").write_bytes(f"object {i}".encode() * 100)
+        (directory / "other").write_text("not an object")
+        dirs.append(directory)
+    return dirs
+
+
+def test_directory_checksums_single_exec(object_dirs):
+    """
+    Check that checksums of all the objects are computed by one exec.
+    """
+    pod = LocalPod()
+    checksums = bucket_utils.get_directory_checksums(pod, object_dirs[0], "ObjKey-")
+    assert pod.execs == 1
+    assert len(checksums) == 20
+    assert "other" not in checksums
+    assert (
+        checksums["ObjKey-3"]
+        == subprocess.run(
+            ["md5sum", str(object_dirs[0] / "ObjKey-3")],
+            capture_output=True,
+            text=True,
+        ).stdout.split()[0]
+    )
+
+
+def test_compare_directory_reports_mismatches(object_dirs, caplog):
+    """
+    Check comparison of the directories with one exec per pod and reporting
+    of changed and missing objects.
+    """
+    original_dir, result_dir = object_dirs
+    pod = LocalPod()
+    result_pod = LocalPod()
+    assert bucket_utils.compare_directory(
+        pod, original_dir, result_dir, amount=20, result_pod=result_pod
+    )
+    assert (pod.execs, result_pod.execs) == (1, 1)
+
+    (result_dir / "ObjKey-5").write_text("corrupted")
+    (result_dir / "ObjKey-7").unlink()
+    assert not bucket_utils.compare_directory(pod, original_dir, result_dir, amount=20)
+    assert "ObjKey-5" in caplog.text
+    assert "ObjKey-7" in caplog.text
+    assert bucket_utils.compare_checksum_manifests(
+        bucket_utils.get_directory_checksums(pod, original_dir, "ObjKey-"),
+        bucket_utils.get_directory_checksums(pod, result_dir, "ObjKey-"),
+    ) == ["ObjKey-5", "ObjKey-7"]
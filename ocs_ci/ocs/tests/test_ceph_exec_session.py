@@ -0,0 +1,99 @@
+# -*- coding: utf8 -*-
+
+import os
+from sys import platform
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import ceph_exec_session
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.resources.pod import Pod
+from ocs_ci.ocs.tests.fake_kube_api import make_pod
+
+pytestmark = pytest.mark.skipif(
+    platform.startswith("win"), reason="requires posix shell"
+)
+
+
+@pytest.fixture
+def tools_pod(tmp_path, monkeypatch):
+    """
+    Tool box pod with fake oc binary, which runs the exec shell locally and
+    records each invocation to a file, and fake ceph binary.
+    """
+    calls_file = tmp_path / "calls"
+    oc_bin = tmp_path / "oc"
+    oc_bin.write_text(
+        "#!/bin/sh\n" f'printf "%s\\n" "$*" >> {calls_file}\n' "exec sh\n"
+    )
+    ceph_bin = tmp_path / "ceph"
+    ceph_bin.write_text(
+        "#!/bin/sh\n"
+        'case "$1" in\n'
+        '  health) echo \'{"status": "HEALTH_OK"}\';;\n'
+        '  fs) echo \'[{"name": "fs1"}, {}]\';;\n'
+        '  *) echo "Error EINVAL: unknown command $1" >&2; exit 22;;\n'
+        "esac\n"
+    )
+    for binary in (oc_bin, ceph_bin):
+        binary.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    monkeypatch.setitem(config.RUN, "ceph_exec_session", True)
+    monkeypatch.setitem(config.ENV_DATA, "cluster_path", str(tmp_path))
+    monkeypatch.setitem(config.ENV_DATA, "http_proxy", "")
+    monkeypatch.setitem(config.ENV_DATA, "no_proxy", "")
+    pod = Pod(
+        **make_pod(
+            "rook-ceph-tools", "openshift-storage", labels={"app": "rook-ceph-tools"}
+        )
+    )
+    yield pod, calls_file
+    ceph_exec_session.close_sessions()
+
+
+def test_commands_share_one_exec(tools_pod):
+    """
+    Check that the ceph commands run in a single exec process and return
+    parsed output of each command.
+    """
+    pod, calls_file = tools_pod
+    for _ in range(5):
+        assert pod.exec_ceph_cmd("ceph health") == {"status": "HEALTH_OK"}
+    assert pod.exec_ceph_cmd("ceph fs ls") == [{"name": "fs1"}]
+    assert pod.exec_ceph_cmd("ceph health", format=None, out_yaml_format=False) == (
+        '{"status": "HEALTH_OK"}\n'
+    )
+    calls = calls_file.read_text().splitlines()
+    assert len(calls) == 1
+    assert calls[0].endswith("exec -i rook-ceph-tools -- sh")
+
+
+def test_batch(tools_pod):
+    """
+    Check that batch returns the outputs in the order of the commands and
+    that failing command raises CommandFailed with its stderr.
+    """
+    pod, _ = tools_pod
+    assert pod.exec_ceph_cmds(["ceph health", "ceph fs ls"]) == [
+        {"status": "HEALTH_OK"},
+        [{"name": "fs1"}],
+    ]
+    with pytest.raises(CommandFailed, match="unknown command bogus"):
+        pod.exec_ceph_cmds(["ceph health", "ceph bogus", "ceph health"])
+    # the session is still usable after the failed command
+    assert pod.exec_ceph_cmd("ceph health") == {"status": "HEALTH_OK"}
+    assert ceph_exec_session.get_session(pod).commands == 6
+
+
+def test_session_reopened_when_closed(tools_pod):
+    """
+    Check that the session is reopened when its process exits.
+    """
+    pod, calls_file = tools_pod
+    assert pod.exec_ceph_cmd("ceph health") == {"status": "HEALTH_OK"}
+    with pytest.raises(Exception):
+        ceph_exec_session.get_session(pod).run("exit 0")
+    assert ceph_exec_session.get_session(pod).closed is False
+    assert pod.exec_ceph_cmd("ceph health") == {"status": "HEALTH_OK"}
+    assert len(calls_file.read_text().splitlines()) == 2
@@ -0,0 +1,86 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources import pod
+from ocs_ci.ocs.tests.fake_kube_api import make_pod
+
+
+@pytest.fixture
+def tools_pod_api(kube_api_cluster, monkeypatch):
+    """
+    Fake API server with the ceph tool box pods, used as the kubeconfig of
+    the current cluster.
+    """
+    pods = [
+        make_pod(
+            "rook-ceph-tools-old",
+            "openshift-storage",
+            phase="Failed",
+            labels={"app": "rook-ceph-tools"},
+        ),
+        make_pod(
+            "rook-ceph-tools-new",
+            "openshift-storage",
+            labels={"app": "rook-ceph-tools"},
+        ),
+    ]
+    monkeypatch.setitem(config.RUN, "ceph_tools_pod_cache_ttl", 30)
+    server = kube_api_cluster(pods, cluster_namespace="openshift-storage")
+    pod.invalidate_ceph_tools_pod_cache()
+    yield server
+    pod.invalidate_ceph_tools_pod_cache()
+
+
+def test_running_tools_pod_is_cached(tools_pod_api):
+    """
+    Check that the running tool box pod is resolved from a single list and
+    then served from the cache without any request.
+    """
+    server = tools_pod_api
+    OCP(kind="Pod", namespace="openshift-storage").get()
+    requests = server.requests
+    ceph_pod = pod.get_ceph_tools_pod()
+    assert ceph_pod.name == "rook-ceph-tools-new"
+    assert server.requests - requests == 2
+    requests = server.requests
+    assert pod.get_ceph_tools_pod() is ceph_pod
+    assert server.requests == requests
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        'Error from server (NotFound): pods "rook-ceph-tools-new" not found',
+        "error: unable to upgrade connection: container not found",
+        "Error from server: error dialing backend: dial tcp: i/o timeout",
+    ],
+)
+def test_cache_invalidated_when_exec_fails(tools_pod_api, monkeypatch, error):
+    """
+    Check that failure of exec drops the pod from the cache, e.g. when the
+    pod is gone or its node is down.
+    """
+    server = tools_pod_api
+    ceph_pod = pod.get_ceph_tools_pod()
+
+    def exec_oc_cmd(*args, **kwargs):
+        raise CommandFailed(error)
+
+    monkeypatch.setattr(ceph_pod.ocp, "exec_oc_cmd", exec_oc_cmd)
+    with pytest.raises(CommandFailed):
+        ceph_pod.exec_ceph_cmd("ceph health")
+    requests = server.requests
+    assert pod.get_ceph_tools_pod() is not ceph_pod
+    assert server.requests > requests
+
+
+def test_cache_disabled(tools_pod_api, monkeypatch):
+    """
+    Check that the tool box pod is resolved on every call with TTL 0.
+    """
+    monkeypatch.setitem(config.RUN, "ceph_tools_pod_cache_ttl", 0)
+    assert pod.get_ceph_tools_pod() is not pod.get_ceph_tools_pod()
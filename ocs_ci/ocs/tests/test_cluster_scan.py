@@ -0,0 +1,133 @@
+# -*- coding: utf8 -*-
+
+from unittest import mock
+
+import pytest
+
+from ocs_ci.ocs.cluster import CephCluster
+from ocs_ci.ocs.resources import pod
+from ocs_ci.ocs.tests.fake_kube_api import make_pod
+
+NAMESPACE = "openshift-storage"
+
+
+def make_mon(name, phase="Running"):
+    mon = make_pod(name, NAMESPACE, phase=phase, labels={"app": "rook-ceph-mon"})
+    mon["spec"]["containers"][0]["ports"] = [{"containerPort": 3300}]
+    return mon
+
+
+def make_ceph_pods():
+    return [
+        make_mon("rook-ceph-mon-a"),
+        make_mon("rook-ceph-mon-b"),
+        make_mon("rook-ceph-mon-c", phase="Pending"),
+        make_pod("rook-ceph-mgr-a", NAMESPACE, labels={"app": "rook-ceph-mgr"}),
+        make_pod("rook-ceph-mds-a", NAMESPACE, labels={"app": "rook-ceph-mds"}),
+        make_pod("rook-ceph-osd-0", NAMESPACE, labels={"app": "rook-ceph-osd"}),
+        make_pod("rook-ceph-osd-1", NAMESPACE, labels={"app": "rook-ceph-osd"}),
+        make_pod("rook-ceph-rgw-a", NAMESPACE, labels={"app": "rook-ceph-rgw"}),
+        make_pod("noobaa-core-0", NAMESPACE, labels={"app": "noobaa"}),
+        make_pod("rook-ceph-tools", NAMESPACE, labels={"app": "rook-ceph-tools"}),
+        make_pod("rook-ceph-osd-9", "other", labels={"app": "rook-ceph-osd"}),
+    ]
+
+
+def make_cluster_obj():
+    cluster_obj = CephCluster.__new__(CephCluster)
+    cluster_obj._namespace = NAMESPACE
+    cluster_obj.cluster = mock.Mock()
+    cluster_obj.cephfs = mock.Mock()
+    cluster_obj.mon_selector = "app=rook-ceph-mon"
+    cluster_obj.mds_selector = "app=rook-ceph-mds"
+    cluster_obj.mgr_selector = "app=rook-ceph-mgr"
+    cluster_obj.osd_selector = "app=rook-ceph-osd"
+    cluster_obj.noobaa_selector = "app=noobaa"
+    return cluster_obj
+
+
+@pytest.fixture
+def ceph_cluster(kube_api_cluster):
+    """
+    CephCluster of the fake API server with the pods of all the ceph daemons,
+    the CephCluster and CephFilesystem resources are mocked.
+    """
+    server = kube_api_cluster(make_ceph_pods(), cluster_namespace=NAMESPACE)
+    pod.invalidate_ceph_tools_pod_cache()
+    yield server, make_cluster_obj()
+    pod.invalidate_ceph_tools_pod_cache()
+
+
+def test_scan_cluster_partitions_single_list(ceph_cluster):
+    """
+    Check that the role lists are split from a single list of the pods and
+    that mons which aren't Running are skipped.
+    """
+    server, cluster_obj = ceph_cluster
+    pod.get_ceph_tools_pod()
+    requests = server.requests
+    cluster_obj.scan_cluster()
+    assert server.requests - requests == 1
+    assert len(cluster_obj.pods) == 10
+    assert [mon.name for mon in cluster_obj.mons] == [
+        "rook-ceph-mon-a",
+        "rook-ceph-mon-b",
+    ]
+    assert all(mon.port == 3300 for mon in cluster_obj.mons)
+    assert cluster_obj.mon_count == 2
+    assert cluster_obj.mgr_count == 1
+    assert cluster_obj.mds_count == 1
+    assert cluster_obj.osd_count == 2
+    assert cluster_obj.rgw_count == 1
+    assert cluster_obj.noobaa_count == 1
+    assert cluster_obj.toolbox.name == "rook-ceph-tools"
+    assert cluster_obj.last_scan_duration > 0
+    cluster_obj.cluster.reload.assert_called_once_with()
+    cluster_obj.cephfs.reload.assert_called_once_with()
+
+
+def test_scan_cluster_oc_backend(oc_cluster):
+    """
+    Check that the pods of the namespace are listed once by oc.
+    """
+    fake_oc = oc_cluster(make_ceph_pods(), cluster_namespace=NAMESPACE)
+    pod.invalidate_ceph_tools_pod_cache()
+    cluster_obj = make_cluster_obj()
+    try:
+        cluster_obj.scan_cluster()
+    finally:
+        pod.invalidate_ceph_tools_pod_cache()
+    assert [mon.name for mon in cluster_obj.mons] == [
+        "rook-ceph-mon-a",
+        "rook-ceph-mon-b",
+    ]
+    assert cluster_obj.osd_count == 2
+    assert cluster_obj.toolbox.name == "rook-ceph-tools"
+    pod_lists = [cmd for cmd in fake_oc.commands if "--selector" not in cmd]
+    assert len(pod_lists) == 1
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("app=rook-ceph-osd", True),
+        ("app==rook-ceph-osd", True),
+        ("app!=rook-ceph-osd", False),
+        ("app=rook-ceph-osd,ceph-osd-id=1", True),
+        ("app=rook-ceph-osd,ceph-osd-id!=1", False),
+        ("ceph-osd-id", True),
+        ("!ceph-osd-id", False),
+        ("failure-domain", False),
+        ("app=rook-ceph-mon", False),
+    ],
+)
+def test_match_label_selector(label, expected):
+    """
+    Check matching of the label selectors against labels of the pod.
+    """
+    osd = make_pod(
+        "rook-ceph-osd-1",
+        NAMESPACE,
+        labels={"app": "rook-ceph-osd", "ceph-osd-id": "1"},
+    )
+    assert pod.match_label_selector(osd, label) is expected
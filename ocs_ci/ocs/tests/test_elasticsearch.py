@@ -0,0 +1,189 @@
+# -*- coding: utf8 -*-
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+from elasticsearch import Elasticsearch
+
+from ocs_ci.ocs import elasticsearch
+
+
+class FakeElasticsearch(object):
+    """
+    Elasticsearch stand-in serving bulk index, aliases, mappings and scroll
+    search from memory.
+    """
+
+    def __init__(self):
+        self.indices = {}
+        self.bulk_requests = 0
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _bulk(self, body):
+        items = []
+        lines = body.decode().splitlines()
+        for action_line, doc_line in zip(lines[::2], lines[1::2]):
+            action = json.loads(action_line)["index"]
+            doc = json.loads(doc_line)
+            if "bad" in doc:
+                items.append(
+                    {
+                        "index": {
+                            "_index": action["_index"],
+                            "status": 400,
+                            "error": {"type": "mapper_parsing_exception"},
+                        }
+                    }
+                )
+                continue
+            docs = self.indices.setdefault(action["_index"], {})
+            doc_id = action.get("_id", str(len(docs)))
+            docs[doc_id] = doc
+            items.append(
+                {"index": {"_index": action["_index"], "_id": doc_id, "status": 201}}
+            )
+        return {
+            "took": 1,
+            "errors": any("error" in i["index"] for i in items),
+            "items": items,
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body):
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("X-Elastic-Product", "Elasticsearch")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                parts = [p for p in urlparse(self.path).path.split("/") if p]
+                if parts == ["_bulk"]:
+                    server.bulk_requests += 1
+                    return self._send(server._bulk(body))
+                if "_alias" in parts:
+                    return self._send(
+                        {name: {"aliases": {}} for name in server.indices}
+                    )
+                if len(parts) == 2 and parts[1] == "_mapping":
+                    return self._send({parts[0]: {"mappings": {}}})
+                if len(parts) == 2 and parts[1] == "_search":
+                    hits = [
+                        {"_index": parts[0], "_id": doc_id, "_source": doc}
+                        for doc_id, doc in server.indices[parts[0]].items()
+                    ]
+                    return self._send(
+                        {
+                            "_scroll_id": "scroll",
+                            "_shards": {"total": 1, "successful": 1, "skipped": 0},
+                            "hits": {"hits": hits},
+                        }
+                    )
+                if parts == ["_search", "scroll"]:
+                    if self.command == "DELETE":
+                        return self._send({"succeeded": True, "num_freed": 1})
+                    return self._send(
+                        {
+                            "_scroll_id": "scroll",
+                            "_shards": {"total": 1, "successful": 1, "skipped": 0},
+                            "hits": {"hits": []},
+                        }
+                    )
+                self._send({})
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+        return Handler
+
+
+@pytest.fixture
+def es_server():
+    with FakeElasticsearch() as server:
+        yield server, Elasticsearch(server.url)
+
+
+def write_dump(results_dir, index, docs):
+    results_dir.mkdir(exist_ok=True)
+    with open(results_dir / f"{index}.data.json", "w") as fd:
+        for doc in docs:
+            fd.write((doc if isinstance(doc, str) else json.dumps(doc)) + "\n")
+    (results_dir / f"{index}.mapping.json").write_text("{}")
+
+
+def test_load_streams_all_indices(es_server, tmp_path, caplog):
+    """
+    Check that the docs of all the data files are loaded by bulk requests of
+    the chunk size and that failures are counted per index.
+    """
+    server, connection = es_server
+    results_dir = tmp_path / "results"
+    write_dump(results_dir, "fio-results", [{"job": i} for i in range(25)])
+    write_dump(
+        results_dir,
+        "fio-analyzed",
+        [{"job": 1}, "not json", {"bad": True}, {"_id": "x", "_source": {"job": 2}}],
+    )
+    caplog.set_level("INFO")
+    assert elasticsearch.elasticsearch_load(
+        connection, str(tmp_path), chunk_size=10, thread_count=2
+    )
+    assert len(server.indices["fio-results"]) == 25
+    assert server.indices["fio-analyzed"] == {"0": {"job": 1}, "x": {"job": 2}}
+    assert server.bulk_requests == 3
+    assert "Index fio-results: 25 docs loaded, 0 failed" in caplog.text
+    assert "Index fio-analyzed: 2 docs loaded, 2 failed" in caplog.text
+
+
+def test_streaming_dump_round_trip(es_server, tmp_path):
+    """
+    Check that the streaming dump writes files which load back to the same
+    docs.
+    """
+    server, connection = es_server
+    server.indices = {"fio-results": {str(i): {"job": i} for i in range(5)}}
+    es = elasticsearch.ElasticSearch.__new__(elasticsearch.ElasticSearch)
+    es.con = connection
+    assert es.dumping_all_data(str(tmp_path), streaming=True)
+    lines = (tmp_path / "results" / "fio-results.data.json").read_text().splitlines()
+    assert json.loads(lines[1]) == {"_id": "1", "_source": {"job": 1}}
+    dumped = server.indices
+    server.indices = {}
+    assert elasticsearch.elasticsearch_load(connection, str(tmp_path))
+    assert server.indices == dumped
+
+
+def test_load_without_data(tmp_path):
+    """
+    Check that missing dump directory isn't loaded.
+    """
+    assert not elasticsearch.elasticsearch_load(None, str(tmp_path))
@@ -0,0 +1,163 @@
+# -*- coding: utf8 -*-
+
+import os
+import shlex
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources import pod
+from ocs_ci.ocs.tests.fake_kube_api import make_pod
+
+NAMESPACE = "openshift-storage"
+
+
+def make_pods():
+    pods = [
+        make_pod(f"{app}-{i}", NAMESPACE, labels={"app": app})
+        for app in ("rook-ceph-mon", "rook-ceph-osd", "noobaa")
+        for i in range(3)
+    ]
+    pods.append(make_pod("unlabeled", NAMESPACE))
+    for i, pod_data in enumerate(pods):
+        pod_data["metadata"]["uid"] = f"uid-{i}"
+    return pods
+
+
+@pytest.fixture
+def pods_server(kube_api_cluster):
+    """
+    Fake API server with pods of a few apps, used by the API backend.
+    """
+    server = kube_api_cluster(make_pods())
+    pod.invalidate_all_pods_cache()
+    yield server
+    pod.invalidate_all_pods_cache()
+
+
+def test_build_set_label_selector():
+    """
+    Check set based selectors and fallback for values with invalid syntax.
+    """
+    assert (
+        pod.build_set_label_selector("app", ["rook-ceph-mon", "noobaa"])
+        == "app in (rook-ceph-mon,noobaa)"
+    )
+    assert (
+        pod.build_set_label_selector("app.kubernetes.io/name", ["a"], exclude=True)
+        == "app.kubernetes.io/name notin (a)"
+    )
+    assert pod.build_set_label_selector("app", ["with space"]) is None
+    assert pod.build_set_label_selector("app", [None]) is None
+    assert pod.build_set_label_selector("name=x", ["a"]) is None
+    assert pod.build_set_label_selector("app", []) is None
+
+
+def test_get_all_pods_server_side_selector(pods_server):
+    """
+    Check that only the selected pods are listed and that the result is the
+    same as of the client side filtering.
+    """
+    selected = pod.get_all_pods(NAMESPACE, selector=["rook-ceph-mon", "noobaa"])
+    assert sorted(pod_obj.name for pod_obj in selected) == [
+        f"{app}-{i}" for app in ("noobaa", "rook-ceph-mon") for i in range(3)
+    ]
+    excluded = pod.get_all_pods(
+        NAMESPACE, selector=["rook-ceph-mon", "noobaa"], exclude_selector=True
+    )
+    assert sorted(pod_obj.name for pod_obj in excluded) == [
+        "rook-ceph-osd-0",
+        "rook-ceph-osd-1",
+        "rook-ceph-osd-2",
+        "unlabeled",
+    ]
+    # invalid label value is filtered on client side
+    assert pod.get_all_pods(NAMESPACE, selector=["not a label value"]) == []
+
+
+def test_get_all_pods_cache(pods_server):
+    """
+    Check that the cached Pod objects are returned only for the pods whose
+    resourceVersion didn't change.
+    """
+    first = pod.get_all_pods(NAMESPACE, selector=["rook-ceph-osd"], use_cache=True)
+    second = pod.get_all_pods(NAMESPACE, selector=["rook-ceph-osd"], use_cache=True)
+    assert [id(pod_obj) for pod_obj in first] == [id(pod_obj) for pod_obj in second]
+    assert pod.get_all_pods(NAMESPACE, selector=["rook-ceph-osd"])[0] is not first[0]
+
+    changed = make_pod("rook-ceph-osd-1", NAMESPACE, labels={"app": "rook-ceph-osd"})
+    changed["metadata"].update(uid="uid-4", resourceVersion="2")
+    pods_server.add(changed)
+    third = pod.get_all_pods(NAMESPACE, selector=["rook-ceph-osd"], use_cache=True)
+    assert [pod_obj is first[i] for i, pod_obj in enumerate(third)] == [
+        True,
+        False,
+        True,
+    ]
+
+
+def test_pod_temp_yaml_created_on_use(pods_server):
+    """
+    Check that listed Pod objects don't create temporary files until used.
+    """
+    pod_obj = pod.get_all_pods(NAMESPACE, selector=["noobaa"])[0]
+    assert pod_obj._temp_yaml is None
+    pod_obj.delete_temp_yaml_file()
+    assert os.path.isfile(pod_obj.temp_yaml)
+    pod_obj.delete_temp_yaml_file()
+    assert not os.path.exists(pod_obj._temp_yaml)
+
+
+def test_oc_get_set_based_selector(monkeypatch):
+    """
+    Check that the set based selector is passed to oc as single argument.
+    """
+    commands = []
+    monkeypatch.setitem(config.RUN, "oc_backend", "oc")
+    monkeypatch.setattr(
+        OCP, "exec_oc_cmd", lambda self, command, **kwargs: commands.append(command)
+    )
+    OCP(kind="Pod", namespace=NAMESPACE).get(selector="app notin (a,b)")
+    assert "--selector=app notin (a,b)" in shlex.split(commands[0])
+
+
+def test_polled_helpers_reuse_pods(pods_server, monkeypatch):
+    """
+    Check that the polled helpers don't construct new Pod objects for the
+    pods which didn't change.
+    """
+    constructed = []
+    pod_init = pod.Pod.__init__
+
+    def counted_init(self, **kwargs):
+        constructed.append(kwargs["metadata"]["name"])
+        pod_init(self, **kwargs)
+
+    monkeypatch.setattr(pod.Pod, "__init__", counted_init)
+    assert pod.check_pods_in_running_state(NAMESPACE)
+    assert len(constructed) == 10
+    assert pod.check_pods_in_running_state(NAMESPACE)
+    assert len(constructed) == 10
+
+
+def test_get_all_pods_cache_oc_backend(oc_cluster):
+    """
+    Check the server side selector and the reuse of the cached Pod objects
+    with the oc backend.
+    """
+    fake_oc = oc_cluster(make_pods())
+    pod.invalidate_all_pods_cache()
+    try:
+        first = pod.get_all_pods(NAMESPACE, selector=["rook-ceph-osd"], use_cache=True)
+        second = pod.get_all_pods(NAMESPACE, selector=["rook-ceph-osd"], use_cache=True)
+    finally:
+        pod.invalidate_all_pods_cache()
+    assert [pod_obj.name for pod_obj in first] == [
+        "rook-ceph-osd-0",
+        "rook-ceph-osd-1",
+        "rook-ceph-osd-2",
+    ]
+    assert all(a is b for a, b in zip(first, second))
+    assert len(fake_oc.commands) == 2
+    assert "--selector=app in (rook-ceph-osd)" in shlex.split(fake_oc.commands[0])
@@ -0,0 +1,251 @@
+# -*- coding: utf8 -*-
+
+import pytest
+import yaml
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.tests.fake_kube_api import make_pod
+
+
+@pytest.fixture
+def fake_api(kube_api_cluster):
+    """
+    Fake API server with a few pods and kubeconfig pointing to it, with the
+    API backend enabled in config.
+    """
+    pods = [
+        make_pod("rook-ceph-mon-a", "openshift-storage", labels={"app": "mon"}),
+        make_pod("rook-ceph-mon-b", "openshift-storage", labels={"app": "mon"}),
+        make_pod("rook-ceph-osd-0", "openshift-storage", labels={"app": "osd"}),
+        make_pod("nginx", "default", phase="Pending"),
+    ]
+    server = kube_api_cluster(pods)
+    return server, config.RUN["kubeconfig"]
+
+
+def test_get_list_same_shape_as_oc(fake_api):
+    """
+    Check that list returned by the API backend has the shape of the parsed
+    'oc get -o yaml' output.
+    """
+    _, kubeconfig = fake_api
+    ocp = OCP(kind="Pod", namespace="openshift-storage", cluster_kubeconfig=kubeconfig)
+    data = ocp.get()
+    assert data["kind"] == "List"
+    assert data["apiVersion"] == "v1"
+    assert [item["metadata"]["name"] for item in data["items"]] == [
+        "rook-ceph-mon-a",
+        "rook-ceph-mon-b",
+        "rook-ceph-osd-0",
+    ]
+    for item in data["items"]:
+        assert item["kind"] == "Pod"
+        assert item["apiVersion"] == "v1"
+
+
+def test_get_selector_and_all_namespaces(fake_api):
+    """
+    Check label selector and listing in all namespaces.
+    """
+    _, kubeconfig = fake_api
+    ocp = OCP(kind="pod", namespace="openshift-storage", cluster_kubeconfig=kubeconfig)
+    assert len(ocp.get(selector="app=mon")["items"]) == 2
+    ocp = OCP(kind="po", cluster_kubeconfig=kubeconfig)
+    assert len(ocp.get(all_namespaces=True)["items"]) == 4
+
+
+def test_get_namespace_as_oc(fake_api, tmp_path):
+    """
+    Check that the namespace of the object takes precedence over all
+    namespaces and that the namespace of the kubeconfig context is used when
+    none is given, as oc does.
+    """
+    server, _ = fake_api
+    ocp = OCP(kind="Pod", namespace="default", cluster_kubeconfig=fake_api[1])
+    assert [
+        item["metadata"]["name"] for item in ocp.get(all_namespaces=True)["items"]
+    ] == ["nginx"]
+
+    kubeconfig = server.write_kubeconfig(
+        str(tmp_path / "kubeconfig-storage"), namespace="openshift-storage"
+    )
+    ocp = OCP(kind="Pod", cluster_kubeconfig=kubeconfig)
+    assert len(ocp.get()["items"]) == 3
+    assert ocp.get(resource_name="rook-ceph-osd-0")["metadata"]["name"] == (
+        "rook-ceph-osd-0"
+    )
+    assert len(ocp.get(all_namespaces=True)["items"]) == 4
+    ocp = OCP(kind="Pod", cluster_kubeconfig=fake_api[1])
+    assert [item["metadata"]["name"] for item in ocp.get()["items"]] == ["nginx"]
+
+
+def test_get_single_and_not_found(fake_api):
+    """
+    Check that single resource is returned as is and that a missing resource
+    fails as the oc command does.
+    """
+    _, kubeconfig = fake_api
+    ocp = OCP(kind="Pod", namespace="default", cluster_kubeconfig=kubeconfig)
+    assert ocp.get("nginx")["status"]["phase"] == "Pending"
+    with pytest.raises(CommandFailed, match="NotFound"):
+        ocp.get("missing")
+    assert ocp.get("missing", dont_raise=True, silent=True) is None
+
+
+def test_unknown_kind(fake_api):
+    """
+    Check that unknown kind fails with the oc error message.
+    """
+    _, kubeconfig = fake_api
+    ocp = OCP(kind="Unicorn", cluster_kubeconfig=kubeconfig)
+    with pytest.raises(CommandFailed, match="doesn't have a resource type"):
+        ocp.get("x")
+
+
+def test_create_patch_delete(fake_api, tmp_path):
+    """
+    Check create from yaml file, patch and delete of a resource.
+    """
+    server, kubeconfig = fake_api
+    pod_yaml = tmp_path / "pod.yaml"
+    pod_yaml.write_text(yaml.safe_dump(make_pod("created", "default")))
+    ocp = OCP(kind="Pod", namespace="default", cluster_kubeconfig=kubeconfig)
+    assert ocp.create(yaml_file=str(pod_yaml))["metadata"]["name"] == "created"
+    assert ocp.patch("created", '{"metadata": {"labels": {"patched": "yes"}}}', "merge")
+    assert ocp.get("created")["metadata"]["labels"] == {"patched": "yes"}
+    # the same patch again doesn't change the pod, as with oc
+    assert not ocp.patch(
+        "created", '{"metadata": {"labels": {"patched": "yes"}}}', "merge"
+    )
+    assert ocp.delete(resource_name="created") == 'pod "created" deleted'
+    assert ("pods", "default", "created") not in server.store
+
+
+def test_wait_condition(fake_api):
+    """
+    Check that wait for condition is served from the watch stream.
+    """
+    _, kubeconfig = fake_api
+    ocp = OCP(kind="Pod", namespace="openshift-storage", cluster_kubeconfig=kubeconfig)
+    assert ocp.wait(condition="Ready", selector="app=mon", timeout=5)
+
+
+def test_connections_are_pooled(fake_api):
+    """
+    Check that repeated calls reuse the persistent connection.
+    """
+    server, kubeconfig = fake_api
+    ocp = OCP(kind="Pod", namespace="openshift-storage", cluster_kubeconfig=kubeconfig)
+    ocp.get()
+    connections = server.connections
+    for _ in range(20):
+        ocp.get()
+    assert server.connections == connections
+
+
+def test_wait_for_resource_single_list_per_sample(fake_api):
+    """
+    Check that wait_for_resource computes the columns from the listed items
+    and doesn't run 'oc get' per resource.
+    """
+    server, kubeconfig = fake_api
+    ocp = OCP(kind="Pod", namespace="openshift-storage", cluster_kubeconfig=kubeconfig)
+    ocp.get()
+    requests = server.requests
+    assert ocp.wait_for_resource(
+        condition="Running", selector="app=mon", resource_count=2, timeout=10
+    )
+    assert server.requests - requests == 1
+    assert ocp.wait_for_resource(
+        condition="1/1", resource_name="rook-ceph-osd-0", column="READY"
+    )
+
+
+def test_wait_for_resource_watch(fake_api, monkeypatch):
+    """
+    Check wait_for_resource driven by the watch stream.
+    """
+    _, kubeconfig = fake_api
+    ocp = OCP(kind="Pod", namespace="default", cluster_kubeconfig=kubeconfig)
+    monkeypatch.setattr(ocp, "describe", lambda *args, **kwargs: "")
+    assert ocp.wait_for_resource(
+        condition="Pending", resource_name="nginx", timeout=10, use_watch=True
+    )
+    with pytest.raises(TimeoutExpiredError):
+        ocp.wait_for_resource(
+            condition="Running", resource_name="nginx", timeout=2, use_watch=True
+        )
+
+
+def test_get_resource_from_crd_printer_columns(fake_api):
+    """
+    Check that get_resource computes the custom resource columns by the
+    printer columns of its CRD.
+    """
+    server, kubeconfig = fake_api
+    server.add(
+        {
+            "apiVersion": "apiextensions.k8s.io/v1",
+            "kind": "CustomResourceDefinition",
+            "metadata": {"name": "storageclusters.ocs.openshift.io"},
+            "spec": {
+                "group": "ocs.openshift.io",
+                "names": {"kind": "StorageCluster", "plural": "storageclusters"},
+                "versions": [
+                    {
+                        "name": "v1",
+                        "additionalPrinterColumns": [
+                            {
+                                "name": "Phase",
+                                "type": "string",
+                                "jsonPath": ".status.phase",
+                            },
+                            {
+                                "name": "Version",
+                                "type": "string",
+                                "jsonPath": ".status.version",
+                            },
+                        ],
+                    }
+                ],
+            },
+        }
+    )
+    server.add(
+        {
+            "apiVersion": "ocs.openshift.io/v1",
+            "kind": "StorageCluster",
+            "metadata": {
+                "name": "ocs-storagecluster",
+                "namespace": "openshift-storage",
+            },
+            "status": {"phase": "Ready", "version": "4.19.0"},
+        }
+    )
+    ocp = OCP(
+        kind="StorageCluster",
+        namespace="openshift-storage",
+        cluster_kubeconfig=kubeconfig,
+    )
+    assert ocp.get_resource("ocs-storagecluster", "VERSION") == "4.19.0"
+    assert ocp.get_column_values("PHASE") == {"ocs-storagecluster": "Ready"}
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        ("pod/created patched", True),
+        ("pod/created patched (no change)", False),
+    ],
+)
+def test_patch_oc_result(output, expected, monkeypatch):
+    """
+    Check that patch with the oc backend returns whether the resource was
+    changed, as with the API backend.
+    """
+    monkeypatch.setitem(config.RUN, "oc_backend", "oc")
+    monkeypatch.setattr(OCP, "exec_oc_cmd", lambda self, command, **kw: output)
+    ocp = OCP(kind="Pod", namespace="default")
+    assert ocp.patch("created", '{"metadata": {"labels": {"a": "b"}}}') is expected
@@ -0,0 +1,108 @@
+# -*- coding: utf8 -*-
+
+import os
+import re
+
+import pytest
+
+from ocs_ci.ocs.must_gather import must_gather
+from ocs_ci.ocs.must_gather.must_gather import MustGather, MustGatherIndex
+
+
+@pytest.fixture
+def mg_dir(tmp_path):
+    """
+    Must gather like directory with ceph logs, yaml files and a symlink.
+    """
+    root = tmp_path / "mg_ocs_logs"
+    files = {
+        "a/ceph/ceph_logs/journal_compute-1/log.log": "journal\n",
+        "a/ceph/must_gather_commands/ceph_status": "HEALTH_OK\n",
+        "a/ceph/must_gather_commands/ceph_osd_df": "Exit Code 2\n",
+        "a/ceph/gather-debug.log": "exit code 1\n",
+        "a/namespaces/openshift-storage/pods/rook-ceph-osd-0/pod.yaml": "Kind: Pod\n",
+        "a/namespaces/openshift-storage/pods/noobaa-core-0/pod.yaml": "kind: Pod\n",
+        "a/cluster-scoped-resources/bad.yaml": "a: 1\n",
+        "a/namespaces/openshift-storage/empty.log": "",
+        "b/ceph_status": "duplicate\n",
+    }
+    for path, content in files.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(content)
+    os.symlink(root / "a", root / "b" / "link")
+    return str(root)
+
+
+def test_index_matches_walk(mg_dir):
+    """
+    Check that the index has the paths of os.walk, in the same order.
+    """
+    index = MustGatherIndex(mg_dir)
+    walk_paths = []
+    walk_dirs = []
+    for root, dirs, files in os.walk(mg_dir):
+        walk_paths += [os.path.join(root, name) for name in files + dirs]
+        walk_dirs.append(root)
+    assert sorted(index.paths) == sorted(walk_paths)
+    assert index.dirs == walk_dirs
+    for root, dirs, files in os.walk(mg_dir):
+        if "ceph_status" in files:
+            assert index.find_file("ceph_status") == os.path.join(root, "ceph_status")
+            break
+    assert index.find_file("missing") is None
+    assert index.file_sizes[os.path.join(mg_dir, "a/ceph/gather-debug.log")] == 12
+    assert index.contains("/ceph_logs/journal_")
+    assert not index.contains("/journal_compute-1/log.log\n")
+    assert not index.contains("/noobaa_logs/")
+
+
+def test_find_files_with_pattern(mg_dir):
+    """
+    Check the parallel streaming scan of the file content.
+    """
+    index = MustGatherIndex(mg_dir)
+    file_paths = sorted(index.file_sizes) + [os.path.join(mg_dir, "missing")]
+    found = must_gather.find_files_with_pattern(
+        file_paths, re.compile("exit code [1-9]+", re.IGNORECASE), workers=2
+    )
+    assert [os.path.relpath(path, mg_dir) for path in found] == [
+        "a/ceph/gather-debug.log",
+        "a/ceph/must_gather_commands/ceph_osd_df",
+    ]
+
+
+def test_must_gather_validation(mg_dir, monkeypatch):
+    """
+    Check expected files, empty files, content issues and paths checks.
+    """
+    mg = MustGather()
+    mg.root = mg_dir
+    mg.type_log = "OTHERS"
+    monkeypatch.setattr(
+        must_gather.version, "get_ocs_version_from_csv", lambda **kwargs: "4.15"
+    )
+    monkeypatch.setitem(
+        must_gather.GATHER_COMMANDS_VERSION,
+        4.15,
+        {"OTHERS": ["ceph_osd_df", "pod.yaml", "bad.yaml", "missing.yaml"]},
+    )
+    monkeypatch.setattr(must_gather, "storagecluster_independent_check", lambda: False)
+    mg.validate_file_size()
+    assert mg.empty_files == ["empty.log"]
+    mg.validate_expected_files()
+    assert mg.files_not_exist == ["missing.yaml"]
+    assert mg.files_content_issue == ["bad.yaml"]
+    mg.files_content_issue = []
+
+    mg.type_log = "CEPH"
+    monkeypatch.setattr(mg, "ocs_version", must_gather.version.VERSION_4_9)
+    mg.verify_ceph_file_content()
+    assert mg.files_content_issue == [
+        os.path.join(mg_dir, "a/ceph/must_gather_commands/ceph_osd_df")
+    ]
+
+    mg.get_all_paths()
+    assert mg.verify_paths_in_dir(["/ceph_logs/journal_", "/noobaa/"]) == ["/noobaa/"]
+    assert mg.verify_paths_not_in_dir(["/ceph_logs/journal_", "/noobaa/"]) == [
+        "/ceph_logs/journal_"
+    ]
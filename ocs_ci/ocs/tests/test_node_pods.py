@@ -0,0 +1,105 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import node
+from ocs_ci.ocs.exceptions import NotFoundError, ResourceNotFoundError
+from ocs_ci.ocs.resources import pod
+from ocs_ci.ocs.tests.fake_kube_api import make_node, make_pod
+
+NAMESPACE = "openshift-storage"
+
+
+@pytest.fixture
+def cluster(kube_api_cluster):
+    """
+    Fake API server with three nodes and ceph and app pods spread on them.
+    """
+    objects = [make_node(f"worker-{i}") for i in (0, 1, 10)]
+    objects += [
+        make_pod(
+            f"rook-ceph-osd-{i}",
+            NAMESPACE,
+            labels={"app": "rook-ceph-osd"},
+            node=f"worker-{i}",
+        )
+        for i in (0, 1, 10)
+    ]
+    objects += [
+        make_pod(
+            "rook-ceph-mon-a",
+            NAMESPACE,
+            labels={"app": "rook-ceph-mon"},
+            node="worker-0",
+        ),
+        make_pod("rook-ceph-tools-1", NAMESPACE, node="worker-1"),
+        make_pod("rook-ceph-mgr-a", NAMESPACE, node="worker-1"),
+        make_pod("app-pod", "app-namespace", node="worker-1"),
+    ]
+    return kube_api_cluster(objects, cluster_namespace=NAMESPACE)
+
+
+def test_get_node_pods_single_listing(cluster):
+    """
+    Check that the pods of the node are found by one listing of the pods
+    per namespace instead of fetching each pod and all the nodes.
+    """
+    pods = pod.get_all_pods(NAMESPACE) + pod.get_all_pods("app-namespace")
+    requests = cluster.requests
+    node_pods = node.get_node_pods("worker-1", pods)
+    assert cluster.requests - requests == 2
+    assert sorted(p.name for p in node_pods) == [
+        "app-pod",
+        "rook-ceph-mgr-a",
+        "rook-ceph-osd-1",
+        "rook-ceph-tools-1",
+    ]
+
+
+def test_get_node_pods_not_found(cluster):
+    """
+    Check handling of the pods which don't exist anymore.
+    """
+    pods = pod.get_all_pods(NAMESPACE)
+    cluster.store = {
+        key: obj for key, obj in cluster.store.items() if key[2] != "rook-ceph-osd-1"
+    }
+    assert sorted(p.name for p in node.get_node_pods("worker-1", pods)) == [
+        "rook-ceph-mgr-a",
+        "rook-ceph-tools-1",
+    ]
+    with pytest.raises(ResourceNotFoundError, match="rook-ceph-osd-1"):
+        node.get_node_pods("worker-1", pods, raise_pod_not_found_error=True)
+
+
+def test_node_helpers_share_index(cluster):
+    """
+    Check the helpers served from the pod to node names index.
+    """
+    assert sorted(node.get_node_rook_ceph_pod_names("worker-1")) == [
+        "rook-ceph-mgr-a",
+        "rook-ceph-osd-1",
+    ]
+    requests = cluster.requests
+    assert sorted(node.get_osd_running_nodes()) == ["worker-0", "worker-1", "worker-10"]
+    # osd pods list and pods index, the nodes are not fetched
+    assert cluster.requests - requests == 2
+    osd_pod = pod.get_osd_pods()[0]
+    assert pod.get_pod_node(osd_pod).name == osd_pod.data["spec"]["nodeName"]
+
+
+def test_app_pod_running_nodes_not_found(cluster):
+    """
+    Check that the node names are taken from the pods index and that the
+    pods which are not scheduled or don't exist are reported.
+    """
+    app_pod = pod.Pod(**make_pod("app-pod", "app-namespace", node="worker-1"))
+    pod.get_pods_node_names([app_pod])
+    requests = cluster.requests
+    assert node.get_app_pod_running_nodes([app_pod]) == ["worker-1"]
+    assert cluster.requests - requests == 1
+    cluster.add(make_pod("pending-pod", "app-namespace", phase="Pending"))
+    for name in ("pending-pod", "missing-pod"):
+        other_pod = pod.Pod(**make_pod(name, "app-namespace"))
+        with pytest.raises(NotFoundError, match=name):
+            node.get_app_pod_running_nodes([app_pod, other_pod])
@@ -0,0 +1,152 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants, node
+from ocs_ci.ocs.exceptions import ResourceWrongStatusException
+from ocs_ci.ocs.tests.fake_kube_api import make_node
+
+
+def make_nodes():
+    nodes = [make_node(f"master-{i}", ["control-plane", "master"]) for i in range(3)]
+    nodes += [make_node(f"worker-{i}", ["worker"]) for i in range(3)]
+    nodes.append(make_node("infra-0", ["infra", "worker"]))
+    nodes.append(make_node("compact-0", ["master", "worker"], unschedulable=True))
+    return nodes
+
+
+@pytest.fixture
+def nodes_server(kube_api_cluster, monkeypatch):
+    """
+    Fake API server with masters, workers and infra node.
+    """
+    monkeypatch.setitem(config.RUN, "node_view_cache_ttl", 0)
+    server = kube_api_cluster(make_nodes(), platform="vsphere", cluster_type="")
+    node.invalidate_node_view()
+    yield server
+    node.invalidate_node_view()
+
+
+def test_node_view_roles_and_status(nodes_server):
+    """
+    Check roles from node-role labels and status from node conditions.
+    """
+    node_view = node.NodeView.fetch()
+    assert node_view.roles("master-0") == ["control-plane", "master"]
+    assert node_view.roles("missing") == []
+    assert node_view.status("worker-0") == constants.NODE_READY
+    assert node_view.status("compact-0") == constants.NODE_READY_SCHEDULING_DISABLED
+    assert node_view.status("missing") is None
+    assert node_view.names_with_role("master") == [
+        "compact-0",
+        "master-0",
+        "master-1",
+        "master-2",
+    ]
+    assert node_view.names_with_role("worker", exclude_roles=["infra", "master"]) == [
+        "worker-0",
+        "worker-1",
+        "worker-2",
+    ]
+
+
+def test_get_nodes_single_listing(nodes_server, monkeypatch):
+    """
+    Check that get_nodes lists the nodes on each call by default and reuses
+    the snapshot when the caller opts in.
+    """
+    node.NodeView.fetch()
+    node.invalidate_node_view()
+    requests = nodes_server.requests
+    node.get_nodes()
+    node.get_nodes()
+    assert nodes_server.requests - requests == 2
+
+    node.invalidate_node_view()
+    requests = nodes_server.requests
+    workers = node.get_nodes(max_age=5)
+    assert [n.name for n in workers] == [
+        "compact-0",
+        "infra-0",
+        "worker-0",
+        "worker-1",
+        "worker-2",
+    ]
+    assert [n.name for n in node.get_nodes(constants.MASTER_MACHINE, 2, 5)] == [
+        "compact-0",
+        "master-0",
+    ]
+    assert nodes_server.requests - requests == 1
+
+    monkeypatch.setitem(config.ENV_DATA, "platform", constants.ROSA_PLATFORM)
+    monkeypatch.setitem(config.RUN, "node_view_cache_ttl", 5)
+    assert [n.name for n in node.get_nodes()] == [
+        "compact-0",
+        "worker-0",
+        "worker-1",
+        "worker-2",
+    ]
+    assert nodes_server.requests - requests == 1
+    node.get_nodes(max_age=0)
+    assert nodes_server.requests - requests == 2
+
+
+def test_wait_for_nodes_status(nodes_server, monkeypatch):
+    """
+    Check that each sample of the wait lists the nodes once.
+    """
+    monkeypatch.setattr(node.OCS, "describe", lambda self: f"{self.name} details")
+    node.NodeView.fetch()
+    requests = nodes_server.requests
+    node.wait_for_nodes_status(["worker-0", "worker-1"], timeout=5, sleep=0)
+    assert nodes_server.requests - requests == 1
+    node.wait_for_nodes_status(
+        ["compact-0"], status=constants.NODE_READY_SCHEDULING_DISABLED, timeout=5
+    )
+    nodes_server.add(make_node("worker-1", ["worker"], ready=False))
+    assert [n.name for n in node.get_nodes_in_statuses([constants.NODE_NOT_READY])] == [
+        "worker-1"
+    ]
+    with pytest.raises(ResourceWrongStatusException, match="worker-1"):
+        node.wait_for_nodes_status(["worker-0", "worker-1"], timeout=1, sleep=0.2)
+
+
+def test_label_nodes_invalidates_view(nodes_server, monkeypatch):
+    """
+    Check that the nodes relabeled by label_nodes are seen without waiting
+    for the snapshot to expire.
+    """
+
+    def add_label(self, resource_name, label):
+        nodes_server.add(make_node(resource_name, ["infra", "worker"]))
+
+    monkeypatch.setattr(node.ocp.OCP, "add_label", add_label)
+    assert node.get_node_view(60).names_with_role("infra") == ["infra-0"]
+    node.label_nodes([node.OCS(**make_node("worker-0", ["worker"]))])
+    assert node.get_node_view(60).names_with_role("infra") == ["infra-0", "worker-0"]
+
+
+def test_get_nodes_oc_backend(oc_cluster, monkeypatch):
+    """
+    Check that get_nodes lists the nodes once by oc.
+    """
+    monkeypatch.setitem(config.RUN, "node_view_cache_ttl", 0)
+    fake_oc = oc_cluster(make_nodes(), platform="vsphere", cluster_type="")
+    node.invalidate_node_view()
+    try:
+        assert [n.name for n in node.get_nodes(constants.MASTER_MACHINE)] == [
+            "compact-0",
+            "master-0",
+            "master-1",
+            "master-2",
+        ]
+        assert node.get_node_view(0).status("compact-0") == (
+            constants.NODE_READY_SCHEDULING_DISABLED
+        )
+    finally:
+        node.invalidate_node_view()
+    assert [cmd.split(" get ")[1].split()[0].lower() for cmd in fake_oc.commands] == [
+        "node",
+        "node",
+    ]
@@ -0,0 +1,155 @@
+# -*- coding: utf8 -*-
+
+import calendar
+import gzip
+import os
+import sys
+import time
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import utils
+from ocs_ci.ocs.must_gather.must_gather import get_pod_log_containers
+from ocs_ci.ocs.resources.pod import Pod
+from ocs_ci.ocs.tests.fake_kube_api import make_pod
+
+NAMESPACE = "openshift-storage"
+
+
+def to_epoch(rfc3339):
+    return calendar.timegm(time.strptime(rfc3339, "%Y-%m-%dT%H:%M:%SZ"))
+
+
+@pytest.fixture
+def fake_oc(tmp_path, monkeypatch):
+    """
+    Fake oc binary printing three log lines per container, 'oc logs' of the
+    broken pod fails and of the noisy pod writes a lot to stderr first. The
+    invocations are recorded.
+    """
+    calls_file = tmp_path / "calls"
+    oc_bin = tmp_path / "bin" / "oc"
+    oc_bin.parent.mkdir()
+    oc_bin.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"with open({str(calls_file)!r}, 'a') as f:\n"
+        "    f.write(' '.join(sys.argv[1:]) + '\\n')\n"
+        "if 'broken' in sys.argv:\n"
+        "    sys.stderr.write('pods \"broken\" not found')\n"
+        "    sys.exit(1)\n"
+        "if 'noisy' in sys.argv:\n"
+        "    sys.stderr.write('warning\\n' * 100000)\n"
+        "times = ['10:00:00', '10:00:05', '10:00:10']\n"
+        "if '--all-containers=true' in sys.argv:\n"
+        "    times *= 2\n"
+        "for i, t in enumerate(times):\n"
+        "    prefix = f'2024-01-01T{t}.123Z ' if '--timestamps' in sys.argv else ''\n"
+        "    print(f'{prefix}line {i}', flush=True)\n"
+    )
+    oc_bin.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{oc_bin.parent}:{os.environ['PATH']}")
+    monkeypatch.delenv("KUBECONFIG", raising=False)
+    monkeypatch.setitem(config.ENV_DATA, "cluster_path", str(tmp_path))
+    monkeypatch.setitem(config.ENV_DATA, "http_proxy", "")
+    monkeypatch.setitem(config.ENV_DATA, "no_proxy", "")
+    yield calls_file
+
+
+def make_pods():
+    pods = []
+    for name in ("rook-ceph-osd-0", "rook-ceph-mon-a", "broken"):
+        pod_data = make_pod(name, NAMESPACE)
+        pod_data["spec"]["containers"] = [{"name": "main"}, {"name": "log-collector"}]
+        pods.append(Pod(**pod_data))
+    return pods
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="requires posix")
+def test_collect_pods_logs(fake_oc, tmp_path):
+    """
+    Check that each container log is streamed to its file, that the
+    containers collected by must-gather are skipped and failures counted.
+    """
+    log_dir = str(tmp_path / "logs")
+    stats = utils.collect_pods_logs(
+        log_dir,
+        make_pods(),
+        skip_containers={(NAMESPACE, "rook-ceph-mon-a", "main")},
+        workers=3,
+    )
+    assert stats["files"] == 3
+    assert stats["skipped"] == 1
+    assert stats["failed"] == 2
+    assert stats["bytes"] == 3 * len("line 0\nline 1\nline 2\n")
+    assert sorted(os.listdir(log_dir)) == [
+        "broken_log-collector.log",
+        "broken_main.log",
+        "rook-ceph-mon-a_log-collector.log",
+        "rook-ceph-osd-0_log-collector.log",
+        "rook-ceph-osd-0_main.log",
+    ]
+    with open(os.path.join(log_dir, "rook-ceph-osd-0_main.log")) as f:
+        assert f.read() == "line 0\nline 1\nline 2\n"
+    assert (
+        f"-n {NAMESPACE} logs rook-ceph-osd-0 -c main"
+        in fake_oc.read_text().splitlines()
+    )
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="requires posix")
+def test_collect_pods_logs_time_window(fake_oc, tmp_path):
+    """
+    Check that the logs are limited to the time window and compressed, also
+    for the containers following the first one.
+    """
+    log_dir = str(tmp_path / "logs")
+    stats = utils.collect_pods_logs(
+        log_dir,
+        make_pods()[:1],
+        all_containers=True,
+        since_time=to_epoch("2024-01-01T09:59:59Z"),
+        until_time=to_epoch("2024-01-01T10:00:05Z"),
+        compress=True,
+    )
+    assert stats["files"] == 1
+    with gzip.open(os.path.join(log_dir, "rook-ceph-osd-0.log.gz"), "rt") as f:
+        assert f.read().splitlines() == [
+            "2024-01-01T10:00:00.123Z line 0",
+            "2024-01-01T10:00:05.123Z line 1",
+            "2024-01-01T10:00:00.123Z line 3",
+            "2024-01-01T10:00:05.123Z line 4",
+        ]
+    assert fake_oc.read_text().splitlines() == [
+        f"-n {NAMESPACE} logs rook-ceph-osd-0 --all-containers=true "
+        "--since-time=2024-01-01T09:59:59Z --timestamps"
+    ]
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="requires posix")
+def test_stream_pod_logs_noisy_stderr(fake_oc, tmp_path):
+    """
+    Check that a lot of stderr output doesn't block the logs streaming.
+    """
+    file_path, size = utils.stream_pod_logs(
+        "noisy", NAMESPACE, str(tmp_path / "noisy.log"), timeout=30
+    )
+    assert size == len("line 0\nline 1\nline 2\n")
+
+
+def test_get_pod_log_containers(tmp_path):
+    """
+    Check the containers whose logs are in the must-gather directory.
+    """
+    pods_dir = tmp_path / "image" / "namespaces" / NAMESPACE / "pods"
+    for pod_name, container in (("rook-ceph-mon-a", "mon"), ("noobaa-0", "core")):
+        logs_dir = pods_dir / pod_name / container / container / "logs"
+        logs_dir.mkdir(parents=True)
+        (logs_dir / "current.log").write_text("log\n")
+    (pods_dir / "noobaa-0" / "noobaa-0.yaml").write_text("kind: Pod\n")
+    assert get_pod_log_containers(str(tmp_path)) == {
+        (NAMESPACE, "rook-ceph-mon-a", "mon"),
+        (NAMESPACE, "noobaa-0", "core"),
+    }
+    assert get_pod_log_containers(str(tmp_path / "missing")) == set()
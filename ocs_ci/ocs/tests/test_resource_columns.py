@@ -0,0 +1,273 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import resource_columns
+from ocs_ci.ocs.exceptions import UnknownResourceColumn
+from ocs_ci.ocs.tests.fake_kube_api import make_pod
+
+
+def container_status(state, ready=False):
+    return {"name": "main", "ready": ready, "state": state}
+
+
+@pytest.mark.parametrize(
+    "status,expected",
+    [
+        ({"phase": "Pending"}, "Pending"),
+        (
+            {
+                "phase": "Pending",
+                "containerStatuses": [
+                    container_status({"waiting": {"reason": "ContainerCreating"}})
+                ],
+            },
+            "ContainerCreating",
+        ),
+        (
+            {
+                "phase": "Running",
+                "containerStatuses": [
+                    container_status({"running": {}}, ready=True),
+                ],
+            },
+            "Running",
+        ),
+        (
+            {
+                "phase": "Running",
+                "containerStatuses": [
+                    container_status({"waiting": {"reason": "CrashLoopBackOff"}})
+                ],
+            },
+            "CrashLoopBackOff",
+        ),
+        (
+            {
+                "phase": "Succeeded",
+                "containerStatuses": [
+                    container_status(
+                        {"terminated": {"reason": "Completed", "exitCode": 0}}
+                    )
+                ],
+            },
+            "Completed",
+        ),
+        (
+            {
+                "phase": "Failed",
+                "containerStatuses": [
+                    container_status({"terminated": {"exitCode": 137, "signal": 9}})
+                ],
+            },
+            "Signal:9",
+        ),
+        (
+            {
+                "phase": "Pending",
+                "initContainerStatuses": [
+                    container_status({"waiting": {"reason": "PodInitializing"}})
+                ],
+            },
+            "Init:0/1",
+        ),
+        (
+            {
+                "phase": "Pending",
+                "initContainerStatuses": [
+                    container_status({"terminated": {"reason": "Error"}})
+                ],
+            },
+            "Init:Error",
+        ),
+    ],
+)
+def test_pod_status(status, expected):
+    """
+    Check that the pod STATUS column is computed as printed by oc.
+    """
+    pod = {
+        "kind": "Pod",
+        "metadata": {"name": "pod"},
+        "spec": {"initContainers": [{"name": "init"}], "containers": [{}]},
+        "status": status,
+    }
+    assert resource_columns.get_column_value(pod, "STATUS") == expected
+
+
+def test_pod_terminating():
+    """
+    Check that the pod being deleted is reported as Terminating.
+    """
+    pod = make_pod("pod")
+    pod["metadata"]["deletionTimestamp"] = "2024-01-01T00:00:00Z"
+    assert resource_columns.get_column_value(pod, "STATUS") == "Terminating"
+
+
+def test_pod_ready():
+    """
+    Check the pod READY column.
+    """
+    assert resource_columns.get_column_value(make_pod("pod"), "READY") == "1/1"
+    pod = make_pod("pod", phase="Pending")
+    assert resource_columns.get_column_value(pod, "READY", kind="pods") == "0/1"
+
+
+def test_node_columns():
+    """
+    Check the node STATUS and ROLES columns.
+    """
+    node = {
+        "kind": "Node",
+        "metadata": {
+            "name": "node",
+            "labels": {
+                "node-role.kubernetes.io/worker": "",
+                "node-role.kubernetes.io/master": "",
+                "kubernetes.io/hostname": "node",
+            },
+        },
+        "spec": {"unschedulable": True},
+        "status": {"conditions": [{"type": "Ready", "status": "True"}]},
+    }
+    assert (
+        resource_columns.get_column_value(node, "STATUS") == "Ready,SchedulingDisabled"
+    )
+    assert resource_columns.get_column_value(node, "ROLES") == "master,worker"
+
+
+def test_pvc_columns():
+    """
+    Check the PVC columns.
+    """
+    pvc = {
+        "kind": "PersistentVolumeClaim",
+        "metadata": {"name": "pvc"},
+        "spec": {"volumeName": "pv-1", "storageClassName": "ocs-storagecluster"},
+        "status": {
+            "phase": "Bound",
+            "capacity": {"storage": "10Gi"},
+            "accessModes": ["ReadWriteOnce", "ReadWriteMany"],
+        },
+    }
+    assert resource_columns.get_column_value(pvc, "STATUS") == "Bound"
+    assert resource_columns.get_column_value(pvc, "CAPACITY") == "10Gi"
+    assert resource_columns.get_column_value(pvc, "ACCESS MODES") == "RWO,RWX"
+
+
+def test_volumes_terminating():
+    """
+    Check that the PVC and PV being deleted are reported as Terminating.
+    """
+    pvc = {
+        "kind": "PersistentVolumeClaim",
+        "metadata": {"name": "pvc", "deletionTimestamp": "2024-01-01T00:00:00Z"},
+        "status": {"phase": "Bound"},
+    }
+    assert resource_columns.get_column_value(pvc, "STATUS") == "Terminating"
+    pv = {
+        "kind": "PersistentVolume",
+        "metadata": {"name": "pv", "deletionTimestamp": "2024-01-01T00:00:00Z"},
+        "status": {"phase": "Released"},
+    }
+    assert resource_columns.get_column_value(pv, "STATUS") == "Terminating"
+    del pv["metadata"]["deletionTimestamp"]
+    assert resource_columns.get_column_value(pv, "STATUS") == "Released"
+
+
+def test_unknown_column():
+    """
+    Check that unknown column is reported to let the caller fall back to the
+    oc table output.
+    """
+    with pytest.raises(UnknownResourceColumn):
+        resource_columns.get_column_value(make_pod("pod"), "NOMINATED NODE")
+    cluster = {"kind": "CephCluster", "status": {"phase": "Ready"}}
+    assert resource_columns.get_column_value(cluster, "PHASE") == "Ready"
+
+
+def test_evaluate_json_path():
+    """
+    Check the JSONPath expressions used in additionalPrinterColumns.
+    """
+    item = {
+        "status": {
+            "phase": "Ready",
+            "conditions": [
+                {"type": "Progressing", "status": "False"},
+                {"type": "Available", "status": "True"},
+            ],
+        }
+    }
+    assert resource_columns.evaluate_json_path(item, ".status.phase") == ["Ready"]
+    assert resource_columns.evaluate_json_path(
+        item, '.status.conditions[?(@.type=="Available")].status'
+    ) == ["True"]
+    assert resource_columns.evaluate_json_path(item, ".status.conditions[*].type") == [
+        "Progressing",
+        "Available",
+    ]
+    assert resource_columns.evaluate_json_path(item, ".spec.missing") == []
+
+
+def storagecluster_crd():
+    return {
+        "kind": "CustomResourceDefinition",
+        "spec": {
+            "group": "ocs.openshift.io",
+            "names": {"kind": "StorageCluster", "plural": "storageclusters"},
+            "versions": [
+                {
+                    "name": "v1",
+                    "additionalPrinterColumns": [
+                        {"name": "Age", "type": "date", "jsonPath": ".metadata.x"},
+                        {
+                            "name": "Phase",
+                            "type": "string",
+                            "jsonPath": ".status.phase",
+                        },
+                        {
+                            "name": "External",
+                            "type": "boolean",
+                            "jsonPath": ".spec.externalStorage.enable",
+                        },
+                    ],
+                }
+            ],
+        },
+    }
+
+
+def test_crd_printer_columns_cached():
+    """
+    Check that CRDs are listed once per cluster and used for the columns of
+    the custom resources.
+    """
+    resource_columns.invalidate_crd_printer_columns()
+    calls = []
+
+    def lister():
+        calls.append(1)
+        return [storagecluster_crd()]
+
+    item = {
+        "apiVersion": "ocs.openshift.io/v1",
+        "kind": "StorageCluster",
+        "spec": {"externalStorage": {"enable": False}},
+        "status": {"phase": "Progressing"},
+    }
+    for _ in range(3):
+        columns = resource_columns.get_crd_printer_columns(item, lister, "cl1")
+        assert (
+            resource_columns.get_column_value(item, "EXTERNAL", printer_columns=columns)
+            == "false"
+        )
+    with pytest.raises(UnknownResourceColumn):
+        resource_columns.get_column_value(item, "AGE", printer_columns=columns)
+    assert len(calls) == 1
+    # kinds not served by CRDs are looked up only once as well
+    route = {"apiVersion": "route.openshift.io/v1", "kind": "Route"}
+    for _ in range(3):
+        assert resource_columns.get_crd_printer_columns(route, lister, "cl1") == {}
+    assert len(calls) == 2
+    resource_columns.invalidate_crd_printer_columns()
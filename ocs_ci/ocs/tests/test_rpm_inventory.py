@@ -0,0 +1,99 @@
+# -*- coding: utf8 -*-
+
+import json
+import os
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import utils
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.tests.fake_kube_api import make_pod
+
+NAMESPACE = "openshift-storage"
+
+
+def make_image_pod(name, images, phase="Running"):
+    """
+    Build a pod with one running container per image.
+    """
+    pod = make_pod(name, NAMESPACE, phase=phase)
+    pod["spec"]["containers"] = [
+        {"name": f"c{i}", "image": image.split("@")[0]}
+        for i, image in enumerate(images)
+    ]
+    pod["status"]["containerStatuses"] = [
+        {
+            "name": f"c{i}",
+            "ready": True,
+            "imageID": image,
+            "state": {"running": {}},
+        }
+        for i, image in enumerate(images)
+    ]
+    return pod
+
+
+@pytest.fixture
+def rpm_cluster(kube_api_cluster, tmp_path, monkeypatch):
+    """
+    Fake API server with pods sharing few images, exec calls are recorded.
+    """
+    pods = [
+        make_image_pod(f"rook-ceph-osd-{i}", ["ceph@sha256:1", "log@sha256:2"])
+        for i in range(5)
+    ]
+    pods += [
+        make_image_pod("broken-0", ["broken@sha256:3"]),
+        make_image_pod("noobaa-core-0", ["noobaa@sha256:4"]),
+        make_image_pod("pending-0", ["ceph@sha256:1"], phase="Pending"),
+    ]
+    monkeypatch.setitem(config.RUN, "log_dir", str(tmp_path))
+    monkeypatch.setitem(config.RUN, "run_id", "1")
+    monkeypatch.setitem(config.RUN, "rpm_inventory_workers", 4)
+    commands = []
+
+    def exec_oc_cmd(self, command, out_yaml_format=True, **kwargs):
+        commands.append(command)
+        pod_name = command.split()[2]
+        if pod_name.startswith("broken"):
+            raise CommandFailed("container not found")
+        if "rpm -qa" in command:
+            return f"zlib-1.2\nbash-5.1-{pod_name.split('-')[0]}\n"
+        return "go1.21\n" if pod_name.startswith("noobaa") else ""
+
+    monkeypatch.setattr(OCP, "exec_oc_cmd", exec_oc_cmd)
+    kube_api_cluster(pods, cluster_namespace=NAMESPACE)
+    return commands
+
+
+def test_rpm_inventory_per_image(rpm_cluster, tmp_path):
+    """
+    Check that packages are collected once per image and written to the
+    inventory with the image of every container.
+    """
+    utils.collect_pod_container_rpm_package("testcases")
+    # two commands per image, the broken image fails on the first one
+    assert len(rpm_cluster) == 7
+    assert len([cmd for cmd in rpm_cluster if "rook-ceph-osd" in cmd]) == 4
+    (inventory_file,) = [
+        os.path.join(root, name)
+        for root, _, files in os.walk(tmp_path / "testcases_1")
+        for name in files
+    ]
+    assert os.path.basename(inventory_file) == "rpm_inventory.json"
+    with open(inventory_file) as f:
+        inventory = json.load(f)
+    assert inventory["images"] == {
+        "ceph@sha256:1": {"packages": ["bash-5.1-rook", "zlib-1.2"], "go_version": ""},
+        "log@sha256:2": {"packages": ["bash-5.1-rook", "zlib-1.2"], "go_version": ""},
+        "noobaa@sha256:4": {
+            "packages": ["bash-5.1-noobaa", "zlib-1.2"],
+            "go_version": "go1.21",
+        },
+    }
+    assert len(inventory["containers"]) == 12
+    assert inventory["containers"]["rook-ceph-osd-3/c1"] == "log@sha256:2"
+    assert inventory["containers"]["broken-0/c0"] == "broken@sha256:3"
+    assert "pending-0/c0" not in inventory["containers"]
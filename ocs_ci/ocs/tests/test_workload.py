@@ -0,0 +1,126 @@
+# -*- coding: utf8 -*-
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs import workload
+from ocs_ci.ocs.resources.pod import Pod
+from ocs_ci.utility.workloads import fio
+
+
+@pytest.fixture
+def scheduler():
+    """
+    Scheduler with two workers at most.
+    """
+    scheduler = workload.WorkloadScheduler(max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_workloads_of_pod_are_serialized(scheduler):
+    """
+    Check that the workloads submitted for one pod run one after another in
+    the order of submission.
+    """
+    events = []
+
+    def task(number):
+        events.append(("start", number))
+        time.sleep(0.01)
+        events.append(("end", number))
+        return number
+
+    futures = [scheduler.submit("pod-a", task, number=i) for i in range(5)]
+    assert [future.result(timeout=10) for future in futures] == list(range(5))
+    assert events == [(event, i) for i in range(5) for event in ("start", "end")]
+    assert scheduler.lanes == {}
+
+
+def test_concurrency_is_bounded(scheduler):
+    """
+    Check that no more than max_workers workloads of different pods run at
+    once and that the queued workloads are counted.
+    """
+    release = threading.Event()
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def task():
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        release.wait(10)
+        with lock:
+            running[0] -= 1
+
+    futures = [scheduler.submit(f"pod-{i}", task) for i in range(6)]
+    time.sleep(0.1)
+    stats = scheduler.stats()
+    assert stats["running"] == 2
+    assert stats["queued"] == 4
+    release.set()
+    for future in futures:
+        future.result(timeout=10)
+    assert running[1] == 2
+    stats = scheduler.stats()
+    assert (stats["completed"], stats["queued"]) == (6, 0)
+    assert stats["max_queued"] >= 4
+
+
+def test_started_event(scheduler):
+    """
+    Check that the started event of the queued workload is set only when it
+    starts running.
+    """
+    release = threading.Event()
+    running = [scheduler.submit(f"pod-{i}", release.wait, timeout=10) for i in (0, 1)]
+    queued = scheduler.submit("pod-2", lambda: "done")
+    assert all(future.started.wait(5) for future in running)
+    assert not queued.started.wait(0.1)
+    release.set()
+    assert queued.started.wait(5)
+    assert queued.result(timeout=5) == "done"
+
+
+def test_workload_run_future(monkeypatch):
+    """
+    Check that WorkLoad.run returns future of the result of the workload
+    module run, which is raised in case of failure.
+    """
+    monkeypatch.setattr(workload, "_scheduler", None)
+    monkeypatch.setattr(fio, "run", lambda **conf: {"jobs": [conf["path"]]})
+    pod = SimpleNamespace(name="fio-pod", namespace="namespace-test")
+    wl_obj = workload.WorkLoad("test_workload", "/mnt", "fio", "fs", pod)
+    assert wl_obj.run().result(timeout=10) == {"jobs": ["/mnt"]}
+
+    def failing_run(**conf):
+        raise RuntimeError("fio failed")
+
+    monkeypatch.setattr(fio, "run", failing_run)
+    with pytest.raises(RuntimeError, match="fio failed"):
+        wl_obj.run().result(timeout=10)
+    assert workload.get_scheduler().stats()["completed"] == 2
+    workload.shutdown_scheduler()
+    assert workload._scheduler is None
+
+
+def test_fio_results_queue_timeout(scheduler):
+    """
+    Check that waiting for the results of FIO queued behind a hanging
+    workload of the same pod is bounded.
+    """
+    release = threading.Event()
+    scheduler.submit("fio-pod", release.wait, timeout=10)
+    pod_obj = SimpleNamespace(
+        name="fio-pod", fio_thread=scheduler.submit("fio-pod", lambda: "{}")
+    )
+    start = time.time()
+    with pytest.raises(TimeoutError, match="didn't start within 0.2 seconds"):
+        Pod.get_fio_results(pod_obj, timeout=10, queue_timeout=0.2)
+    assert time.time() - start < 5
+    release.set()
+    assert Pod.get_fio_results(pod_obj, timeout=10, queue_timeout=5) == {}
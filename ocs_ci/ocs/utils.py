@@ -1,9 +1,13 @@
 import datetime
+import gzip
 import json
 import logging
 import os
 import pickle
 import re
+import shutil
+import signal
+import tempfile
 import threading
 import time
 import traceback
@@ -21,8 +25,12 @@ from libcloud.compute.providers import get_driver
 from libcloud.compute.types import Provider
 from paramiko.ssh_exception import SSHException
 
-from ocs_ci.framework import config as ocsci_config, config
-from ocs_ci.ocs import constants, defaults
+from ocs_ci.framework import (
+    config as ocsci_config,
+    config,
+    config_safe_thread_pool_task,
+)
+from ocs_ci.ocs import constants, defaults, resource_columns
 from ocs_ci.ocs.external_ceph import RolesContainer, Ceph, CephNode
 from ocs_ci.ocs.clients import WinNode
 from ocs_ci.ocs.exceptions import (
@@ -64,6 +72,9 @@ mg_collected_logs = 0
 mg_collected_types = set()
 mg_lock = threading.Lock()
 subctl_lock = threading.Lock()
+# totals of the pod logs collected by collect_pods_logs during the run
+pod_logs_stats = {"files": 0, "bytes": 0, "seconds": 0.0}
+pod_logs_lock = threading.Lock()
 
 
 def create_ceph_nodes(cluster_conf, inventory, osp_cred, run_id, instances_name=None):
@@ -1055,6 +1066,269 @@ def collect_ceph_external(path):
         )
 
 
+def format_log_time(timestamp):
+    """
+    Format the time for the 'oc logs' time options
+
+    Args:
+        timestamp (float): Seconds since the epoch
+
+    Returns:
+        str: The time in RFC3339 format in UTC, e.g. '2024-01-31T10:00:00Z'
+
+    """
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
+def stream_pod_logs(
+    pod_name,
+    namespace,
+    file_path,
+    container=None,
+    all_containers=False,
+    since_time=None,
+    until_time=None,
+    compress=False,
+    timeout=600,
+):
+    """
+    Write logs of the pod to the file. The output of 'oc logs' is streamed to
+    the file, it is not kept in memory.
+
+    Args:
+        pod_name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        file_path (str): The file to write the logs to, '.gz' is appended if
+            compress is True
+        container (str): Name of the container, the default container of the
+            pod is used if not provided
+        all_containers (bool): Write logs of all the containers of the pod
+        since_time (float): Write only the logs newer than this time (seconds
+            since the epoch)
+        until_time (float): Write only the logs older than this time (seconds
+            since the epoch), the lines are prefixed with their timestamps.
+            The logs of one container are read only until the first newer
+            line, the logs of all the containers are read to the end since
+            they follow each other.
+        compress (bool): Compress the file by gzip
+        timeout (int): Max time in seconds to wait for the logs
+
+    Returns:
+        tuple: Path of the written file and its size in bytes
+
+    Raises:
+        CommandFailed: In case 'oc logs' failed
+        TimeoutExpired: In case the logs weren't written within the timeout
+
+    """
+    cmd = f"{OCP(namespace=namespace).get_oc_cmd_prefix()}logs {pod_name}"
+    if container:
+        cmd += f" -c {container}"
+    if all_containers:
+        cmd += " --all-containers=true"
+    if since_time:
+        cmd += f" --since-time={format_log_time(since_time)}"
+    until = None
+    if until_time:
+        cmd += " --timestamps"
+        # the timestamps of the lines start with the second precision RFC3339
+        # time, so the times can be compared as strings
+        until = format_log_time(until_time)[:19].encode()
+    if compress:
+        file_path += ".gz"
+    opener = gzip.open if compress else open
+    log.debug(f"Writing logs of the pod {pod_name} to {file_path}")
+    # stderr goes to a file, so oc can't block on a full stderr pipe while
+    # stdout is read
+    with tempfile.TemporaryFile() as err:
+        with opener(file_path, "wb") as out, subprocess.Popen(
+            shlex.split(cmd),
+            stdout=subprocess.PIPE,
+            stderr=err,
+            start_new_session=True,
+        ) as proc:
+            expired = threading.Event()
+
+            def stop():
+                # kill the whole process group, so no child keeps the pipe open
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+            def kill():
+                expired.set()
+                stop()
+
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            stopped = False
+            try:
+                if until:
+                    for line in proc.stdout:
+                        if line[:19] <= until:
+                            out.write(line)
+                        elif not all_containers:
+                            stopped = True
+                            stop()
+                            break
+                else:
+                    shutil.copyfileobj(proc.stdout, out, 1024 * 1024)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+            err.seek(0)
+            stderr = err.read().decode(errors="replace")
+    if expired.is_set():
+        raise TimeoutExpired(cmd, timeout)
+    if returncode and not stopped:
+        raise CommandFailed(
+            f"Error during execution of command: {cmd}.\nError is {stderr}"
+        )
+    return file_path, os.path.getsize(file_path)
+
+
+def collect_pods_logs(
+    log_dir_path,
+    pod_objs,
+    file_prefix="",
+    all_containers=False,
+    since_time=None,
+    until_time=None,
+    compress=None,
+    skip_containers=None,
+    workers=None,
+):
+    """
+    Collect logs of the pods to the directory, the logs are streamed to the
+    files by a pool of workers, one 'oc logs' per container (or per pod if
+    all_containers is True)
+
+    Args:
+        log_dir_path (str): The directory to write the logs to
+        pod_objs (list): The pods (ocs_ci.ocs.resources.pod.Pod) to collect
+            the logs of
+        file_prefix (str): Prefix of the log file names, the files are named
+            <prefix><pod>_<container>.log or <prefix><pod>.log if
+            all_containers is True
+        all_containers (bool): Collect logs of all the containers of the pod
+            to one file
+        since_time (float): Collect only the logs newer than this time
+            (seconds since the epoch), e.g. the test start
+        until_time (float): Collect only the logs older than this time
+            (seconds since the epoch), e.g. the test end
+        compress (bool): Compress the files by gzip, default is REPORTING
+            pod_logs_compress
+        skip_containers (set): (namespace, pod name, container name) tuples
+            of the containers whose logs are already collected, e.g. by
+            must-gather (see must_gather.get_pod_log_containers)
+        workers (int): Number of logs collected at once, default is
+            REPORTING pod_logs_workers
+
+    Returns:
+        dict: Number of written 'files', 'skipped' and 'failed' logs, 'bytes'
+            written and 'seconds' the collection took
+
+    """
+    if compress is None:
+        compress = ocsci_config.REPORTING.get("pod_logs_compress", False)
+    workers = workers or ocsci_config.REPORTING.get("pod_logs_workers", 8)
+    skip_containers = skip_containers or set()
+    create_directory_path(log_dir_path)
+    stats = {"files": 0, "skipped": 0, "failed": 0, "bytes": 0}
+    tasks = []
+    for pod_obj in pod_objs:
+        if all_containers:
+            tasks.append((pod_obj, None, f"{file_prefix}{pod_obj.name}.log"))
+            continue
+        for container in pod_obj.data["spec"]["containers"]:
+            name = container["name"]
+            if (pod_obj.namespace, pod_obj.name, name) in skip_containers:
+                stats["skipped"] += 1
+                continue
+            tasks.append((pod_obj, name, f"{file_prefix}{pod_obj.name}_{name}.log"))
+
+    start = time.time()
+    config_index = ocsci_config.cluster_ctx.MULTICLUSTER["multicluster_index"]
+    if tasks:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    config_safe_thread_pool_task,
+                    config_index,
+                    stream_pod_logs,
+                    pod_obj.name,
+                    pod_obj.namespace,
+                    os.path.join(log_dir_path, file_name),
+                    container=container,
+                    all_containers=all_containers,
+                    since_time=since_time,
+                    until_time=until_time,
+                    compress=compress,
+                ): (pod_obj.name, container)
+                for pod_obj, container, file_name in tasks
+            }
+            for future in as_completed(futures):
+                pod_name, container = futures[future]
+                try:
+                    _, size = future.result()
+                except Exception as e:
+                    log.warning(
+                        f"Failed to collect logs of the pod {pod_name} "
+                        f"container {container}: {e}"
+                    )
+                    stats["failed"] += 1
+                    continue
+                stats["files"] += 1
+                stats["bytes"] += size
+    stats["seconds"] = round(time.time() - start, 2)
+
+    with pod_logs_lock:
+        for key in pod_logs_stats:
+            pod_logs_stats[key] += stats[key]
+        totals = dict(pod_logs_stats)
+    log.info(
+        f"Collected {stats['files']} pod logs ({stats['bytes']} bytes) to "
+        f"{log_dir_path} in {stats['seconds']}s, {stats['skipped']} skipped as "
+        f"already collected, {stats['failed']} failed. Run total: "
+        f"{totals['files']} logs, {totals['bytes']} bytes, "
+        f"{totals['seconds']:.2f}s"
+    )
+    return stats
+
+
+def collect_failure_pods_logs(log_dir_path, must_gather_dir, since_time, until_time):
+    """
+    Collect logs of the pods in the cluster namespace in the time window of
+    the failed test, to the pod_logs directory. The containers whose logs
+    were collected by must-gather are skipped.
+
+    Args:
+        log_dir_path (str): The directory of the logs of the failed test
+        must_gather_dir (str): The must-gather directory
+        since_time (float): Start of the failed test (seconds since the epoch)
+        until_time (float): End of the failed test (seconds since the epoch)
+
+    Returns:
+        dict: The collection stats, see collect_pods_logs
+
+    """
+    # Import here to avoid circular dependency issue
+    from ocs_ci.ocs.must_gather.must_gather import get_pod_log_containers
+    from ocs_ci.ocs.resources.pod import get_all_pods
+
+    pod_objs = get_all_pods(namespace=ocsci_config.ENV_DATA["cluster_namespace"])
+    return collect_pods_logs(
+        os.path.join(log_dir_path, "pod_logs"),
+        pod_objs,
+        since_time=since_time,
+        until_time=until_time,
+        skip_containers=get_pod_log_containers(must_gather_dir),
+    )
+
+
 def export_mg_pods_logs(log_dir_path):
     """
     Export must gather pods logs
@@ -1075,7 +1349,7 @@ def get_logs_ocp_mg_pods(log_dir_path):
         log_dir_path (str): the path of copying the logs
 
     """
-    from ocs_ci.ocs.resources.pod import get_all_pods, get_pod_logs
+    from ocs_ci.ocs.resources.pod import get_all_pods
 
     namespaces = get_namespce_name_by_pattern(pattern="openshift-must-gather")
     try:
@@ -1094,15 +1368,9 @@ def get_logs_ocp_mg_pods(log_dir_path):
                     df.write(f"ocp mg pod describe:\n{pod_mg_describe}")
                 log.debug(f"ocp mg pod describe:\n{pod_mg_describe}")
 
-                ocp_mg_pod_logs = get_pod_logs(
-                    pod_name=pod_mg_ns.name, namespace=namespace, all_containers=True
-                )
-                file_path_describe = os.path.join(
-                    log_dir_path, f"log_ocp_mg_{pod_mg_ns.name}.log"
-                )
-                with open(file_path_describe, "w") as df:
-                    df.write(ocp_mg_pod_logs)
-                log.debug(f"ocp mg pod logs:\n{ocp_mg_pod_logs}")
+            collect_pods_logs(
+                log_dir_path, pods_mg_ns, file_prefix="log_ocp_mg_", all_containers=True
+            )
     except Exception as e:
         log.error(e)
 
@@ -1115,9 +1383,10 @@ def get_helper_pods_output(log_dir_path):
         log_dir_path (str): the path of copying the logs
 
     """
-    from ocs_ci.ocs.resources.pod import get_pod_obj, get_pod_logs
+    from ocs_ci.ocs.resources.pod import get_pod_obj
 
     helper_pods = get_pod_name_by_pattern(pattern="helper")
+    helper_pod_objs = []
     for helper_pod in helper_pods:
         try:
             helper_pod_obj = get_pod_obj(
@@ -1133,16 +1402,16 @@ def get_helper_pods_output(log_dir_path):
             log.debug(
                 f"****helper pod {helper_pod} describe****\n{describe_helper_pod}\n"
             )
-
-            log_helper_pod = get_pod_logs(pod_name=helper_pod)
-            file_path_describe = os.path.join(
-                log_dir_path, f"log_ocs_mg_helper_pod_{helper_pod}.log"
-            )
-            with open(file_path_describe, "w") as df:
-                df.write(log_helper_pod)
-            log.debug(f"****helper pod {helper_pod} logs***\n{log_helper_pod}")
+            helper_pod_objs.append(helper_pod_obj)
         except Exception as e:
             log.error(e)
+    if helper_pod_objs:
+        collect_pods_logs(
+            log_dir_path,
+            helper_pod_objs,
+            file_prefix="log_ocs_mg_helper_pod_",
+            all_containers=True,
+        )
 
 
 def collect_noobaa_db_dump(log_dir_path, cluster_config=None):
@@ -1216,6 +1485,8 @@ def _collect_ocs_logs(
     output_file=None,
     skip_after_max_fail=False,
     timeout=defaults.MUST_GATHER_TIMEOUT,
+    since_time=None,
+    until_time=None,
 ):
     """
     This function runs in thread
@@ -1287,6 +1558,18 @@ def _collect_ocs_logs(
             raise ValueError(
                 f"must-gather fails in an disconnected environment bz-1974959\n{mg_output}"
             )
+        if since_time and cluster_config.REPORTING.get("pod_logs_on_failure"):
+            try:
+                config_safe_thread_pool_task(
+                    cluster_config.MULTICLUSTER["multicluster_index"],
+                    collect_failure_pods_logs,
+                    log_dir_path,
+                    ocs_log_dir_path,
+                    since_time,
+                    until_time,
+                )
+            except Exception:
+                log.exception("Failed to collect the pod logs")
     if ocp:
         ocp_log_dir_path = os.path.join(log_dir_path, "ocp_must_gather")
         ocp_must_gather_image = cluster_config.REPORTING["ocp_must_gather_image"]
@@ -1396,6 +1679,8 @@ def collect_ocs_logs(
     output_file=None,
     skip_after_max_fail=False,
     timeout=defaults.MUST_GATHER_TIMEOUT,
+    since_time=None,
+    until_time=None,
 ):
     """
     Collects OCS logs
@@ -1416,6 +1701,11 @@ def collect_ocs_logs(
         skip_after_max_fail (bool): When max number failed attempts to collect MG reached, will skip
             MG collection.
         timeout (int): Max timeout to wait for MG to complete before aborting the MG execution.
+        since_time (float): Start of the failed test (seconds since the epoch), with
+            REPORTING pod_logs_on_failure the logs of the pods since this time, which
+            are not collected by OCS must-gather, are collected as well
+        until_time (float): End of the failed test (seconds since the epoch), the pod
+            logs are collected up to this time
 
     """
     cwd = os.getcwd()
@@ -1438,6 +1728,8 @@ def collect_ocs_logs(
                         output_file=output_file,
                         skip_after_max_fail=skip_after_max_fail,
                         timeout=timeout,
+                        since_time=since_time,
+                        until_time=until_time,
                     )
                 )
             if ocs:
@@ -1456,6 +1748,8 @@ def collect_ocs_logs(
                         output_file=output_file,
                         skip_after_max_fail=skip_after_max_fail,
                         timeout=timeout,
+                        since_time=since_time,
+                        until_time=until_time,
                     )
                 )
             if mcg:
@@ -1474,6 +1768,8 @@ def collect_ocs_logs(
                         output_file=output_file,
                         skip_after_max_fail=skip_after_max_fail,
                         timeout=timeout,
+                        since_time=since_time,
+                        until_time=until_time,
                     )
                 )
 
@@ -1949,9 +2245,49 @@ def label_pod_security_admission(namespace=None, upgrade_version=None):
         ocp_obj.add_label(resource_name=namespace, label=label)
 
 
+def get_image_packages(namespace, containers):
+    """
+    Get rpm packages and go version of the container image. The commands are
+    executed in the first of the containers running the image which responds.
+
+    Args:
+        namespace (str): Namespace of the pods
+        containers (list): (pod name, container name) tuples of the running
+            containers of the image
+
+    Returns:
+        dict: 'packages' (sorted list of rpm packages) and 'go_version' of
+            the image, None if none of the containers responded
+
+    """
+    ocp_obj = OCP(namespace=namespace)
+    for pod_name, container_name in containers:
+        command = f"exec -i {pod_name} -c {container_name} -- rpm -qa"
+        go_command = (
+            f"exec -i {pod_name} -c {container_name} --"
+            " /bin/bash -c '[ -f /go.version ] && cat /go.version || exit 0'"
+        )
+        try:
+            container_output = ocp_obj.exec_oc_cmd(command, out_yaml_format=False)
+            go_output = ocp_obj.exec_oc_cmd(go_command, out_yaml_format=False)
+        except Exception as e:
+            log.warning(
+                f"Following exception {e} was raised for pod {pod_name} and container {container_name}"
+            )
+            continue
+        return {
+            "packages": sorted(container_output.split()),
+            "go_version": go_output.strip(),
+        }
+    return None
+
+
 def collect_pod_container_rpm_package(dir_name):
     """
-    Collect information about rpm packages from all containers + go version
+    Collect information about rpm packages from all containers + go version.
+    The packages are collected once per unique image (by image digest),
+    in parallel, and written to one json inventory which maps image to its
+    packages and pod/container to its image.
 
     Args:
         dir_name(str): directory to store container rpm package info
@@ -1973,45 +2309,61 @@ def collect_pod_container_rpm_package(dir_name):
     create_directory_path(package_log_dir_path)
     log.info(f"Directory path for rpm logs is {package_log_dir_path}")
     pods = pod.get_all_pods(namespace=cluster_namespace)
-    ocp_obj = OCP(namespace=cluster_namespace)
+    ignore_pods = (
+        constants.CONTROLLER_DETECT_VERSION_NAME,
+        constants.OSD_KEY_ROTATION_POD_NAME,
+        constants.ROOK_CEPH_DETECT_VERSION_POD_NAME,
+        constants.STATUS_REPORTER,
+    )
+    # pod/container -> image digest, image digest -> running containers
+    container_images = dict()
+    image_containers = dict()
     for pod_obj in pods:
-        ignore_pods = (
-            constants.CONTROLLER_DETECT_VERSION_NAME,
-            constants.OSD_KEY_ROTATION_POD_NAME,
-            constants.ROOK_CEPH_DETECT_VERSION_POD_NAME,
-            constants.STATUS_REPORTER,
-        )
         if any(pod in pod_obj.name for pod in ignore_pods):
             continue
-        pod_object = pod_obj.get()
-        pod_containers = pod_object.get("spec").get("containers")
-        ocp_pod_obj = OCP(kind=constants.POD, namespace=cluster_namespace)
-        pod_status = ocp_pod_obj.get_resource_status(pod_obj.name)
-        if pod_status == constants.STATUS_RUNNING:
-            for container in pod_containers:
-                container_output = ""
-                go_output = ""
-                container_name = container["name"]
-                command = f"exec -i {pod_obj.name} -c {container_name} -- rpm -qa"
-                go_command = (
-                    f"exec -i {pod_obj.name} -c {container_name} --"
-                    " /bin/bash -c '[ -f /go.version ] && cat /go.version || exit 0'"
+        if resource_columns.pod_status(pod_obj.data) != constants.STATUS_RUNNING:
+            continue
+        container_statuses = {
+            container_status["name"]: container_status
+            for container_status in pod_obj.data["status"].get("containerStatuses")
+            or []
+        }
+        for container in pod_obj.data["spec"]["containers"]:
+            container_status = container_statuses.get(container["name"], {})
+            image = container_status.get("imageID") or container["image"]
+            container_images[f"{pod_obj.name}/{container['name']}"] = image
+            if "running" in (container_status.get("state") or {}):
+                image_containers.setdefault(image, []).append(
+                    (pod_obj.name, container["name"])
                 )
-                try:
-                    container_output = ocp_obj.exec_oc_cmd(command)
-                    go_output = ocp_obj.exec_oc_cmd(go_command)
-                except Exception as e:
-                    log.warning(
-                        f"Following exception {e} was raised for pod {pod_obj.name} and container {container_name}"
-                    )
-                if container_output:
-                    log_file_name = f"{package_log_dir_path}/{pod_obj.name}-{container_name}-rpm.log"
-                    with open(log_file_name, "w") as f:
-                        f.write(container_output)
-                if go_output:
-                    go_log_file_name = f"{package_log_dir_path}/{pod_obj.name}-{container_name}-go-version.log"
-                    with open(go_log_file_name, "w") as f:
-                        f.write(go_output)
+
+    log.info(
+        f"Collecting rpm packages of {len(image_containers)} images used by "
+        f"{len(container_images)} containers"
+    )
+    with ThreadPoolExecutor(
+        max_workers=ocsci_config.RUN.get("rpm_inventory_workers", 8)
+    ) as executor:
+        futures = {
+            image: executor.submit(
+                config_safe_thread_pool_task,
+                ocsci_config.cluster_ctx.MULTICLUSTER["multicluster_index"],
+                get_image_packages,
+                cluster_namespace,
+                containers,
+            )
+            for image, containers in image_containers.items()
+        }
+        images = {image: future.result() for image, future in futures.items()}
+
+    inventory = {
+        "images": {image: packages for image, packages in images.items() if packages},
+        "containers": container_images,
+    }
+    inventory_file = os.path.join(package_log_dir_path, "rpm_inventory.json")
+    with open(inventory_file, "w") as f:
+        json.dump(inventory, f, sort_keys=True, separators=(",", ":"))
+    log.info(f"Container rpm packages inventory written to {inventory_file}")
 
 
 def is_dr_scenario():
@@ -1,10 +1,173 @@
 import logging
 import importlib
 import concurrent.futures
+import threading
+from collections import deque
+
+from ocs_ci.framework import config, config_safe_thread_pool_task
 
 
 log = logging.getLogger(__name__)
 
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+class WorkloadScheduler(object):
+    """
+    Runs the workloads of all the pods in one thread pool of bounded size.
+    The workloads of the same pod are run one after another in the order of
+    submission, as the workloads of different pods run in parallel.
+    """
+
+    def __init__(self, max_workers):
+        """
+        Args:
+            max_workers (int): Maximum number of workloads running at once
+
+        """
+        self.max_workers = max_workers
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="workload"
+        )
+        self.lock = threading.Lock()
+        # key (pod) -> workloads waiting for the running workload of the pod
+        self.lanes = {}
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+        self.max_queue_depth = 0
+
+    def submit(self, key, func, **kwargs):
+        """
+        Submit the workload to be run after all the workloads submitted with
+        the same key
+
+        Args:
+            key (hashable): Key serializing the workloads, e.g. pod name
+            func (function): Workload function to call
+            **kwargs: Arguments of the function
+
+        Returns:
+            Future: Future of the result of the function, its 'started' event
+                is set when the workload starts running (or is cancelled), so
+                the callers can time the workload itself and not the time it
+                waited in the queue
+
+        """
+        future = concurrent.futures.Future()
+        future.started = threading.Event()
+        config_index = config.cluster_ctx.MULTICLUSTER["multicluster_index"]
+        task = (future, config_index, func, kwargs)
+        with self.lock:
+            self.submitted += 1
+            if key in self.lanes:
+                self.lanes[key].append(task)
+            else:
+                self.lanes[key] = deque()
+                self.executor.submit(self._run_lane, key, task)
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        return future
+
+    @property
+    def queue_depth(self):
+        """
+        Number of the submitted workloads which are not running yet
+        """
+        return self.submitted - self.completed - self.running
+
+    def stats(self):
+        """
+        Returns:
+            dict: Numbers of submitted, running, queued and completed
+                workloads and the maximum number of queued workloads
+
+        """
+        with self.lock:
+            return {
+                "submitted": self.submitted,
+                "running": self.running,
+                "queued": self.queue_depth,
+                "completed": self.completed,
+                "max_queued": self.max_queue_depth,
+            }
+
+    def _run_lane(self, key, task):
+        """
+        Run the task and then the tasks submitted with the same key meanwhile
+        """
+        while True:
+            future, config_index, func, kwargs = task
+            with self.lock:
+                self.running += 1
+            result = exception = None
+            run = future.set_running_or_notify_cancel()
+            future.started.set()
+            if run:
+                try:
+                    result = config_safe_thread_pool_task(config_index, func, **kwargs)
+                except BaseException as ex:
+                    exception = ex
+            # the bookkeeping is done before the future is resolved, so the
+            # stats are up to date for the caller waiting for the result
+            with self.lock:
+                self.running -= 1
+                self.completed += 1
+                lane = self.lanes[key]
+                task = lane.popleft() if lane else None
+                if task is None:
+                    del self.lanes[key]
+            if run:
+                if exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
+            if task is None:
+                return
+
+    def shutdown(self, wait=True):
+        """
+        Shut down the thread pool
+
+        Args:
+            wait (bool): Wait for the submitted workloads to finish
+
+        """
+        self.executor.shutdown(wait=wait)
+
+
+def get_scheduler():
+    """
+    Get the scheduler of the workloads, it's created on the first use with
+    config.RUN["workload_max_workers"] threads at most
+
+    Returns:
+        WorkloadScheduler: scheduler shared by all the workloads
+
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = WorkloadScheduler(config.RUN.get("workload_max_workers", 128))
+        return _scheduler
+
+
+def shutdown_scheduler(wait=True):
+    """
+    Shut down the scheduler of the workloads, e.g. at the end of the session.
+    A new one is created if a workload is submitted later.
+
+    Args:
+        wait (bool): Wait for the submitted workloads to finish
+
+    """
+    global _scheduler
+    with _scheduler_lock:
+        scheduler, _scheduler = _scheduler, None
+    if scheduler:
+        log.info(f"Shutting down workload scheduler: {scheduler.stats()}")
+        scheduler.shutdown(wait=wait)
+
 
 class WorkLoad(object):
     def __init__(
@@ -45,8 +208,6 @@ class WorkLoad(object):
             log.error(ex)
             raise
 
-        self.thread_exec = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-
     def setup(self, **setup_conf):
         """
         Perform work_load_mod.setup() to setup the workload.
@@ -70,6 +231,8 @@ class WorkLoad(object):
         Perform work_load_mod.run in order to run actual io.
         Every workload module should implement run() function so that we can
         invoke <workload_module>.run() to run IOs.
+        The run is scheduled by the shared WorkloadScheduler, after the
+        previous runs on the same pod.
 
         Args:
             **conf (dict): Run configuration a.k.a parameters for workload
@@ -82,6 +245,10 @@ class WorkLoad(object):
         conf["path"] = self.path
         conf["type"] = self.storage_type
         conf["numjobs"] = self.jobs
-        future_obj = self.thread_exec.submit(self.work_load_mod.run, **conf)
+        if self.pod:
+            key = (self.pod.namespace, self.pod.name)
+        else:
+            key = id(self)
+        future_obj = get_scheduler().submit(key, self.work_load_mod.run, **conf)
         log.info("Done submitting..")
         return future_obj
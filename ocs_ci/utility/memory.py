@@ -3,6 +3,7 @@
 Module for memory related util functions.
 """
 
+import csv
 import os
 import logging
 import tempfile
@@ -11,7 +12,7 @@ import pandas as pd
 from psutil import Process, ZombieProcess, NoSuchProcess
 from psutil._common import bytes2human
 from ocs_ci.ocs import constants
-from threading import Timer
+from threading import Lock, Timer
 
 from ocs_ci.utility.utils import get_testrun_name
 
@@ -31,14 +32,195 @@ class MemoryMonitor(Timer):
 
 consumed_ram_log = []
 _columns_df = ["pid", "name", "ts", "rss", "vms", "status"]
-_df = pd.DataFrame(columns=_columns_df)
+# number of samples buffered before they're appended to the csv file
+CSV_CHUNK_SIZE = 1000
 mon: MemoryMonitor
 _mem_csv: str
 
 
+class MemoryStats(object):
+    """
+    Append-only log of the memory samples of the processes. The samples are
+    buffered in columns only until they're appended to the csv file in chunks,
+    the peak stats are aggregated as the samples come, so neither the memory
+    nor the time spent per sample grows with the length of the run.
+    """
+
+    def __init__(self, csv_path=None, chunk_size=CSV_CHUNK_SIZE):
+        """
+        Args:
+            csv_path (str): path to csv file the samples are written to, with
+                structure: index,pid,name,ts,rss,vms,status. Samples are not
+                kept if not provided.
+            chunk_size (int): number of samples buffered before they're
+                appended to the csv file
+
+        """
+        self.csv_path = csv_path
+        self.chunk_size = chunk_size
+        self.lock = Lock()
+        self.count = 0
+        self._columns = {column: [] for column in _columns_df}
+        self._csv_header = True
+        # (pid, name) -> [first ts, last ts, rss peak, vms peak]
+        self._procs = {}
+        self._stat_sums = {constants.RAM: 0, constants.VIRT: 0}
+        # samples of the latest ts, pid -> (rss, vms), and totals peaks
+        self._open_ts = None
+        self._open_samples = {}
+        self._sum_peaks = {constants.RAM: None, constants.VIRT: None}
+
+    def add(self, pid, name, ts, rss, vms, status):
+        """
+        Add sample of the process
+
+        Args:
+            pid (int): pid of the process
+            name (str): name of the process
+            ts (str): time of the sample, '%Y-%m-%d %X'
+            rss (int): rss of the process
+            vms (int): vms of the process
+            status (str): status of the process
+
+        """
+        with self.lock:
+            self.count += 1
+            self._stat_sums[constants.RAM] += rss
+            self._stat_sums[constants.VIRT] += vms
+            proc = self._procs.get((pid, name))
+            if proc is None:
+                self._procs[(pid, name)] = [ts, ts, rss, vms]
+            else:
+                proc[1] = ts
+                proc[2] = max(proc[2], rss)
+                proc[3] = max(proc[3], vms)
+            if ts != self._open_ts:
+                self._close_ts()
+                self._open_ts = ts
+            # the last sample of the process at the same ts is counted
+            self._open_samples[pid] = (rss, vms)
+            if self.csv_path:
+                for column, value in zip(
+                    _columns_df, (pid, name, ts, rss, vms, status)
+                ):
+                    self._columns[column].append(value)
+                if len(self._columns["pid"]) >= self.chunk_size:
+                    self._flush()
+
+    def _close_ts(self):
+        """
+        Account totals of the samples of the latest ts into the peaks
+        """
+        for stat, (ts, value) in self._open_totals().items():
+            peak = self._sum_peaks[stat]
+            # the first ts with the peak value is reported
+            if peak is None or value > peak[1]:
+                self._sum_peaks[stat] = (ts, value)
+        self._open_samples = {}
+
+    def _open_totals(self):
+        """
+        Returns:
+            dict: stat -> (ts, total of the samples of the latest ts)
+
+        """
+        if not self._open_samples:
+            return {}
+        return {
+            constants.RAM: (
+                self._open_ts,
+                sum(rss for rss, _ in self._open_samples.values()),
+            ),
+            constants.VIRT: (
+                self._open_ts,
+                sum(vms for _, vms in self._open_samples.values()),
+            ),
+        }
+
+    def flush(self):
+        """
+        Append the buffered samples to the csv file
+        """
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        if not (self.csv_path and self._columns["pid"]):
+            return
+        rows = zip(
+            range(self.count - len(self._columns["pid"]), self.count),
+            *(self._columns[column] for column in _columns_df),
+        )
+        with open(self.csv_path, "a", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            if self._csv_header:
+                writer.writerow([""] + _columns_df)
+                self._csv_header = False
+            writer.writerows(rows)
+        for column in self._columns.values():
+            column.clear()
+
+    def peak_table(self, stat):
+        """
+        Peak stats per process name, in the same way as read_peak_mem_stats
+        computes them from the samples
+
+        Args:
+            stat (constants): stat either 'rss' or 'vms' (constants.RAM | constants.VIRT)
+
+        Returns:
+            pd.DataFrame: table with columns name, proc_start, proc_end, <stat>_peak
+
+        """
+        stat_index = 2 if stat == constants.RAM else 3
+        with self.lock:
+            if not self._procs:
+                return read_peak_mem_stats(stat, df=catch_empty_mem_df(pd.DataFrame()))
+            procs = list(self._procs.items())
+            mean = self._stat_sums[stat] / self.count
+        if len({name for (_, name), _ in procs}) > 10:
+            # only the processes with a sample above the average are reported
+            high_pids = {pid for (pid, _), proc in procs if proc[stat_index] > mean}
+            procs = [item for item in procs if item[0][0] in high_pids]
+        table = {}
+        for (_, name), proc in procs:
+            row = table.get(name)
+            if row is None:
+                table[name] = [name, proc[0], proc[1], proc[stat_index]]
+            else:
+                row[1] = min(row[1], proc[0])
+                row[2] = max(row[2], proc[1])
+                row[3] = max(row[3], proc[stat_index])
+        return pd.DataFrame(
+            [table[name] for name in sorted(table)],
+            columns=["name", "proc_start", "proc_end", f"{stat}_peak"],
+        )
+
+    def peak_sum(self, stat):
+        """
+        Peak of the memory summarized over all the processes at one time
+
+        Args:
+            stat (constants): stat either 'rss' or 'vms' (constants.RAM | constants.VIRT)
+
+        Returns:
+            tuple: ts, peak value; (pd.to_datetime(0), -1) if there are no samples
+
+        """
+        with self.lock:
+            peak = self._sum_peaks[stat]
+            open_total = self._open_totals().get(stat)
+        if open_total and (peak is None or open_total[1] > peak[1]):
+            peak = open_total
+        return peak or (pd.to_datetime(0), -1)
+
+
+_stats = MemoryStats()
+
+
 def _get_memory_per_process():
     """
-    Function to add memory rss and vms of current process and all subprocesses to dataframe obj (_df)
+    Function to add memory rss and vms of current process and all subprocesses to the memory stats
     """
     proc = Process(os.getpid())
     _rec_memory(proc)
@@ -50,28 +232,17 @@ def _get_memory_per_process():
 
 def _rec_memory(proc: Process):
     """
-    Helper func to update _df DataFrame object with proc stats, accordingly
+    Helper func to add proc stats to the memory stats, accordingly
     to structure: "pid", "name", "ts", "rss", "vms", "status"
     """
     try:
-        global _df
-        _df = pd.concat(
-            [
-                _df,
-                pd.DataFrame(
-                    [
-                        [
-                            proc.pid,
-                            proc.name(),
-                            pd.Timestamp.now().strftime("%Y-%m-%d %X"),
-                            get_consumed_ram(proc),
-                            get_consumed_virt_mem(proc),
-                            proc.status(),
-                        ]
-                    ],
-                    columns=_columns_df,
-                ),
-            ]
+        _stats.add(
+            proc.pid,
+            proc.name(),
+            pd.Timestamp.now().strftime("%Y-%m-%d %X"),
+            get_consumed_ram(proc),
+            get_consumed_virt_mem(proc),
+            proc.status(),
         )
     # ZombieProcess's, NoSuchProcess's come too often within a test run,
     # we're polling each process once per 3 sec. ZombieProcess and NoSuchProcess
@@ -120,11 +291,12 @@ def start_monitor_memory(interval: int = 3, create_csv: bool = False) -> MemoryM
     """
     global _mem_csv
     global mon
-    global _df
-    _df = pd.DataFrame(columns=_columns_df)
+    global _stats
     _mem_csv_path = f"mem-data-{get_testrun_name()}"
+    _mem_csv = None
     if create_csv:
         _mem_csv = tempfile.mktemp(prefix=_mem_csv_path)
+    _stats = MemoryStats(csv_path=_mem_csv)
     # interval cannot be smaller than 2 sec, otherwise we get mistakes in calculation
     if interval < 2:
         interval = 2
@@ -150,9 +322,11 @@ def stop_monitor_memory(save_csv: bool = False) -> tuple:
     global mon
     mon.cancel()
     global _mem_csv
-    if save_csv:
-        _df.to_csv(_mem_csv)
+    if save_csv and _mem_csv:
+        _stats.flush()
     else:
+        if _mem_csv and os.path.exists(_mem_csv):
+            os.remove(_mem_csv)
         _mem_csv = None
     table_rss = peak_mem_stats_human_readable(constants.RAM)
     table_vms = peak_mem_stats_human_readable(constants.VIRT)
@@ -173,6 +347,8 @@ def read_peak_mem_stats(
         df (pd.DataFrame): dataframe object with structure: index,pid,name,ts,rss,vms,status
         csv_path (str): path to csv file with structure: index,pid,name,ts,rss,vms,status;
                         will be ignored in case if df != None
+        If neither df nor csv_path is provided, stats aggregated by the running
+        memory monitor are returned.
 
     Returns: pd.DataFrame similar to:
     name                                     proc_start             proc_end                rss_peak
@@ -182,6 +358,8 @@ def read_peak_mem_stats(
     """
 
     if df is None:
+        if csv_path is None:
+            return _stats.peak_table(stat)
         df = pd.read_csv(csv_path)
 
     df = catch_empty_mem_df(df)
@@ -219,8 +397,7 @@ def peak_mem_stats_human_readable(
     Returns:
         pd.DataFrame: peak memory stats dataframe
     """
-    global _df
-    df_peak = read_peak_mem_stats(stat, _df, csv_path)
+    df_peak = read_peak_mem_stats(stat, csv_path=csv_path)
     df_peak = df_peak.sort_values(by=f"{stat}_peak", ascending=False)
     df_peak[f"{stat}_peak"] = df_peak[f"{stat}_peak"].apply(bytes2human)
     return df_peak
@@ -228,44 +405,19 @@ def peak_mem_stats_human_readable(
 
 def get_peak_sum_mem() -> tuple:
     """
-    get peak summarized memory stats for the test. Each test df file created anew.
+    get peak summarized memory stats for the test. Each test stats are collected anew.
     spikes defined per measurment (once in three seconds by default -> start_monitor_memory())
-    """
-    global _df
-    _df = catch_empty_mem_df(_df)
-
-    _df = _df.drop_duplicates(subset=["pid", "ts"], keep="last").reset_index(drop=True)
-    df = _df.reset_index(drop=True)
-    df = (
-        df.drop(["status", "pid", "name"], axis=1).groupby(["ts"], as_index=False).sum()
-    )
-
-    ram_max = df[df[constants.RAM] == df[constants.RAM].max()].drop(
-        [constants.VIRT], axis=1
-    )
-    virt_max = df[df[constants.VIRT] == df[constants.VIRT].max()].drop(
-        [constants.RAM], axis=1
-    )
-
-    # catch psutil and calculation failures for rss and vms cells and fill with failure markers
-    # therefore we may see number of failures and ignore them in report csv file while analysing
-    try:
-        log.info(
-            "Peak total ram memory consumption: "
-            f"{bytes2human(ram_max[constants.RAM].values[0].astype(int))} at {ram_max['ts'].values[0]}"
-        )
-    except IndexError:
-        ram_max = pd.DataFrame(columns=ram_max.columns, data=[[-1, pd.to_datetime(0)]])
-    try:
-        log.info(
-            "Peak total virtual memory consumption: "
-            f"{bytes2human(virt_max[constants.VIRT].values[0].astype(int))} at {virt_max['ts'].values[0]}"
-        )
-    except IndexError:
-        virt_max = pd.DataFrame(
-            columns=virt_max.columns, data=[[-1, pd.to_datetime(0)]]
-        )
 
+    Returns:
+        tuple: (dataframe with ts and rss of the peak total ram consumption,
+               dataframe with ts and vms of the peak total virtual memory consumption)
+    """
+    ram_ts, ram = _stats.peak_sum(constants.RAM)
+    virt_ts, virt = _stats.peak_sum(constants.VIRT)
+    log.info(f"Peak total ram memory consumption: {bytes2human(ram)} at {ram_ts}")
+    log.info(f"Peak total virtual memory consumption: {bytes2human(virt)} at {virt_ts}")
+    ram_max = pd.DataFrame([[ram_ts, ram]], columns=["ts", constants.RAM])
+    virt_max = pd.DataFrame([[virt_ts, virt]], columns=["ts", constants.VIRT])
     return ram_max, virt_max
 
 
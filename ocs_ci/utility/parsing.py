@@ -0,0 +1,64 @@
+# -*- coding: utf8 -*-
+"""
+Module for parsing of oc and ceph command outputs and HTTP response bodies.
+
+Most of the outputs are JSON, which is parsed by the json module many times
+faster than by the pure Python YAML parser. YAML is parsed by the LibYAML
+based CSafeLoader when PyYAML is built with it.
+"""
+import json
+
+import yaml
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(data):
+    """
+    Parse YAML document with the safe loader, same as yaml.safe_load
+
+    Args:
+        data (str|bytes|file): YAML document
+
+    Returns:
+        object: parsed document
+
+    """
+    return yaml.load(data, Loader=SafeLoader)
+
+
+def load_yaml_all(data):
+    """
+    Parse all YAML documents with the safe loader, same as yaml.safe_load_all
+
+    Args:
+        data (str|bytes|file): YAML documents
+
+    Returns:
+        generator: parsed documents
+
+    """
+    return yaml.load_all(data, Loader=SafeLoader)
+
+
+def load_output(data):
+    """
+    Parse command output or HTTP response body, which is JSON or YAML. As
+    JSON is a subset of YAML, the result is the same as of yaml.safe_load.
+
+    Args:
+        data (str|bytes): output to parse
+
+    Returns:
+        object: parsed output, None for empty output
+
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    if data.lstrip()[:1] in ("{", "["):
+        try:
+            return json.loads(data)
+        except ValueError:
+            # e.g. YAML flow collection, which isn't valid JSON
+            pass
+    return load_yaml(data)
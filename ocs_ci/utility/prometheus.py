@@ -5,13 +5,17 @@ import requests
 import tempfile
 import time
 import yaml
-from threading import Timer
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Timer
 from datetime import datetime
 
-from ocs_ci.framework import config
+from requests.adapters import HTTPAdapter
+
+from ocs_ci.framework import config, config_safe_thread_pool_task
 from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.exceptions import AlertingError, AuthError, NoThreadingLockUsedError
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility import parsing
 from ocs_ci.utility.ssl_certs import get_root_ca_cert
 from ocs_ci.utility.utils import TimeoutIterator
 
@@ -324,6 +328,43 @@ def validate_status(content):
         raise ValueError("content status is not success")
 
 
+_session = None
+_session_lock = Lock()
+
+
+def get_session():
+    """
+    Get requests session shared by all PrometheusAPI instances and threads.
+    It keeps a pool of persistent connections to Prometheus, of size
+    config.RUN["prometheus_pool_maxsize"] per host.
+
+    Returns:
+        requests.Session: pooled session
+
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            pool_maxsize = config.RUN.get("prometheus_pool_maxsize", 10)
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def close_session():
+    """
+    Close the pooled connections of the shared session
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
 class PrometheusAPI(object):
     """
     This is wrapper class for Prometheus API.
@@ -364,6 +405,7 @@ class PrometheusAPI(object):
                     password = f.read().rstrip("\n")
             self._password = password
         self._threading_lock = threading_lock
+        self._refresh_lock = Lock()
         self.refresh_connection()
         if (
             not config.ENV_DATA["platform"].lower() == "ibm_cloud"
@@ -448,11 +490,12 @@ class PrometheusAPI(object):
         logger.debug(f"verify={self._cacert}")
         logger.debug(f"params={payload}")
 
+        session = get_session()
         if timeout:
             for sample_response in TimeoutIterator(
                 timeout=timeout,
                 sleep=15,
-                func=requests.get,
+                func=session.get,
                 func_kwargs={
                     "url": self._endpoint + pattern,
                     "headers": headers,
@@ -463,20 +506,26 @@ class PrometheusAPI(object):
                 response = sample_response
                 if not response.ok:
                     logger.warning(f"There was an error in response: {response.text}")
-                    logger.warning("Refreshing connection")
-                    self.refresh_connection()
-                    if (
-                        not config.ENV_DATA["platform"].lower() == "ibm_cloud"
-                        and config.ENV_DATA["deployment_type"] == "managed"
-                    ):
-                        logger.warning("Generating new certificate")
-                        self.generate_cert()
-                    logger.warning("Connection refreshed")
+                    # concurrent queries of query_many can fail at once, only
+                    # one of them refreshes the token and rewrites kubeconfig
+                    with self._refresh_lock:
+                        if headers["Authorization"] == f"Bearer {self._token}":
+                            logger.warning("Refreshing connection")
+                            self.refresh_connection()
+                            if (
+                                not config.ENV_DATA["platform"].lower() == "ibm_cloud"
+                                and config.ENV_DATA["deployment_type"] == "managed"
+                            ):
+                                logger.warning("Generating new certificate")
+                                self.generate_cert()
+                            logger.warning("Connection refreshed")
+                        # next attempt uses the refreshed token
+                        headers["Authorization"] = f"Bearer {self._token}"
                 else:
                     break
             return response
         else:
-            return requests.get(
+            return session.get(
                 self._endpoint + pattern,
                 headers=headers,
                 verify=self._cacert,
@@ -528,7 +577,7 @@ class PrometheusAPI(object):
                 logger.info(log_msg)
         resp = self.get("query", payload=query_payload)
         try:
-            content = yaml.safe_load(resp.content)
+            content = parsing.load_output(resp.content)
         except Exception as ex:
             log_parsing_error(query_payload, resp.content, ex)
             raise
@@ -537,6 +586,45 @@ class PrometheusAPI(object):
         # return actual result of the query
         return content["data"]["result"]
 
+    def query_many(
+        self, queries, timestamp=None, timeout=None, validate=True, max_workers=None
+    ):
+        """
+        Perform Prometheus instant queries concurrently, over the pooled
+        connections of the shared session.
+
+        Args:
+            queries (list): Prometheus expression query strings
+            timestamp (str): Evaluation timestamp (rfc3339 or unix timestamp).
+                Optional.
+            timeout (str): Evaluation timeout in duration format. Optional.
+            validate (bool): Perform basic validation on the responses.
+            max_workers (int): Number of queries running at once, defaults to
+                config.RUN["prometheus_pool_maxsize"]
+
+        Returns:
+            list: Results of the queries, in the order of the queries
+
+        """
+        logger.info(f"Performing {len(queries)} prometheus instant queries: {queries}")
+        max_workers = max_workers or config.RUN.get("prometheus_pool_maxsize", 10)
+        config_index = config.cluster_ctx.MULTICLUSTER["multicluster_index"]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    config_safe_thread_pool_task,
+                    config_index,
+                    self.query,
+                    query,
+                    timestamp=timestamp,
+                    timeout=timeout,
+                    validate=validate,
+                    log_debug=True,
+                )
+                for query in queries
+            ]
+            return [future.result() for future in futures]
+
     def query_range(self, query, start, end, step, timeout=None, validate=True):
         """
         Perform Prometheus `range query`_. This is a simple wrapper over
@@ -572,7 +660,7 @@ class PrometheusAPI(object):
         )
         resp = self.get("query_range", payload=query_payload)
         try:
-            content = yaml.safe_load(resp.content)
+            content = parsing.load_output(resp.content)
         except Exception as ex:
             log_parsing_error(query_payload, resp.content, ex)
             raise
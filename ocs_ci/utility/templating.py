@@ -1,6 +1,8 @@
 import json
 import logging
-from jinja2 import Environment, FileSystemLoader, Template
+import os
+import threading
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 import yaml
 
 from copy import deepcopy
@@ -10,6 +12,15 @@ from ocs_ci.utility.utils import censor_values, get_url_content
 
 logger = logging.getLogger(__name__)
 
+# Parsed yaml files validated by their modification time, see load_yaml
+_yaml_cache = {}
+_yaml_cache_lock = threading.Lock()
+_yaml_cache_stats = {"hits": 0, "misses": 0}
+
+# Jinja2 environments shared by all the renders, see get_jinja2_environment
+_j2_environments = {}
+_j2_environments_lock = threading.Lock()
+
 
 def load_config_data(data_path):
     """
@@ -51,6 +62,37 @@ def to_nice_yaml(a, indent=2, *args, **kw):
     return transformed
 
 
+def get_jinja2_environment(base_path, trim_blocks=True):
+    """
+    Get Jinja2 environment loading the templates from the base path. The
+    environment is created once per base path, so the compiled templates are
+    cached in it (and recompiled only when the template file changes) and
+    the bytecode of the templates is cached on the disk for other processes.
+
+    Args:
+        base_path (str): path from which the templates are loaded
+        trim_blocks (bool): remove first newline after a block
+
+    Returns:
+        jinja2.Environment: environment with to_nice_yaml filter
+
+    """
+    key = (os.path.abspath(base_path), trim_blocks)
+    j2_env = _j2_environments.get(key)
+    if j2_env is None:
+        with _j2_environments_lock:
+            j2_env = _j2_environments.get(key)
+            if j2_env is None:
+                j2_env = Environment(
+                    loader=FileSystemLoader(key[0]),
+                    trim_blocks=trim_blocks,
+                    bytecode_cache=FileSystemBytecodeCache(),
+                )
+                j2_env.filters["to_nice_yaml"] = to_nice_yaml
+                _j2_environments[key] = j2_env
+    return j2_env
+
+
 class Templating:
     """
     Class which provides all functionality for templating
@@ -78,11 +120,31 @@ class Templating:
         Returns: rendered template
 
         """
-        j2_env = Environment(loader=FileSystemLoader(self._base_path), trim_blocks=True)
-        j2_env.filters["to_nice_yaml"] = to_nice_yaml
-        j2_template = j2_env.get_template(template_path)
+        j2_template = get_jinja2_environment(self._base_path).get_template(
+            template_path
+        )
         return j2_template.render(**data)
 
+    def render_templates(self, template_path, data_list):
+        """
+        Render the template once per item of the data, e.g. for creation of
+        many resources of the same kind.
+
+        Args:
+            template_path (str): location of the j2 template from the
+                self._base_path
+            data_list (list): dicts with the data to be formatted into the
+                template, one per rendered document
+
+        Returns:
+            list: rendered templates in the order of data_list
+
+        """
+        j2_template = get_jinja2_environment(self._base_path).get_template(
+            template_path
+        )
+        return [j2_template.render(**data) for data in data_list]
+
     @property
     def base_path(self):
         """
@@ -117,11 +179,28 @@ def generate_yaml_from_jinja2_template_with_data(file_, **kwargs):
     Examples:
         generate_yaml_from_template(file_='path/to/file/name', pv_data_dict')
     """
-    with open(file_, "r") as stream:
-        data = stream.read()
-    template = Template(data)
-    out = template.render(**kwargs)
-    return yaml.safe_load(out)
+    return generate_yamls_from_jinja2_template_with_data(file_, [kwargs])[0]
+
+
+def generate_yamls_from_jinja2_template_with_data(file_, data_list):
+    """
+    Generate yamls from jinja2 yaml, the template is compiled once for all
+    the data.
+
+    Args:
+        file_ (str): Template Yaml file path
+        data_list (list): dicts with jinja2 attributes, one per generated
+            yaml
+
+    Returns:
+        list: dicts generated from template file in the order of data_list
+
+    """
+    path = os.path.abspath(file_)
+    template = get_jinja2_environment(
+        os.path.dirname(path), trim_blocks=False
+    ).get_template(os.path.basename(path))
+    return [yaml.safe_load(template.render(**data)) for data in data_list]
 
 
 def dump_to_temp_yaml(src_file, dst_file, **kwargs):
@@ -140,6 +219,10 @@ def load_yaml(file, multi_document=False):
     """
     Load yaml file (local or from URL) and convert it to dictionary
 
+    The documents of the local files are parsed once and cached until the
+    modification time or size of the file changes. Copies of the cached
+    documents are returned, so they can be modified by the caller.
+
     Args:
         file (str): Path to the file or URL address
         multi_document (bool): True if yaml contains more documents
@@ -151,12 +234,71 @@ def load_yaml(file, multi_document=False):
             iteration returns dict from one loaded document from a file.
 
     """
-    loader = yaml.safe_load_all if multi_document else yaml.safe_load
     if file.startswith("http"):
+        loader = yaml.safe_load_all if multi_document else yaml.safe_load
         return loader(get_url_content(file))
-    else:
-        with open(file, "r") as fs:
-            return loader(fs.read())
+    documents = _load_cached_yaml(file)
+    if multi_document:
+        return (deepcopy(document) for document in documents)
+    if len(documents) > 1:
+        # same error as yaml.safe_load raises for more documents
+        raise yaml.composer.ComposerError(
+            "expected a single document in the stream",
+            None,
+            "but found another document",
+            None,
+        )
+    return deepcopy(documents[0]) if documents else None
+
+
+def _load_cached_yaml(file):
+    """
+    Get the documents of the local yaml file from the cache, parse the file
+    if it's not cached or it changed since it was cached.
+
+    Args:
+        file (str): Path to the file
+
+    Returns:
+        list: documents of the yaml file, must not be modified
+
+    """
+    path = os.path.abspath(file)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _yaml_cache.get(path)
+    if cached and cached[0] == version:
+        with _yaml_cache_lock:
+            _yaml_cache_stats["hits"] += 1
+        return cached[1]
+    with open(path, "r") as fs:
+        documents = list(yaml.safe_load_all(fs.read()))
+    with _yaml_cache_lock:
+        _yaml_cache_stats["misses"] += 1
+        _yaml_cache[path] = (version, documents)
+    return documents
+
+
+def load_yaml_cache_info():
+    """
+    Statistics of the cache of load_yaml
+
+    Returns:
+        dict: number of the cache hits and misses and of the cached files
+
+    """
+    with _yaml_cache_lock:
+        return dict(_yaml_cache_stats, files=len(_yaml_cache))
+
+
+def clear_load_yaml_cache():
+    """
+    Remove all the files from the cache of load_yaml and reset its
+    statistics
+    """
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+        _yaml_cache_stats.update(hits=0, misses=0)
 
 
 def get_n_document_from_yaml(yaml_generator, index=0):
@@ -0,0 +1,99 @@
+# -*- coding: utf8 -*-
+"""
+Minimal local stand-in for the Prometheus HTTP API, answering instant queries
+with a constant vector. It's used by unit tests and benchmarks of
+PrometheusAPI.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class FakePrometheusServer(object):
+    """
+    Threaded HTTP/1.1 server with keep-alive, counting the requests and the
+    TCP connections it accepted.
+    """
+
+    def __init__(self, token="fake-token", delay=0):
+        """
+        Args:
+            token (str): bearer token the requests have to be authorized by
+            delay (float): seconds every query takes
+
+        """
+        self.token = token
+        self.delay = delay
+        self.requests = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, code, body):
+                data = json.dumps(body).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests += 1
+                if self.headers.get("Authorization") != f"Bearer {server.token}":
+                    return self._send(401, {"status": "error", "error": "Unauthorized"})
+                url = urlparse(self.path)
+                if url.path != "/api/v1/query":
+                    return self._send(404, {"status": "error", "error": "Not found"})
+                time.sleep(server.delay)
+                query = parse_qs(url.query)["query"][0]
+                self._send(
+                    200,
+                    {
+                        "status": "success",
+                        "data": {
+                            "resultType": "vector",
+                            "result": [
+                                {
+                                    "metric": {"__name__": query},
+                                    "value": [time.time(), "1"],
+                                }
+                            ],
+                        },
+                    },
+                )
+
+        return Handler
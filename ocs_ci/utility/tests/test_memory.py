@@ -0,0 +1,99 @@
+# -*- coding: utf8 -*-
+import random
+
+import pandas as pd
+import pytest
+
+from ocs_ci.ocs import constants
+from ocs_ci.utility import memory
+
+
+@pytest.fixture
+def samples():
+    """
+    Samples of 15 processes over 50 measurements, including duplicated
+    samples of a process at the same ts.
+    """
+    rnd = random.Random(42)
+    rows = []
+    for tick in range(50):
+        ts = f"2024-05-01 10:{tick // 20:02d}:{tick % 20 * 3:02d}"
+        for pid in range(100, 115):
+            if rnd.random() < 0.2:
+                continue
+            for _ in range(2 if rnd.random() < 0.1 else 1):
+                rows.append(
+                    [
+                        pid,
+                        f"proc-{pid % 13}",
+                        ts,
+                        rnd.randint(1, 1000) * 1024,
+                        rnd.randint(1000, 5000) * 1024,
+                        "running",
+                    ]
+                )
+    return rows
+
+
+@pytest.mark.parametrize("stat", [constants.RAM, constants.VIRT])
+def test_peak_table_same_as_dataframe(samples, stat):
+    """
+    Check that aggregated peak stats are the same as computed from all the
+    samples.
+    """
+    stats = memory.MemoryStats()
+    for row in samples:
+        stats.add(*row)
+    df = pd.DataFrame(samples, columns=memory._columns_df)
+    expected = memory.read_peak_mem_stats(stat, df=df)
+    assert stats.peak_table(stat).values.tolist() == expected.values.tolist()
+
+
+@pytest.mark.parametrize("stat", [constants.RAM, constants.VIRT])
+def test_peak_sum_same_as_dataframe(samples, stat):
+    """
+    Check that the peak of the memory summarized over the processes is the
+    same as computed from all the samples.
+    """
+    stats = memory.MemoryStats()
+    for row in samples:
+        stats.add(*row)
+    df = pd.DataFrame(samples, columns=memory._columns_df)
+    sums = (
+        df.drop_duplicates(subset=["pid", "ts"], keep="last")
+        .groupby("ts", as_index=False)[stat]
+        .sum()
+    )
+    expected = sums[sums[stat] == sums[stat].max()].values[0].tolist()
+    assert list(stats.peak_sum(stat)) == expected
+
+
+def test_csv_written_in_chunks(samples, tmp_path):
+    """
+    Check that the samples are appended to the csv file in chunks and that
+    the stats read from the csv are the same as the aggregated ones.
+    """
+    csv_path = str(tmp_path / "mem.csv")
+    stats = memory.MemoryStats(csv_path=csv_path, chunk_size=100)
+    for row in samples[:150]:
+        stats.add(*row)
+    assert len(pd.read_csv(csv_path)) == 100
+    for row in samples[150:]:
+        stats.add(*row)
+    stats.flush()
+    df = pd.read_csv(csv_path)
+    assert len(df) == len(samples)
+    assert df["Unnamed: 0"].tolist() == list(range(len(samples)))
+    assert (
+        memory.read_peak_mem_stats(constants.RAM, csv_path=csv_path).values.tolist()
+        == stats.peak_table(constants.RAM).values.tolist()
+    )
+
+
+def test_no_samples():
+    """
+    Check the failure markers reported when there are no samples.
+    """
+    stats = memory.MemoryStats()
+    assert stats.peak_sum(constants.RAM) == (pd.to_datetime(0), -1)
+    assert stats.peak_table(constants.RAM)[f"{constants.RAM}_peak"].tolist() == [-1]
@@ -0,0 +1,65 @@
+# -*- coding: utf8 -*-
+import json
+
+import pytest
+import yaml
+
+from ocs_ci.utility import parsing
+
+POD_LIST = {
+    "apiVersion": "v1",
+    "kind": "List",
+    "items": [
+        {
+            "metadata": {
+                "name": "rook-ceph-mon-a",
+                "creationTimestamp": "2024-05-01T10:00:00Z",
+                "labels": {"app": "rook-ceph-mon", "ceph_daemon_id": "a"},
+            },
+            "spec": {"containers": [{"name": "mon", "args": ["--foreground"]}]},
+            "status": {"phase": "Running", "restartCount": 0, "ready": True},
+        }
+    ],
+    "metadata": {"resourceVersion": ""},
+}
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        json.dumps(POD_LIST, indent=4),
+        json.dumps(POD_LIST).encode(),
+        yaml.safe_dump(POD_LIST),
+    ],
+    ids=["json", "json-bytes", "yaml"],
+)
+def test_load_output_same_as_safe_load(output):
+    """
+    Check that JSON and YAML outputs are parsed as by yaml.safe_load.
+    """
+    assert parsing.load_output(output) == yaml.safe_load(output) == POD_LIST
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        ("", None),
+        ("[a, b]", ["a", "b"]),
+        ("{a: 1}", {"a": 1}),
+        ("HEALTH_OK\n", "HEALTH_OK"),
+        ('[{"name": "fs1"}, {}]\n', [{"name": "fs1"}, {}]),
+    ],
+    ids=["empty", "flow-sequence", "flow-mapping", "plain", "ceph-list"],
+)
+def test_load_output_yaml_fallback(output, expected):
+    """
+    Check outputs which are not valid JSON and ceph list output.
+    """
+    assert parsing.load_output(output) == expected
+
+
+def test_load_yaml_all():
+    """
+    Check multi document YAML.
+    """
+    assert list(parsing.load_yaml_all("a: 1\n---\nb: 2\n")) == [{"a": 1}, {"b": 2}]
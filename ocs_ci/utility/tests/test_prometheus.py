@@ -1,9 +1,14 @@
 # -*- coding: utf8 -*-
 
+import threading
+import time
+
 import pytest
 
 from ocs_ci.framework import config
-from ocs_ci.utility.prometheus import check_query_range_result_enum
+from ocs_ci.utility import prometheus, utils
+from ocs_ci.utility.prometheus import PrometheusAPI, check_query_range_result_enum
+from ocs_ci.utility.tests.fake_prometheus import FakePrometheusServer
 
 
 @pytest.fixture
@@ -205,3 +210,68 @@ def test_check_query_range_result_exp_good_time(query_range_result_bad_last_90s)
         exp_good_time=150,
     )
     assert result2, "taking exp_good_time into account, validation should pass"
+
+
+@pytest.fixture
+def prometheus_api(monkeypatch):
+    """
+    PrometheusAPI connected to the fake Prometheus server.
+    """
+    with FakePrometheusServer(delay=0.2) as server:
+
+        def refresh_connection(api):
+            api._token = server.token
+            api._endpoint = server.url
+
+        monkeypatch.setattr(PrometheusAPI, "refresh_connection", refresh_connection)
+        monkeypatch.setitem(config.ENV_DATA, "platform", "aws")
+        monkeypatch.setitem(config.ENV_DATA, "deployment_type", "ipi")
+        monkeypatch.setitem(config.RUN, "prometheus_pool_maxsize", 4)
+        prometheus.close_session()
+        api = PrometheusAPI(
+            user="kubeadmin", password="password", threading_lock=threading.RLock()
+        )
+        yield server, api
+    prometheus.close_session()
+
+
+def test_connections_are_pooled(prometheus_api):
+    """
+    Check that queries of more PrometheusAPI instances reuse one persistent
+    connection.
+    """
+    server, api = prometheus_api
+    other_api = PrometheusAPI(
+        user="kubeadmin", password="password", threading_lock=threading.RLock()
+    )
+    for query in ("up", "ceph_health_status", "ceph_mon_quorum_status"):
+        assert api.query(query)[0]["metric"]["__name__"] == query
+        assert other_api.query(query)[0]["metric"]["__name__"] == query
+    assert server.requests == 6
+    assert server.connections == 1
+
+
+def test_query_many(prometheus_api):
+    """
+    Check that query_many runs the queries concurrently and returns the
+    results in the order of the queries.
+    """
+    server, api = prometheus_api
+    queries = [f"metric_{i}" for i in range(8)]
+    start = time.monotonic()
+    results = api.query_many(queries)
+    assert time.monotonic() - start < 8 * server.delay
+    assert [result[0]["metric"]["__name__"] for result in results] == queries
+    assert server.connections <= 4
+
+
+def test_refreshed_token_is_used(prometheus_api, monkeypatch):
+    """
+    Check that the query is retried with the token from the refreshed
+    connection.
+    """
+    server, api = prometheus_api
+    monkeypatch.setattr(utils.time, "sleep", lambda seconds: None)
+    api._token = "expired-token"
+    assert api.query("up")[0]["metric"]["__name__"] == "up"
+    assert server.requests == 2
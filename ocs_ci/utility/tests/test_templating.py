@@ -0,0 +1,131 @@
+# -*- coding: utf8 -*-
+
+import os
+
+import pytest
+import yaml
+
+from ocs_ci.utility import templating
+
+
+@pytest.fixture
+def template_dir(tmp_path, monkeypatch):
+    """
+    Directory with PVC template, the environments cache is emptied.
+    """
+    monkeypatch.setattr(templating, "_j2_environments", {})
+    (tmp_path / "pvc.yaml.j2").write_text(
+        "kind: PersistentVolumeClaim\n"
+        "metadata:\n"
+        "  name: {{ name }}\n"
+        "{% if size %}\n"
+        "spec:\n"
+        "  size: {{ size }}\n"
+        "{% endif %}\n"
+    )
+    return tmp_path
+
+
+def test_environment_is_shared(template_dir):
+    """
+    Check that the templates are compiled once for all the Templating
+    instances with the same base path.
+    """
+    env = templating.get_jinja2_environment(str(template_dir))
+    assert templating.get_jinja2_environment(f"{template_dir}/") is env
+    assert templating.get_jinja2_environment(str(template_dir), False) is not env
+    first = templating.Templating(str(template_dir))
+    second = templating.Templating(str(template_dir))
+    rendered = first.render_template("pvc.yaml.j2", {"name": "a", "size": "1Gi"})
+    assert rendered == (
+        "kind: PersistentVolumeClaim\nmetadata:\n  name: a\nspec:\n  size: 1Gi\n"
+    )
+    template = env.get_template("pvc.yaml.j2")
+    second.render_template("pvc.yaml.j2", {"name": "b", "size": None})
+    assert env.get_template("pvc.yaml.j2") is template
+
+
+def test_changed_template_is_reloaded(template_dir):
+    """
+    Check that the change of the cached template file is rendered.
+    """
+    templating_obj = templating.Templating(str(template_dir))
+    assert "name: a" in templating_obj.render_template("pvc.yaml.j2", {"name": "a"})
+    template_file = template_dir / "pvc.yaml.j2"
+    template_file.write_text("name: {{ name }}-changed\n")
+    stat = template_file.stat()
+    os.utime(template_file, (stat.st_atime, stat.st_mtime + 10))
+    assert templating_obj.render_template("pvc.yaml.j2", {"name": "a"}) == (
+        "name: a-changed"
+    )
+
+
+def test_bulk_render(template_dir):
+    """
+    Check that bulk render produces document per data item, in order.
+    """
+    templating_obj = templating.Templating(str(template_dir))
+    data_list = [{"name": f"pvc-{i}", "size": f"{i}Gi"} for i in range(50)]
+    rendered = templating_obj.render_templates("pvc.yaml.j2", data_list)
+    assert rendered == [
+        templating_obj.render_template("pvc.yaml.j2", data) for data in data_list
+    ]
+    docs = templating.generate_yamls_from_jinja2_template_with_data(
+        str(template_dir / "pvc.yaml.j2"), data_list
+    )
+    assert [doc["metadata"]["name"] for doc in docs] == [f"pvc-{i}" for i in range(50)]
+    assert docs[3]["spec"] == {"size": "3Gi"}
+    assert templating.generate_yaml_from_jinja2_template_with_data(
+        str(template_dir / "pvc.yaml.j2"), name="single", size=None
+    ) == {"kind": "PersistentVolumeClaim", "metadata": {"name": "single"}}
+
+
+@pytest.fixture
+def yaml_cache(monkeypatch):
+    """
+    Empty cache of load_yaml.
+    """
+    monkeypatch.setattr(templating, "_yaml_cache", {})
+    monkeypatch.setattr(templating, "_yaml_cache_stats", {"hits": 0, "misses": 0})
+
+
+def test_load_yaml_cached_copies(yaml_cache, tmp_path):
+    """
+    Check that the yaml file is parsed once and that the caller gets copy of
+    the cached document which it can modify.
+    """
+    pvc_file = str(tmp_path / "pvc.yaml")
+    with open(pvc_file, "w") as fd:
+        fd.write("kind: PersistentVolumeClaim\nmetadata:\n  name: pvc\n")
+    pvc = templating.load_yaml(pvc_file)
+    pvc["metadata"]["name"] = "changed"
+    assert templating.load_yaml(pvc_file)["metadata"]["name"] == "pvc"
+    assert templating.load_yaml_cache_info() == {"hits": 1, "misses": 1, "files": 1}
+
+    with open(pvc_file, "w") as fd:
+        fd.write("kind: PersistentVolumeClaim\nmetadata:\n  name: new-pvc\n")
+    stat = os.stat(pvc_file)
+    os.utime(pvc_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert templating.load_yaml(pvc_file)["metadata"]["name"] == "new-pvc"
+    assert templating.load_yaml_cache_info()["misses"] == 2
+    templating.clear_load_yaml_cache()
+    assert templating.load_yaml_cache_info() == {"hits": 0, "misses": 0, "files": 0}
+
+
+def test_load_yaml_multi_document(yaml_cache, tmp_path):
+    """
+    Check loading of multi document yaml file from the cache.
+    """
+    yaml_file = str(tmp_path / "multi.yaml")
+    with open(yaml_file, "w") as fd:
+        fd.write("a: 1\n---\nb: 2\n")
+    for _ in range(2):
+        documents = list(templating.load_yaml(yaml_file, multi_document=True))
+        assert documents == [{"a": 1}, {"b": 2}]
+        documents[0]["a"] = 3
+    assert templating.get_n_document_from_yaml(
+        templating.load_yaml(yaml_file, multi_document=True), 1
+    ) == {"b": 2}
+    with pytest.raises(yaml.composer.ComposerError):
+        templating.load_yaml(yaml_file)
+    assert templating.load_yaml_cache_info()["misses"] == 1
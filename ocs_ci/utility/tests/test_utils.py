@@ -1,12 +1,16 @@
 # -*- coding: utf8 -*-
 
 import logging
+import os
+import threading
+import time
 from itertools import repeat
 from sys import platform
 
 import pytest
 
-from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.framework import Config
+from ocs_ci.ocs.exceptions import CommandFailed, MultiClusterTaskFailed
 from ocs_ci.utility import utils, version
 
 
@@ -196,3 +200,166 @@ class B:
 )
 def test_filter_unrepresentable_values(data_to_filter, expected_output):
     assert utils.filter_unrepresentable_values(data_to_filter) == expected_output
+
+
+@pytest.fixture
+def fake_oc(tmp_path, monkeypatch):
+    """
+    Fake oc binary which records each invocation to a file and reports
+    a single oc plugin.
+    """
+    calls_file = tmp_path / "calls"
+    oc_bin = tmp_path / "oc"
+    oc_bin.write_text(
+        "#!/bin/sh\n"
+        f'echo "$@" >> {calls_file}\n'
+        'if [ "$1 $2" = "plugin list" ]; then echo /usr/bin/oc-odf; fi\n'
+    )
+    oc_bin.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    utils.invalidate_oc_plugin_cache()
+    yield oc_bin, calls_file
+    utils.invalidate_oc_plugin_cache()
+
+
+@pytest.mark.skipif(platform.startswith("win"), reason="requires posix shell")
+def test_get_oc_plugins_cached(fake_oc):
+    """
+    Check that `oc plugin list` is forked only once for repeated lookups.
+    """
+    _, calls_file = fake_oc
+    stats_before = utils.get_oc_plugin_cache_stats()
+    for _ in range(5):
+        assert utils.get_oc_plugins() == ["/usr/bin/oc-odf"]
+    stats = utils.get_oc_plugin_cache_stats()
+    assert calls_file.read_text().splitlines() == ["plugin list"]
+    assert stats["forks"] - stats_before["forks"] == 1
+    assert stats["forks_saved"] - stats_before["forks_saved"] == 4
+
+
+@pytest.mark.skipif(platform.startswith("win"), reason="requires posix shell")
+def test_get_oc_plugins_binary_changed(fake_oc):
+    """
+    Check that the cache is invalidated when the oc binary is replaced.
+    """
+    oc_bin, calls_file = fake_oc
+    utils.get_oc_plugins()
+    oc_bin.write_text(oc_bin.read_text() + "# new oc client\n")
+    utils.get_oc_plugins()
+    assert calls_file.read_text().splitlines() == ["plugin list", "plugin list"]
+
+
+@pytest.mark.skipif(platform.startswith("win"), reason="requires posix shell")
+def test_exec_cmd_oc_plugin_kubeconfig_position(fake_oc, monkeypatch):
+    """
+    Check that --kubeconfig is placed after the plugin subcommand and that
+    plugin discovery is done once for multiple oc commands.
+    """
+    _, calls_file = fake_oc
+    monkeypatch.setitem(utils.config.RUN, "kubeconfig", "/tmp/kubeconfig")
+    utils.exec_cmd("oc odf get recovery-profile")
+    utils.exec_cmd("oc get pods")
+    assert calls_file.read_text().splitlines() == [
+        "plugin list",
+        "odf --kubeconfig /tmp/kubeconfig get recovery-profile",
+        "--kubeconfig /tmp/kubeconfig get pods",
+    ]
+
+
+@pytest.fixture
+def clusters(tmp_path, monkeypatch):
+    """
+    Config of three clusters with their own kubeconfig and fake oc binary,
+    which sleeps for a second and fails for the cluster with 'bad' in the
+    kubeconfig path.
+    """
+    oc_bin = tmp_path / "oc"
+    oc_bin.write_text(
+        "#!/bin/sh\n"
+        'if [ "$1" = "plugin" ]; then exit 0; fi\n'
+        "sleep 1\n"
+        'case "$*" in *bad*) echo failed >&2; exit 1;; esac\n'
+        'printf "%s\\n" "$*"\n'
+    )
+    oc_bin.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    utils.invalidate_oc_plugin_cache()
+    cluster_configs = []
+    for index in range(3):
+        cluster = Config()
+        cluster.MULTICLUSTER["multicluster_index"] = index
+        cluster.ENV_DATA["cluster_name"] = f"cluster-{index}"
+        cluster.RUN["kubeconfig"] = f"/tmp/cluster-{index}/kubeconfig"
+        cluster_configs.append(cluster)
+    monkeypatch.setattr(utils.config, "clusters", cluster_configs)
+    monkeypatch.setattr(utils.config, "cur_index", 0)
+    yield cluster_configs
+    utils.invalidate_oc_plugin_cache()
+
+
+@pytest.mark.skipif(platform.startswith("win"), reason="requires posix shell")
+def test_run_cmd_multicluster_parallel(clusters):
+    """
+    Check that the command runs on all the clusters at once, each with its
+    kubeconfig, and that the results are indexed by the cluster.
+    """
+    start = time.time()
+    results = utils.run_cmd_multicluster_parallel("oc get pods", skip_index=1)
+    assert time.time() - start < 2
+    assert results[1] is None
+    for index in (0, 2):
+        assert results[index].stdout.decode().strip() == (
+            f"--kubeconfig /tmp/cluster-{index}/kubeconfig get pods"
+        )
+    assert utils.config.cur_index == 0
+
+
+@pytest.mark.skipif(platform.startswith("win"), reason="requires posix shell")
+def test_run_cmd_multicluster_parallel_failures(clusters):
+    """
+    Check that failure is raised without waiting for the other clusters in
+    fail fast mode and that all the failures are collected otherwise.
+    """
+    clusters[1].RUN["kubeconfig"] = "/tmp/bad-1/kubeconfig"
+    clusters[2].RUN["kubeconfig"] = "/tmp/bad-2/kubeconfig"
+    with pytest.raises(CommandFailed):
+        utils.run_cmd_multicluster_parallel("oc get pods")
+    with pytest.raises(MultiClusterTaskFailed) as exc_info:
+        utils.run_cmd_multicluster_parallel("oc get pods", fail_fast=False)
+    assert sorted(exc_info.value.errors) == [1, 2]
+    assert all(isinstance(ex, CommandFailed) for ex in exc_info.value.errors.values())
+    assert list(exc_info.value.results) == [0]
+    assert "cluster index 2" in str(exc_info.value)
+
+
+def test_run_func_multicluster_config_context(clusters):
+    """
+    Check that the function sees the config of its cluster.
+    """
+    results = utils.run_func_multicluster(
+        lambda suffix: utils.config.ENV_DATA["cluster_name"] + suffix,
+        func_args=["-checked"],
+        cluster_indexes=[2, 0],
+    )
+    assert results == {0: "cluster-0-checked", 2: "cluster-2-checked"}
+
+
+def test_run_func_multicluster_fail_fast_running(clusters, caplog):
+    """
+    Check that fail_fast doesn't wait for the calls still running on the
+    other clusters and reports them.
+    """
+    release = threading.Event()
+
+    def func():
+        if utils.config.ENV_DATA["cluster_name"] == "cluster-0":
+            raise CommandFailed("failed")
+        release.wait(5)
+        return True
+
+    with caplog.at_level(logging.WARNING):
+        with pytest.raises(CommandFailed):
+            utils.run_func_multicluster(func)
+    release.set()
+    assert "keeps running in the background" in caplog.text
+    assert "cluster-1" in caplog.text
@@ -1,12 +1,17 @@
 # -*- coding: utf8 -*-
 
 import logging
+import threading
 import time
 
 import pytest
 
 from ocs_ci.ocs.exceptions import TimeoutExpiredError
-from ocs_ci.utility.utils import TimeoutSampler, TimeoutIterator
+from ocs_ci.utility.utils import (
+    ExponentialBackoff,
+    TimeoutSampler,
+    TimeoutIterator,
+)
 
 
 @pytest.mark.parametrize("timeout_cls", [TimeoutSampler, TimeoutIterator])
@@ -195,3 +200,59 @@ def test_ts_wait_for_value_negative(caplog):
         assert "function <lambda> failed" in log_msg
         assert "failed to return expected value 2" in log_msg
         assert "during 3 second timeout" in log_msg
+
+
+def test_exponential_backoff_delays():
+    """
+    Check that the delays of ExponentialBackoff grow from the sleep of the
+    sampler up to max_delay and stay within the jitter.
+    """
+    backoff = ExponentialBackoff(factor=2, max_delay=10, jitter=0)
+    assert [backoff(attempt, 1) for attempt in range(6)] == [1, 2, 4, 8, 10, 10]
+    assert backoff(10000, 1) == 10
+    backoff = ExponentialBackoff(factor=2, jitter=0.1)
+    for _ in range(100):
+        assert 3.6 <= backoff(2, 1) <= 4.4
+    with pytest.raises(ValueError):
+        ExponentialBackoff(factor=0.5)
+
+
+def test_ts_backoff_stats(monkeypatch):
+    """
+    Check that TimeoutSampler sleeps the delays of the backoff and counts
+    the samples and time spent sleeping.
+    """
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    func_state = []
+
+    def func():
+        func_state.append(0)
+        return len(func_state)
+
+    ts = TimeoutIterator(60, 1, func, backoff=ExponentialBackoff(max_delay=5, jitter=0))
+    ts.wait_for_func_value(6)
+    assert sleeps == [1, 2, 4, 5, 5]
+    stats = ts.stats()
+    assert stats["samples"] == 6
+    assert stats["wakeups"] == 0
+    assert stats["sleep_time"] <= stats["total_time"]
+
+
+def test_ts_wake_up():
+    """
+    Check that the sleep of TimeoutSampler is interrupted by wake_up, so
+    that the next sample is taken immediately.
+    """
+    values = iter([False, True])
+    ts = TimeoutIterator(60, 30, lambda: next(values))
+    ts.wakeup_event = threading.Event()
+    timer = threading.Timer(0.2, ts.wake_up)
+    timer.start()
+    start = time.time()
+    assert ts.wait_for_func_status(True)
+    assert time.time() - start < 10
+    timer.join()
+    stats = ts.stats()
+    assert (stats["samples"], stats["wakeups"]) == (2, 1)
+    assert not ts.wakeup_event.is_set()
@@ -13,11 +13,13 @@ import smtplib
 import socket
 import string
 import subprocess
+import threading
 import time
 import traceback
 from typing import Match, Iterator
 import stat
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -38,7 +40,7 @@ from paramiko.auth_handler import AuthenticationException, SSHException
 from semantic_version import Version
 from tempfile import NamedTemporaryFile, mkdtemp, TemporaryDirectory
 from jinja2 import FileSystemLoader, Environment
-from ocs_ci.framework import config
+from ocs_ci.framework import config, config_safe_thread_pool_task
 from ocs_ci.framework import GlobalVariables as GV
 from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.exceptions import (
@@ -60,6 +62,7 @@ from ocs_ci.ocs.exceptions import (
     CephToolBoxNotFoundException,
     NoRunningCephToolBoxException,
     ClusterNotInSTSModeException,
+    MultiClusterTaskFailed,
 )
 from ocs_ci.utility import version as version_module
 from ocs_ci.utility.flexy import load_cluster_info
@@ -86,6 +89,12 @@ failure = {}
 output = []
 unique_test_names = []
 
+# Cache of `oc plugin list` output, keyed by PATH and by identity of the oc
+# binary, so the plugin discovery doesn't fork a process per oc command.
+_oc_plugin_cache = {}
+_oc_plugin_cache_lock = threading.Lock()
+_oc_plugin_cache_stats = {"lookups": 0, "forks": 0, "forks_saved": 0}
+
 
 # function for getting the clients
 def get_client_info(ceph_nodes, clients):
@@ -596,6 +605,237 @@ def run_cmd_multicluster(
     return completed_process
 
 
+def run_func_multicluster(
+    func,
+    func_args=None,
+    func_kwargs=None,
+    cluster_indexes=None,
+    skip_index=None,
+    fail_fast=True,
+):
+    """
+    Run function on multiple clusters in parallel. The function runs in a
+    thread per cluster with the config context of the cluster (see
+    config_safe_thread_pool_task), so config.ENV_DATA, config.RUN etc. and
+    the kubeconfig used by the oc commands are those of the cluster. The
+    function must not switch the config context.
+
+    Args:
+        func (function): function to be run
+        func_args (list): positional arguments of the function
+        func_kwargs (dict): keyword arguments of the function
+        cluster_indexes (list of int): indexes of the clusters to run the
+            function on, all the clusters in config.clusters by default
+        skip_index (int or list of int): indexes of the clusters to skip
+        fail_fast (bool): if True, raise the first exception raised by the
+            function without waiting for the other clusters. If False, wait
+            for all the clusters and raise MultiClusterTaskFailed with
+            the exceptions of all the failed clusters.
+
+    Note:
+        Python threads can't be stopped, so with fail_fast the calls which
+        are already running on the other clusters are not interrupted, they
+        keep running in the background until they return (e.g. until the
+        timeout of their TimeoutSampler) and their results are discarded.
+        Only the calls which didn't start yet are cancelled. Use
+        fail_fast=False when the function changes the clusters and the
+        caller must not continue before all the calls are finished.
+
+    Returns:
+        dict: cluster index -> return value of the function
+
+    Raises:
+        MultiClusterTaskFailed: if the function failed on any cluster and
+            fail_fast is False
+
+    """
+    func_args = func_args or []
+    func_kwargs = func_kwargs or {}
+    if cluster_indexes is None:
+        cluster_indexes = [
+            cluster.MULTICLUSTER["multicluster_index"] for cluster in config.clusters
+        ]
+    if not isinstance(skip_index, list):
+        skip_index = [skip_index]
+    cluster_indexes = [index for index in cluster_indexes if index not in skip_index]
+    if not cluster_indexes:
+        return {}
+    results = {}
+    errors = {}
+    executor = ThreadPoolExecutor(max_workers=len(cluster_indexes))
+    try:
+        futures = {
+            executor.submit(
+                config_safe_thread_pool_task, index, func, *func_args, **func_kwargs
+            ): index
+            for index in cluster_indexes
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as ex:
+                cluster_name = config.clusters[index].ENV_DATA.get("cluster_name")
+                log.error(
+                    f"{getattr(func, '__name__', func)} failed on cluster "
+                    f"{cluster_name}: {ex}"
+                )
+                if fail_fast:
+                    running = [
+                        config.clusters[futures[other]].ENV_DATA.get("cluster_name")
+                        for other in futures
+                        if other.running()
+                    ]
+                    if running:
+                        log.warning(
+                            f"Not waiting for {getattr(func, '__name__', func)} "
+                            f"which keeps running in the background on clusters "
+                            f"{running}"
+                        )
+                    raise
+                errors[index] = ex
+    finally:
+        # in fail fast mode, don't wait for the other clusters
+        executor.shutdown(wait=not fail_fast, cancel_futures=True)
+    if errors:
+        raise MultiClusterTaskFailed(errors, results)
+    return results
+
+
+def run_cmd_multicluster_parallel(
+    cmd,
+    secrets=None,
+    timeout=600,
+    ignore_error=False,
+    skip_index=None,
+    fail_fast=True,
+    **kwargs,
+):
+    """
+    Run command on multiple clusters in parallel, see run_func_multicluster.
+    Parallel variant of run_cmd_multicluster, it doesn't switch the config
+    context and its latency doesn't grow with the number of clusters.
+
+    Args:
+        cmd (str): command to be run
+        secrets (list): A list of secrets to be masked with asterisks
+        timeout (int): Timeout for the command, defaults to 600 seconds.
+        ignore_error (bool): True if ignore non zero return code and do not
+            raise the exception.
+        skip_index (list of int): List of indexes that needs to be skipped from executing the command
+        fail_fast (bool): if True, raise CommandFailed of the first failed
+            cluster without waiting for the others. If False, wait for all
+            the clusters and raise MultiClusterTaskFailed.
+
+    Raises:
+        CommandFailed: In case the command execution fails and fail_fast is True
+        MultiClusterTaskFailed: In case the command execution fails and
+            fail_fast is False
+
+    Returns:
+        list : of CompletedProcess objects as per cluster's index in config.clusters
+            i.e. [cluster1_completedprocess, None, cluster2_completedprocess]
+            if command execution skipped on a particular cluster then corresponding entry will have None
+
+    """
+    results = run_func_multicluster(
+        exec_cmd,
+        func_args=[cmd],
+        func_kwargs=dict(
+            secrets=secrets, timeout=timeout, ignore_error=ignore_error, **kwargs
+        ),
+        skip_index=skip_index,
+        fail_fast=fail_fast,
+    )
+    completed_process = [None] * len(config.clusters)
+    for index, result in results.items():
+        completed_process[index] = result
+    return completed_process
+
+
+def _oc_plugin_cache_key(env=None):
+    """
+    Build the key identifying the oc binary and PATH the plugins are looked
+    up for. When the oc binary is replaced (e.g. by a client upgrade), its
+    mtime/size changes and so does the key.
+
+    Args:
+        env (dict): environment of the oc command, os.environ if not provided
+
+    Returns:
+        tuple: cache key, or None if oc binary was not found in PATH
+
+    """
+    search_path = (env or os.environ).get("PATH", os.defpath)
+    oc_path = which("oc", path=search_path)
+    if not oc_path:
+        return None
+    oc_path = os.path.realpath(oc_path)
+    try:
+        oc_stat = os.stat(oc_path)
+    except OSError:
+        return None
+    return (search_path, oc_path, oc_stat.st_mtime_ns, oc_stat.st_size)
+
+
+def get_oc_plugins(env=None):
+    """
+    Get the lines of `oc plugin list` output. The output is discovered only
+    once per oc binary and PATH in the process and served from cache for
+    subsequent calls.
+
+    Args:
+        env (dict): environment of the oc command, os.environ if not provided
+
+    Returns:
+        list: lines of the `oc plugin list` output
+
+    """
+    key = _oc_plugin_cache_key(env)
+    with _oc_plugin_cache_lock:
+        _oc_plugin_cache_stats["lookups"] += 1
+        if key is not None and key in _oc_plugin_cache:
+            _oc_plugin_cache_stats["forks_saved"] += 1
+            return _oc_plugin_cache[key]
+    cp = subprocess.run(
+        shlex.split("oc plugin list"),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    plugins = cp.stdout.decode().splitlines()
+    with _oc_plugin_cache_lock:
+        _oc_plugin_cache_stats["forks"] += 1
+        if key is not None:
+            # drop entries of a replaced oc binary on the same PATH
+            for cached_key in list(_oc_plugin_cache):
+                if cached_key[:2] == key[:2]:
+                    del _oc_plugin_cache[cached_key]
+            _oc_plugin_cache[key] = plugins
+    return plugins
+
+
+def invalidate_oc_plugin_cache():
+    """
+    Drop all cached `oc plugin list` results, e.g. after installing a new
+    oc plugin in the middle of the run.
+    """
+    with _oc_plugin_cache_lock:
+        _oc_plugin_cache.clear()
+
+
+def get_oc_plugin_cache_stats():
+    """
+    Get statistics of the oc plugin discovery cache
+
+    Returns:
+        dict: number of lookups, forks of `oc plugin list` and forks saved
+
+    """
+    with _oc_plugin_cache_lock:
+        return dict(_oc_plugin_cache_stats)
+
+
 def exec_cmd(
     cmd,
     secrets=None,
@@ -662,19 +902,14 @@ def exec_cmd(
     ):
         kube_index = 1
         # check if we have an oc plugin in the command
-        plugin_list = "oc plugin list"
-        cp = subprocess.run(
-            shlex.split(plugin_list),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        plugins = get_oc_plugins(env=_env)
         subcmd = cmd[1].split("-")
         if len(subcmd) > 1:
             subcmd = "_".join(subcmd)
         if not isinstance(subcmd, str) and isinstance(subcmd, list):
             subcmd = str(subcmd[0])
 
-        for l in cp.stdout.decode().splitlines():
+        for l in plugins:
             if subcmd in l:
                 # If oc cmdline has plugin name then we need to push the
                 # --kubeconfig to next index
@@ -1447,6 +1682,54 @@ def delete_dir(dir_name):
         log.error(f"Failed to delete the directory {dir_name}. Error: {e.strerror}")
 
 
+class ExponentialBackoff(object):
+    """
+    Backoff strategy of TimeoutSampler: the delay before the next sample
+    starts at the sleep of the sampler and it's multiplied by factor after
+    each sample, up to max_delay. Random jitter spreads the samples of the
+    waits started at the same time.
+
+    Example::
+
+        sampler = TimeoutSampler(600, 1, func)
+        sampler.backoff = ExponentialBackoff(max_delay=30)
+
+    Args:
+        factor (float): multiplier of the delay after each sample
+        max_delay (float): the maximal delay in seconds, None for no limit
+        jitter (float): the maximal part of the delay randomly added to or
+            subtracted from it, e.g. 0.1 for +-10%
+
+    """
+
+    def __init__(self, factor=2.0, max_delay=None, jitter=0.1):
+        if factor < 1:
+            raise ValueError("backoff factor should be at least 1")
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def __call__(self, attempt, sleep):
+        """
+        Get the delay before the next sample
+
+        Args:
+            attempt (int): number of the delays before this one
+            sleep (float): the initial delay (sleep of the sampler)
+
+        Returns:
+            float: the delay in seconds
+
+        """
+        # limit the exponent, the delay is capped long before anyway
+        delay = sleep * self.factor ** min(attempt, 64)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return round(delay, 2)
+
+
 class TimeoutSampler(object):
     """
     Samples the function output.
@@ -1457,7 +1740,14 @@ class TimeoutSampler(object):
 
     Yielding the output allows you to handle every value as you wish.
 
-    Feel free to set the instance variables.
+    Feel free to set the instance variables, e.g. `backoff` to a callable
+    returning the delay before the next sample (see ExponentialBackoff)
+    instead of the fixed `sleep`, or `wakeup_event` to threading.Event which
+    is set (see wake_up) when the next sample should be taken immediately,
+    e.g. when a watch of the resource reported its change.
+
+    The counts of the samples and time spent in func and sleeping are
+    returned by stats.
 
 
     Args:
@@ -1482,6 +1772,15 @@ class TimeoutSampler(object):
         # Timestamps of the first and most recent samples
         self.start_time = None
         self.last_sample_time = None
+        # Callable (attempt, sleep) -> delay, None for the fixed sleep
+        self.backoff = None
+        # threading.Event interrupting the sleep when set
+        self.wakeup_event = None
+        # Statistics of the sampling
+        self.samples = 0
+        self.wakeups = 0
+        self.func_time = 0.0
+        self.sleep_time = 0.0
         # The exception to raise
         self.timeout_exc_cls = TimeoutExpiredError
         # Arguments that will be passed to the exception
@@ -1513,15 +1812,76 @@ class TimeoutSampler(object):
             self.last_sample_time = time.time()
             if self.timeout <= (self.last_sample_time - self.start_time):
                 raise self.timeout_exc_cls(*self.timeout_exc_args)
+            self.samples += 1
             try:
-                yield self.func(*self.func_args, **self.func_kwargs)
+                value = self.func(*self.func_args, **self.func_kwargs)
             except Exception as ex:
+                self.func_time += time.time() - self.last_sample_time
                 msg = f"Exception raised during iteration: {ex}"
                 log.exception(msg)
+            else:
+                self.func_time += time.time() - self.last_sample_time
+                yield value
             if self.timeout <= (time.time() - self.start_time):
                 raise self.timeout_exc_cls(*self.timeout_exc_args)
-            log.info("Going to sleep for %d seconds before next iteration", self.sleep)
-            time.sleep(self.sleep)
+            self._wait(self._next_delay())
+
+    def _next_delay(self):
+        """
+        Get the delay before the next sample
+
+        Returns:
+            float: the delay in seconds
+
+        """
+        if self.backoff is None:
+            return self.sleep
+        return self.backoff(self.samples - 1, self.sleep)
+
+    def _wait(self, delay):
+        """
+        Sleep before the next sample, until the delay passes or the sampler
+        is woken up
+
+        Args:
+            delay (float): the delay in seconds
+
+        """
+        log.info("Going to sleep for %s seconds before next iteration", delay)
+        start_time = time.time()
+        if self.wakeup_event is None:
+            time.sleep(delay)
+        elif self.wakeup_event.wait(delay):
+            self.wakeup_event.clear()
+            self.wakeups += 1
+            log.info("Woken up before next iteration")
+        self.sleep_time += time.time() - start_time
+
+    def wake_up(self):
+        """
+        Interrupt the sleep of the sampler so that the next sample is taken
+        immediately. It has no effect if wakeup_event isn't set.
+        """
+        if self.wakeup_event is not None:
+            self.wakeup_event.set()
+
+    def stats(self):
+        """
+        Statistics of the sampling, for profiling of the waits
+
+        Returns:
+            dict: number of the samples and the wake ups, time in seconds
+                spent in func, sleeping and in total
+
+        """
+        total_time = time.time() - self.start_time if self.start_time else 0.0
+        return {
+            "samples": self.samples,
+            "wakeups": self.wakeups,
+            "func_time": self.func_time,
+            "sleep_time": self.sleep_time,
+            "total_time": total_time,
+        }
 
     def wait_for_func_value(self, value):
         """
@@ -1580,14 +1940,28 @@ class TimeoutIterator(TimeoutSampler):
 
         t1 = TimeoutIterator(timeout=60, sleep=5, func=foo, func_args=[bar])
         t2 = TimeoutIterator(3600, sleep=10, func=foo, func_args=[bar])
+        t3 = TimeoutIterator(
+            3600, sleep=1, func=foo, backoff=ExponentialBackoff(max_delay=60)
+        )
     """
 
-    def __init__(self, timeout, sleep, func, func_args=None, func_kwargs=None):
+    def __init__(
+        self,
+        timeout,
+        sleep,
+        func,
+        func_args=None,
+        func_kwargs=None,
+        backoff=None,
+        wakeup_event=None,
+    ):
         if func_args is None:
             func_args = []
         if func_kwargs is None:
             func_kwargs = {}
         super().__init__(timeout, sleep, func, *func_args, **func_kwargs)
+        self.backoff = backoff
+        self.wakeup_event = wakeup_event
 
 
 def get_random_str(size=13):
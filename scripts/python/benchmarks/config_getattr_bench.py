@@ -0,0 +1,76 @@
+"""
+Microbenchmark of attribute lookups on the global config object
+(config.ENV_DATA, config.RUN, ...) from 1, 8 and 32 threads.
+
+Every thread runs in its own config context as ConfigSafeThread does. The
+"locked" numbers take config_lock around every lookup, as
+MultiClusterConfig.__getattr__ used to do, to compare against the lock-free
+read path.
+
+Usage:
+    python scripts/python/benchmarks/config_getattr_bench.py [--lookups N]
+"""
+
+import argparse
+import logging
+import threading
+import time
+
+from ocs_ci.framework import ConfigSafeThread, config, config_lock
+
+
+def lookup(count):
+    for _ in range(count):
+        config.ENV_DATA
+        config.RUN
+
+
+def locked_lookup(count):
+    for _ in range(count):
+        with config_lock:
+            config.ENV_DATA
+        with config_lock:
+            config.RUN
+
+
+def bench(target, threads, lookups):
+    """
+    Run the lookups split between the given number of threads
+
+    Returns:
+        float: lookups per second in total
+
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def run():
+        barrier.wait()
+        target(lookups // threads // 2)
+
+    workers = [ConfigSafeThread(0, target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return lookups / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lookups", type=int, default=640000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    for threads in (1, 8, 32):
+        lock_free_rate = bench(lookup, threads, args.lookups)
+        locked_rate = bench(locked_lookup, threads, args.lookups)
+        print(
+            f"{threads:2d} threads: lock-free {lock_free_rate:12.0f} lookups/s, "
+            f"locked {locked_rate:12.0f} lookups/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Microbenchmark of the CSI log time measurements of bulk of PVCs.
+
+The fixture is a synthetic csi-rbdplugin log of the given number of PVCs,
+each with the GRPC call, request, response and 'generated volume id' lines
+of its creation and deletion, surrounded by the given number of unrelated
+lines. The create / delete times of all the PVCs are looked up by rescanning
+all the lines per PVC (as csi_bulk_pvc_time_measure did before) and by
+ocs_ci.helpers.performance_lib.CSILogIndex.
+
+Usage:
+    python scripts/python/benchmarks/csi_log_index_bench.py [--pvcs N] [--noise N]
+"""
+
+import argparse
+import time
+
+from ocs_ci.helpers.performance_lib import CSILogIndex, string_to_time
+
+
+def klog(seconds, message):
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return (
+        f"I0215 {10 + int(hours):02d}:{int(minutes):02d}:{seconds:09.6f}       1 "
+        f"utils.go:198] {message}"
+    )
+
+
+def build_log(pvcs, noise):
+    """
+    Build the lines of the log
+
+    Returns:
+        tuple: list of PV names, list of log lines
+
+    """
+    pv_names = [f"pvc-{i:08d}-1111-2222-3333-444455556666" for i in range(pvcs)]
+    lines = []
+    for i, pv_name in enumerate(pv_names):
+        volume_id = f"0001-0011-openshift-storage-0000000000000001-{i:08d}"
+        lines += [
+            klog(
+                i,
+                f"ID: {i} Req-ID: {pv_name} GRPC call: /csi.v1.Controller/CreateVolume",
+            ),
+            klog(i, f'ID: {i} Req-ID: {pv_name} GRPC request: {{"name":"{pv_name}"}}'),
+            klog(
+                i + 0.5,
+                f"ID: {i} Req-ID: {pv_name} generated volume id ({volume_id}) and "
+                f"image name (csi-vol-{i:08d}) for request name ({pv_name})",
+            ),
+            klog(i + 1, f"ID: {i} Req-ID: {pv_name} GRPC response: {{}}"),
+        ]
+        lines += [
+            klog(i + 1, f"ID: {i} Req-ID: {pv_name} rbd: omap update in progress {n}")
+            for n in range(noise)
+        ]
+    for i, pv_name in enumerate(pv_names):
+        volume_id = f"0001-0011-openshift-storage-0000000000000001-{i:08d}"
+        delete_id = pvcs + i
+        lines += [
+            klog(
+                pvcs + i,
+                f"ID: {delete_id} Req-ID: {volume_id} GRPC call: /csi.v1.Controller/DeleteVolume",
+            ),
+            klog(
+                pvcs + i + 1, f"ID: {delete_id} Req-ID: {volume_id} GRPC response: {{}}"
+            ),
+        ]
+    return pv_names, lines
+
+
+def rescan_times(lines, pv_names, operation):
+    """
+    The times of the PVCs by rescanning all the lines per PVC
+    """
+    times = []
+    for pv_name in pv_names:
+        st = et = None
+        for line in lines:
+            if (
+                operation == "delete"
+                and "generated volume id" in line.lower()
+                and pv_name in line
+            ):
+                pv_name = line.split("(")[1].split(")")[0]
+            if f"Req-ID: {pv_name} GRPC call:" in line:
+                st = string_to_time(line.split(" ")[1])
+            if f"Req-ID: {pv_name} GRPC response:" in line:
+                et = string_to_time(line.split(" ")[1])
+        times.append((et - st).total_seconds())
+    return times
+
+
+def index_times(lines, pv_names, operation):
+    """
+    The times of the PVCs looked up in the index of the lines
+    """
+    log_index = CSILogIndex()
+    log_index.add_lines(lines)
+    times = []
+    for pv_name in pv_names:
+        if operation == "delete":
+            pv_name = log_index.get_volume_id(pv_name) or pv_name
+        st, et = (
+            string_to_time(line.split(" ")[1])
+            for line in log_index.get_grpc_lines(pv_name)
+        )
+        times.append((et - st).total_seconds())
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pvcs", type=int, default=1000)
+    parser.add_argument("--noise", type=int, default=20)
+    args = parser.parse_args()
+
+    pv_names, lines = build_log(args.pvcs, args.noise)
+    size = sum(len(line) + 1 for line in lines) / 1024 / 1024
+    print(f"{args.pvcs} PVCs, {len(lines)} lines ({size:.1f} MiB)")
+    for operation in ("create", "delete"):
+        results = {}
+        for name, func in (("rescan", rescan_times), ("index", index_times)):
+            start = time.perf_counter()
+            results[name] = func(lines, pv_names, operation)
+            print(f"{operation} {name:6s}: {time.perf_counter() - start:8.2f} s")
+        assert results["rescan"] == results["index"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Microbenchmark of OCP.get served by the oc binary vs. the in-process
+Kubernetes API backend (config.RUN["oc_backend"] = "api").
+
+Both paths talk to a local fake API server, so the numbers show the client
+side overhead only (process startup, kubeconfig parsing, connection setup).
+The oc path is skipped when the oc binary is not available in PATH.
+
+Usage:
+    python scripts/python/benchmarks/kube_api_backend_bench.py [--calls N] [--pods N]
+"""
+
+import argparse
+import logging
+import shutil
+import tempfile
+import time
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import kube_api_backend
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.tests.fake_kube_api import FakeKubeAPIServer, make_pod
+
+
+def bench(ocp, calls):
+    """
+    Run OCP.get list of pods given number of times
+
+    Returns:
+        float: calls per second
+
+    """
+    start = time.perf_counter()
+    for _ in range(calls):
+        ocp.get()
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--pods", type=int, default=50)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    config.RUN["resource_checker"] = False
+
+    pods = [make_pod(f"pod-{i}", "bench") for i in range(args.pods)]
+    with FakeKubeAPIServer(pods) as server, tempfile.TemporaryDirectory() as tmp:
+        kubeconfig = server.write_kubeconfig(f"{tmp}/kubeconfig")
+        ocp = OCP(kind="Pod", namespace="bench", cluster_kubeconfig=kubeconfig)
+
+        config.RUN["oc_backend"] = kube_api_backend.API_BACKEND
+        ocp.get()  # discovery is done once per process, don't measure it
+        api_rate = bench(ocp, args.calls)
+        print(
+            f"api backend: {api_rate:10.1f} calls/s "
+            f"({server.connections} TCP connections in total)"
+        )
+
+        config.RUN["oc_backend"] = kube_api_backend.OC_BACKEND
+        if shutil.which("oc"):
+            config.RUN["kubeconfig"] = kubeconfig
+            oc_calls = max(args.calls // 10, 1)
+            oc_rate = bench(ocp, oc_calls)
+            print(f"oc binary:   {oc_rate:10.1f} calls/s")
+            print(f"speedup:     {api_rate / oc_rate:10.1f}x")
+        else:
+            print("oc binary:   skipped, oc not found in PATH")
+    kube_api_backend.reset_backends()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Microbenchmark of construction of PVC and pod resource dicts from the yaml
+templates.
+
+Each resource is built the way helpers.create_pvc and helpers.create_pod do
+it: the template is loaded by templating.load_yaml and its copy is filled
+with the name, namespace and claim of the resource. Also FIO params are
+loaded per pod as Pod.run_io does. The templates are parsed on every load
+(as load_yaml did before) and served from the parse cache of load_yaml.
+
+Usage:
+    python scripts/python/benchmarks/load_yaml_bench.py [--resources N]
+"""
+
+import argparse
+import time
+
+import yaml
+
+from ocs_ci.ocs import constants
+from ocs_ci.utility import templating
+
+
+def parse_yaml(file):
+    """
+    Load the yaml file without the cache
+    """
+    with open(file, "r") as fs:
+        return yaml.safe_load(fs.read())
+
+
+def build_resources(load, count):
+    """
+    Build the dicts of the PVCs and pods
+
+    Returns:
+        list: (pvc, pod, io_params) dicts
+
+    """
+    resources = []
+    for i in range(count):
+        pvc = load(constants.CSI_RBD_PVC_YAML)
+        pvc["metadata"]["name"] = f"pvc-{i}"
+        pvc["metadata"]["namespace"] = "namespace-bench"
+        pod = load(constants.CSI_RBD_POD_YAML)
+        pod["metadata"]["name"] = f"pod-{i}"
+        pod["metadata"]["namespace"] = "namespace-bench"
+        pod["spec"]["volumes"][0]["persistentVolumeClaim"]["claimName"] = f"pvc-{i}"
+        io_params = load(constants.FIO_IO_RW_PARAMS_YAML)
+        io_params["filename"] = f"pod-{i}"
+        resources.append((pvc, pod, io_params))
+    return resources
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resources", type=int, default=2000)
+    args = parser.parse_args()
+
+    templating.clear_load_yaml_cache()
+    results = {}
+    for name, load in (("parse", parse_yaml), ("cached", templating.load_yaml)):
+        start = time.perf_counter()
+        results[name] = build_resources(load, args.resources)
+        duration = time.perf_counter() - start
+        print(
+            f"{name:6s}: {duration:6.2f} s, "
+            f"{args.resources / duration:8.0f} resources/s"
+        )
+    assert results["parse"] == results["cached"]
+    print(f"load_yaml cache: {templating.load_yaml_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
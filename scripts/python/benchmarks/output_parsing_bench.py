@@ -0,0 +1,156 @@
+"""
+Microbenchmark of parsing large oc and ceph outputs.
+
+The fixture is a list of pods shaped as recorded from 'oc get pods -o yaml'
+and '-o json' of an ODF cluster, with the given number of pods. It's parsed
+by yaml.safe_load (pure Python loader, used for all the outputs before) and
+by ocs_ci.utility.parsing (JSON decoder for JSON output, CSafeLoader for
+YAML output).
+
+Usage:
+    python scripts/python/benchmarks/output_parsing_bench.py [--pods N] [--repeat N]
+"""
+
+import argparse
+import copy
+import json
+import time
+
+import yaml
+
+from ocs_ci.utility import parsing
+
+POD = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "annotations": {
+            "k8s.ovn.org/pod-networks": '{"default":{"ip_addresses":["10.128.2.20/23"]}}',
+            "openshift.io/scc": "rook-ceph",
+        },
+        "creationTimestamp": "2024-05-01T10:00:00Z",
+        "generateName": "rook-ceph-osd-0-5d8b7c9f6d-",
+        "labels": {
+            "app": "rook-ceph-osd",
+            "ceph-osd-id": "0",
+            "ceph_daemon_type": "osd",
+            "pod-template-hash": "5d8b7c9f6d",
+            "rook_cluster": "openshift-storage",
+        },
+        "name": "rook-ceph-osd-0-5d8b7c9f6d-abcde",
+        "namespace": "openshift-storage",
+        "ownerReferences": [
+            {
+                "apiVersion": "apps/v1",
+                "blockOwnerDeletion": True,
+                "controller": True,
+                "kind": "ReplicaSet",
+                "name": "rook-ceph-osd-0-5d8b7c9f6d",
+                "uid": "0b8f1f9e-5d7c-4f0e-9d7a-3c1f4e2b9a10",
+            }
+        ],
+        "resourceVersion": "123456",
+        "uid": "6e4b2a1c-8f3d-4c5b-a9e7-1d2c3b4a5f60",
+    },
+    "spec": {
+        "containers": [
+            {
+                "args": ["--foreground", "--id", "0", "--fsid", "f00"],
+                "command": ["ceph-osd"],
+                "env": [
+                    {"name": f"ROOK_ENV_{i}", "value": f"value-{i}"} for i in range(20)
+                ],
+                "image": "quay.io/rhceph-dev/rhceph@sha256:0123456789abcdef",
+                "name": "osd",
+                "resources": {
+                    "limits": {"cpu": "2", "memory": "5Gi"},
+                    "requests": {"cpu": "2", "memory": "5Gi"},
+                },
+                "volumeMounts": [
+                    {"mountPath": f"/var/lib/ceph/{i}", "name": f"vol-{i}"}
+                    for i in range(10)
+                ],
+            }
+        ],
+        "nodeName": "compute-0",
+        "volumes": [
+            {"name": f"vol-{i}", "hostPath": {"path": f"/var/lib/rook/{i}"}}
+            for i in range(10)
+        ],
+    },
+    "status": {
+        "conditions": [
+            {
+                "lastTransitionTime": "2024-05-01T10:00:10Z",
+                "status": "True",
+                "type": condition,
+            }
+            for condition in ("Initialized", "Ready", "ContainersReady", "PodScheduled")
+        ],
+        "containerStatuses": [
+            {
+                "name": "osd",
+                "ready": True,
+                "restartCount": 0,
+                "started": True,
+                "state": {"running": {"startedAt": "2024-05-01T10:00:05Z"}},
+            }
+        ],
+        "hostIP": "10.1.160.10",
+        "phase": "Running",
+        "podIP": "10.128.2.20",
+        "qosClass": "Guaranteed",
+    },
+}
+
+
+def build_fixture(pods):
+    """
+    Build the list of pods
+
+    Returns:
+        dict: List of the pods
+
+    """
+    items = []
+    for i in range(pods):
+        pod = copy.deepcopy(POD)
+        pod["metadata"]["name"] = f"rook-ceph-osd-{i}-5d8b7c9f6d-abcde"
+        items.append(pod)
+    return {"apiVersion": "v1", "items": items, "kind": "List", "metadata": {}}
+
+
+def bench(func, data, repeat):
+    """
+    Returns:
+        float: average time of the parsing in milliseconds
+
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(data)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pods", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fixture = build_fixture(args.pods)
+    outputs = {
+        "oc -o yaml": yaml.safe_dump(fixture),
+        "oc -o json": json.dumps(fixture, indent=4),
+    }
+    for name, output in outputs.items():
+        assert parsing.load_output(output) == fixture
+        print(
+            f"{name} ({len(output) / 1024 / 1024:.1f} MiB): "
+            f"yaml.safe_load {bench(yaml.safe_load, output, args.repeat):9.1f} ms, "
+            f"parsing.load_output {bench(parsing.load_output, output, args.repeat):9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
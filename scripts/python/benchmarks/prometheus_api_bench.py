@@ -0,0 +1,82 @@
+"""
+Microbenchmark of Prometheus instant queries: one connection per query (as
+plain requests.get does), the pooled session of PrometheusAPI and concurrent
+PrometheusAPI.query_many.
+
+Queries are served by a local fake Prometheus server with the given latency,
+so the numbers show the client side overhead only. Real Prometheus routes
+are served over TLS, where the saved connection setup is more expensive.
+
+Usage:
+    python scripts/python/benchmarks/prometheus_api_bench.py [--queries N] [--latency S]
+"""
+
+import argparse
+import logging
+import threading
+import time
+
+import requests
+
+from ocs_ci.framework import config
+from ocs_ci.utility import prometheus
+from ocs_ci.utility.prometheus import PrometheusAPI
+from ocs_ci.utility.tests.fake_prometheus import FakePrometheusServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    config.ENV_DATA.update({"platform": "aws", "deployment_type": "ipi"})
+    queries = [f"metric_{i}" for i in range(args.queries)]
+
+    with FakePrometheusServer(delay=args.latency) as server:
+
+        def refresh_connection(api):
+            api._token = server.token
+            api._endpoint = server.url
+
+        PrometheusAPI.refresh_connection = refresh_connection
+        api = PrometheusAPI(
+            user="kubeadmin", password="password", threading_lock=threading.RLock()
+        )
+
+        start = time.perf_counter()
+        for query in queries:
+            requests.get(
+                f"{server.url}/api/v1/query",
+                headers={"Authorization": f"Bearer {server.token}"},
+                params={"query": query},
+            ).json()
+        elapsed = time.perf_counter() - start
+        print(
+            f"requests.get per query: {args.queries / elapsed:8.1f} queries/s "
+            f"({server.connections} TCP connections)"
+        )
+
+        connections = server.connections
+        start = time.perf_counter()
+        for query in queries:
+            api.query(query, log_debug=True)
+        elapsed = time.perf_counter() - start
+        print(
+            f"pooled session:         {args.queries / elapsed:8.1f} queries/s "
+            f"({server.connections - connections} TCP connections)"
+        )
+
+        connections = server.connections
+        start = time.perf_counter()
+        api.query_many(queries)
+        elapsed = time.perf_counter() - start
+        print(
+            f"query_many:             {args.queries / elapsed:8.1f} queries/s "
+            f"({server.connections - connections} TCP connections)"
+        )
+    prometheus.close_session()
+
+
+if __name__ == "__main__":
+    main()
@@ -124,6 +124,7 @@ from ocs_ci.ocs.resources.pod import (
     delete_deployment_pods,
     cal_md5sum,
     wait_for_pods_to_be_in_statuses,
+    invalidate_ceph_tools_pod_cache,
 )
 from ocs_ci.ocs.resources.pvc import (
     PVC,
@@ -2990,7 +2991,7 @@ def test_directory_setup_fixture(request, awscli_pod_session):
 
 
 @pytest.fixture()
-def nodes():
+def nodes(request):
     """
     Return an instance of the relevant platform nodes class
     (e.g. AWSNodes, VMWareNodes) to be later used in the test
@@ -2998,13 +2999,15 @@ def nodes():
     detach/attach volume, etc.
 
     """
+    # the ceph tool box pod might be recreated by the node operations
+    request.addfinalizer(invalidate_ceph_tools_pod_cache)
     factory = platform_nodes.PlatformNodesFactory()
     nodes = factory.get_nodes_platform()
     return nodes
 
 
 @pytest.fixture()
-def nodes_multicluster():
+def nodes_multicluster(request):
     """
     Return a list of instances of the relevant platform nodes class
     (e.g. AWSNodes, VMWareNodes) to be later used in the test
@@ -3012,6 +3015,7 @@ def nodes_multicluster():
     detach/attach volume, etc. Useful in multicluster scenarios.
 
     """
+    request.addfinalizer(invalidate_ceph_tools_pod_cache)
     factory = platform_nodes.PlatformNodesFactory()
     nodes_multicluster = []
     for cluster in range(ocsci_config.nclusters):
@@ -4177,6 +4181,7 @@ def node_drain_teardown(request):
         change them back to 'Ready' state by marking them as schedulable
 
         """
+        invalidate_ceph_tools_pod_cache()
         scheduling_disabled_nodes = [
             n.name
             for n in get_node_objs()
@@ -4203,6 +4208,7 @@ def node_restart_teardown(request, nodes_multicluster, nodes):
         cluster_node_objs.append(get_node_objs())
 
     def finalizer():
+        invalidate_ceph_tools_pod_cache()
         for index in range(ocsci_config.nclusters):
             ocsci_config.switch_ctx(index)
             # Start the powered off nodes
@@ -9580,12 +9586,13 @@ def pytest_sessionfinish(session, exitstatus):
     """
     Do some session finish teardown functionality
     """
-    from ocs_ci.ocs import cluster_load
+    from ocs_ci.ocs import cluster_load, workload
 
     try:
         cluster_load.finish_cluster_load()
     except Exception:
         log.exception("During finishing the Cluster load an exception was hit!")
+    workload.shutdown_scheduler(wait=False)
 
 
 @pytest.fixture()